@@ -17,7 +17,6 @@
 
 """ API """
 
-import time
 import flask  # pylint: disable=E0401,W0611
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
@@ -34,13 +33,7 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         """ Process GET """
         result = []
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
-            #
-            if time.time() - data["timestamp"] > 60:  # 4 announces missing (for 15s interval)
-                self.module.remote_runtimes.pop(pylon_id, None)
-                continue
-            #
+        for pylon_id, _ in self.module.remote_runtimes.snapshot():
             result.append({"pylon_id": pylon_id})
         #
         return {
@@ -69,10 +62,11 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         if not pylon_id:
             return {"ok": True, "logs": ""}
         #
-        if pylon_id not in self.module.remote_runtimes:
+        data = self.module.remote_runtimes.get(pylon_id, None)
+        #
+        if data is None:  # Unknown or pruned concurrently
             return {"ok": True, "logs": ""}
         #
-        data = self.module.remote_runtimes[pylon_id]
         return {"ok": True, "logs": "\n".join(data.get("logs", []))}
 
 
@@ -32,11 +32,15 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     @auth.decorators.check_api(["runtime.plugins"])
     def get(self, target_pylon_id):
         """ Process GET """
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
+        for pylon_id in sorted(self.module.remote_runtimes):
             if pylon_id != target_pylon_id:
                 continue
             #
-            data = self.module.remote_runtimes[pylon_id]
+            data = self.module.remote_runtimes.get(pylon_id, None)
+            #
+            if data is None:  # Pruned concurrently
+                continue
+            #
             pylon_settings = data.get("pylon_settings", {})
             #
             if flask.request.args.get("raw", "false") == "true":
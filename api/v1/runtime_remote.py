@@ -38,13 +38,7 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         """ Process GET """
         result = []
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
-            #
-            if time.time() - data["timestamp"] > 60:  # 4 announces missing (for 15s interval)
-                self.module.remote_runtimes.pop(pylon_id, None)
-                continue
-            #
+        for pylon_id, data in self.module.remote_runtimes.snapshot():
             runtime_info = data["runtime_info"]
             #
             for plugin in sorted(runtime_info, key=lambda x: x["name"]):
@@ -106,11 +100,14 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 file_obj = io.BytesIO()
                 #
                 with zipfile.ZipFile(file_obj, mode="w", compression=zipfile.ZIP_DEFLATED) as zfile:
-                    for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
+                    for pylon_id in sorted(self.module.remote_runtimes):
                         if pylon_id not in targets:
                             continue
                         #
-                        data = self.module.remote_runtimes[pylon_id]
+                        data = self.module.remote_runtimes.get(pylon_id, None)
+                        #
+                        if data is None:  # Pruned concurrently
+                            continue
                         #
                         try:
                             pylon_settings = data["pylon_settings"]["tunable"]
@@ -37,11 +37,15 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         #
         target_pylon_id, target_plugin = plugin_id.split(":", 1)
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
+        for pylon_id in sorted(self.module.remote_runtimes):
             if pylon_id != target_pylon_id:
                 continue
             #
-            data = self.module.remote_runtimes[pylon_id]
+            data = self.module.remote_runtimes.get(pylon_id, None)
+            #
+            if data is None:  # Pruned concurrently
+                continue
+            #
             runtime_info = data["runtime_info"]
             #
             for plugin in sorted(runtime_info, key=lambda x: x["name"]):
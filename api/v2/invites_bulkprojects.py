@@ -17,6 +17,8 @@
 
 """ API """
 
+import time
+
 import flask  # pylint: disable=E0401,W0611
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
@@ -29,7 +31,7 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     """ API """
 
     @auth.decorators.check_api(["invites.bulkprojects"])
-    def post(self):  # pylint: disable=R0912,R0914,R0915
+    def post(self):  # pylint: disable=R0914
         """ Process POST """
         data = flask.request.get_json()
         #
@@ -42,20 +44,56 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         if "projects" not in data:
             return {"error": "projects not set"}, 400
         #
-        logs = []
+        start_ts = time.time()
         #
         user_id = int(data["user_id"])
-        new_roles = [item.strip() for item in data["roles"].split(",")]
+        new_roles = [item.strip() for item in data["roles"].split(",") if item.strip()]
+        dry_run = bool(data.get("dry_run", False))
+        project_names = {int(project["id"]): project.get("name") for project in data["projects"]}
+        #
+        result = self.module.update_roles_for_users_in_projects(
+            list(project_names), [user_id], new_roles, dry_run=dry_run, details=True,
+        )
         #
-        for project in data["projects"]:
-            project_id = project["id"]
-            project_name = project["name"]
+        duration = time.time() - start_ts
+        #
+        logs = []
+        projects = []
+        #
+        for project_id, project_name in project_names.items():
+            outcome = result[project_id]
+            change = outcome["users"].get(user_id, {"added": [], "removed": []})
+            #
+            # Missing roles are reported next to the status: a project can be both
+            status = "changed" if change["added"] or change["removed"] else "unchanged"
             #
-            self.module.admin_update_roles_for_user(project_id, user_id, new_roles)
-            logs.append(f"Added user {user_id} to {project_id} ({project_name}) as {new_roles}")
+            projects.append({
+                "id": project_id,
+                "name": project_name,
+                "status": status,
+                "added": change["added"],
+                "removed": change["removed"],
+                "missing_roles": outcome["missing_roles"],
+            })
+            #
+            logs.append(
+                f"{project_id} ({project_name}): {status}"
+                f", +{change['added']} -{change['removed']}"
+                + (f", roles not found: {outcome['missing_roles']}" if outcome["missing_roles"] else "")
+            )
+        #
+        logs.append(
+            f"{'Dry run: ' if dry_run else ''}user {user_id}, {len(projects)} projects, "
+            f"{sum(1 for item in projects if item['status'] == 'changed')} changed, "
+            f"{sum(1 for item in projects if item['missing_roles'])} with missing roles "
+            f"in {duration:.3f}s"
+        )
         #
         return {
             "ok": True,
+            "dry_run": dry_run,
+            "duration": duration,
+            "projects": projects,
             "logs": "\n".join(logs),
         }
 
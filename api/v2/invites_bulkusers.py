@@ -29,8 +29,8 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     """ API """
 
     @auth.decorators.check_api(["invites.bulkusers"])
-    def post(self):  # pylint: disable=R0912,R0914,R0915
-        """ Process POST """
+    def post(self):
+        """ Process POST: start invite_bulk_users task """
         data = flask.request.get_json()
         #
         if "project_id" not in data:
@@ -39,27 +39,38 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         if "roles" not in data:
             return {"error": "roles not set"}, 400
         #
-        logs = []
+        roles = [item.strip() for item in data["roles"].split(",") if item.strip()]
         #
-        project_id = int(data["project_id"])
-        new_roles = [item.strip() for item in data["roles"].split(",")]
+        if not roles:
+            return {"error": "roles not set"}, 400
+        #
+        task_kwargs = {
+            "project_id": int(data["project_id"]),
+            "roles": roles,
+            "dry_run": bool(data.get("dry_run", False)),
+            "_user_id": flask.g.auth.id,
+        }
+        #
+        if data.get("chunk_size"):
+            task_kwargs["chunk_size"] = int(data["chunk_size"])
+        #
+        task_id = self.module.task_node.start_task(
+            "invite_bulk_users",
+            kwargs=task_kwargs,
+            pool="admin",
+            meta={
+                "task": "invite_bulk_users",
+                "project_id": task_kwargs["project_id"],
+                "dry_run": task_kwargs["dry_run"],
+            },
+        )
         #
-        for user in auth.list_users():
-            log.debug("User: %s", user)
-            #
-            user_id = user["id"]
-            user_name = user["name"]
-            #
-            if user_name is not None and user_name.startswith(":system:project:"):
-                logs.append(f"Skipping user {user_id} ({user_name})")
-                continue
-            #
-            self.module.admin_update_roles_for_user(project_id, user_id, new_roles)
-            logs.append(f"Added user {user_id} ({user_name}) to {project_id} as {new_roles}")
+        if task_id is None:
+            return {"ok": False, "error": "failed to start task"}, 500
         #
         return {
             "ok": True,
-            "logs": "\n".join(logs),
+            "task_id": task_id,
         }
 
 
@@ -18,84 +18,52 @@
 """ API """
 
 import flask  # pylint: disable=E0401,W0611
-import psycopg2  # pylint: disable=E0401,W0611
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
 
 from tools import auth  # pylint: disable=E0401
 from tools import api_tools  # pylint: disable=E0401
-from tools import context  # pylint: disable=E0401
-from tools import constants as c  # pylint: disable=E0401
 
 
 class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     """ API """
 
     @auth.decorators.check_api(["migration.db"])
-    def post(self):  # pylint: disable=R0912,R0914
-        """ Process POST """
+    def post(self):
+        """ Process POST: start migration_db admin task, logs are streamed to task room """
         data = flask.request.get_json()
         #
         sqls = data.get("sqls", "").strip()
-        exceptions = data.get("exceptions", "").strip()
+        if not sqls:
+            return {"ok": False, "error": "No SQLs set"}, 400
         #
-        logs = []
-        #
-        cmds = sqls.splitlines()
-        except_pids = set()
-        handled_exceptions = []
-        #
-        if not exceptions:
-            handled_exceptions.append(psycopg2.errors.InvalidSchemaName)
-        else:
-            for item in exceptions.split(","):
-                handled_exceptions.append(getattr(psycopg2.errors, item.strip()))
+        try:
+            user_id = flask.g.auth.id
+        except Exception:  # pylint: disable=W0703
+            user_id = None
         #
-        def get_projects(connection):
-            with connection.cursor() as cur:
-                cur.execute(f'select id from {c.POSTGRES_SCHEMA}."project";')
-                result = cur.fetchall()
-                return set(i[0] for i in result)
+        task_id = self.module.task_node.start_task(
+            "migration_db",
+            kwargs={
+                "sqls": sqls,
+                "exceptions": data.get("exceptions", "").strip(),
+                "workers": data.get("workers", None),
+                "resume": bool(data.get("resume", False)),
+                "checkpoint": data.get("checkpoint", None),
+                "_user_id": user_id,
+            },
+            pool="admin",
+            meta={
+                "task": "migration_db",
+            },
+        )
         #
-        connection = context.db.engine.raw_connection()
-        try:
-            from tools import project_constants as pc  # pylint: disable=E0401,C0415
-            #
-            project_ids = get_projects(connection)
-            final_project_ids = set(project_ids).difference(set(except_pids))
-            #
-            with connection.cursor() as cur:
-                for project_id in final_project_ids:
-                    pid = pc["PROJECT_SCHEMA_TEMPLATE"].format(project_id)
-                    #
-                    logs.append(f"Processing project {project_id}: {pid}")
-                    #
-                    for cmd in cmds:
-                        exec_cmd = cmd.format(pid=pid)
-                        try:
-                            cur.execute(exec_cmd)
-                            connection.commit()
-                            #
-                            logs.append(f"\t{exec_cmd}")
-                        except tuple(handled_exceptions) as exc:
-                            connection.rollback()
-                            #
-                            logs.append(f"\t{exec_cmd}\t\t-FAIL(handled)-{str(exc).strip()}")
-                        except Exception as exc:
-                            log.error(f"Unhandled exception: {exc}")
-        except:  # pylint: disable=W0702
-            log.exception("Got exception")
-            #
-            return {
-                "ok": False,
-                "logs": "\n".join(logs),
-            }
-        finally:
-            connection.close()
+        if task_id is None:
+            return {"ok": False, "error": "Failed to start task"}
         #
         return {
             "ok": True,
-            "logs": "\n".join(logs),
+            "task_id": task_id,
         }
 
 
@@ -17,6 +17,8 @@
 
 """ API """
 
+import time
+
 import flask  # pylint: disable=E0401,W0611
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
@@ -24,294 +26,185 @@ from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
 from tools import auth  # pylint: disable=E0401
 from tools import api_tools  # pylint: disable=E0401
 
+from ...utils.permission_propagation import plan_propagation, apply_propagation
+
+
+DEFAULTS_MODES = {
+    "add_user_project_defaults": "user",
+    "add_team_project_defaults": "team",
+    "add_public_project_defaults": "public",
+}
+
+PERMISSIONS_MODES = {
+    "add_user_project_permissions": ("user", False),
+    "add_team_project_permissions": ("team", False),
+    "add_public_project_permissions": ("public", False),
+    "delete_user_project_permissions": ("user", True),
+    "delete_team_project_permissions": ("team", True),
+    "delete_public_project_permissions": ("public", True),
+}
+
+
+def parse_permissions(permission_items):
+    """ 'permission:role,role' lines -> {role: {permission, ...}} """
+    result = {}
+    #
+    for item in permission_items.strip().splitlines():
+        if not item.strip():
+            continue
+        #
+        permission, roles = item.split(":", 1)
+        #
+        for role in roles.split(","):
+            result.setdefault(role.strip(), set()).add(permission.strip())
+    #
+    return result
+
 
 class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     """ API """
 
+    def _get_project_ids(self, scope):
+        personal_project_ids = \
+            self.module.context.rpc_manager.call.projects_get_personal_project_ids()
+        #
+        if not personal_project_ids:
+            return None
+        #
+        if scope == "user":
+            return list(personal_project_ids)
+        #
+        from tools import elitea_config  # pylint: disable=E0401,C0415
+        #
+        ai_project_id = elitea_config.get("ai_project_id")
+        #
+        if ai_project_id:
+            ai_project_id = int(ai_project_id)
+        #
+        if scope == "team":
+            personal_project_ids = set(personal_project_ids)
+            return [
+                i['id']
+                for i in self.module.context.rpc_manager.call.project_list()
+                if (i['id'] not in personal_project_ids) and (i['id'] != ai_project_id)
+            ]
+        #
+        return [ai_project_id] if ai_project_id else []
+
     @auth.decorators.check_api(["migration.permissions"])
-    def post(self):  # pylint: disable=R0912,R0914,R0915
+    def post(self):  # pylint: disable=R0914
         """ Process POST """
         data = flask.request.get_json()
         mode = data.get("mode", "unknown")
+        dry_run = bool(data.get("dry_run", False))
+        apply_global = bool(data.get("global", False))
+        #
+        if mode not in DEFAULTS_MODES and mode not in PERMISSIONS_MODES:
+            return {
+                "ok": True,
+                "logs": f"Current mode: {mode}",
+            }
+        #
+        start_ts = time.time()
+        #
+        # Central (mode 'default') roles and permissions
+        #
+        central_permissions = {
+            item["name"]: set() for item in auth.get_roles(mode="default")
+        }
+        #
+        for item in auth.get_permissions(mode="default"):
+            central_permissions.setdefault(item["name"], set()).add(item["permission"])
+        #
+        if mode in DEFAULTS_MODES:
+            scope, remove = DEFAULTS_MODES[mode], False
+            target = {role: set(permissions) for role, permissions in central_permissions.items()}
+        else:
+            scope, remove = PERMISSIONS_MODES[mode]
+            target = parse_permissions(data.get("permissions", ""))
         #
         logs = []
         #
-        if mode in [
-                "add_user_project_defaults",
-                "add_team_project_defaults",
-                "add_public_project_defaults",
-        ]:
-            #
-            # Build default role map
-            #
-            default_project_roles = auth.get_roles(mode="default")
-            default_project_permissions = auth.get_permissions(mode="default")
-            #
-            default_role_map = {}
-            #
-            for item in default_project_roles:
-                default_role_map[item["name"]] = set()
-            #
-            for item in default_project_permissions:
-                default_role_map[item["name"]].add(item["permission"])
-            #
-            for item in default_project_roles:
-                default_role_map[item["name"]] = list(default_role_map[item["name"]])
-                default_role_map[item["name"]].sort()
-            #
-            log.debug("Default role map: %s", default_role_map)
-            #
-            # Get projects
-            #
-            personal_project_ids = \
-                self.module.context.rpc_manager.call.projects_get_personal_project_ids()
-            #
-            if not personal_project_ids:
-                return {"error": "Personal projects not set"}, 400
-            #
-            if mode == "add_user_project_defaults":
-                project_ids = personal_project_ids
-            elif mode == "add_team_project_defaults":
-                from tools import elitea_config  # pylint: disable=E0401,C0415
-                #
-                ai_project_id = elitea_config.get("ai_project_id")
-                #
-                if ai_project_id:
-                    ai_project_id = int(ai_project_id)
-                #
-                project_ids = [
-                    i['id']
-                    for i in self.module.context.rpc_manager.call.project_list()
-                    if (i['id'] not in personal_project_ids) and (i['id'] != ai_project_id)
-                ]
-            elif mode == "add_public_project_defaults":
-                from tools import elitea_config  # pylint: disable=E0401,C0415
-                #
-                ai_project_id = elitea_config.get("ai_project_id")
-                #
-                if ai_project_id:
-                    ai_project_id = int(ai_project_id)
-                #
-                project_ids = [ai_project_id]
-            else:
-                project_ids = []
-            #
-            log.debug("Project IDs: %s", project_ids)
-            #
-            for project_id in project_ids:
-                #
-                # Build project role map
-                #
-                project_roles = self.module.get_roles(project_id)
-                project_permissions = self.module.get_permissions(project_id)
-                #
-                project_role_map = {}
-                #
-                for item in project_roles:
-                    project_role_map[item["name"]] = set()
-                #
-                for item in project_permissions:
-                    project_role_map[item["name"]].add(item["permission"])
-                #
-                for item in project_roles:
-                    project_role_map[item["name"]] = list(project_role_map[item["name"]])
-                    project_role_map[item["name"]].sort()
-                #
-                log.debug("Project role map: %s", project_role_map)
-                #
-                # Diff
-                #
-                missing_roles = []
-                missing_permissions = []
-                #
-                for role, permissions in default_role_map.items():
-                    if role not in project_role_map:
-                        missing_roles.append(role)
-                    #
-                    role_permissions = project_role_map.get(role, [])
-                    #
-                    for permission in permissions:
-                        if permission not in role_permissions:
-                            missing_permissions.append({"role": role, "permission": permission})
-                #
-                log.debug(f"Project {project_id}: {missing_roles=} {missing_permissions=}")
-                logs.append(f"Project {project_id}: {missing_roles=} {missing_permissions=}")
-                #
-                # Apply
-                #
-                if missing_roles:
-                    try:
-                        self.module.context.rpc_manager.call.admin_add_role(
-                            project_id, missing_roles
-                        )
-                    except:  # pylint: disable=W0702
-                        log.exception("Failed to add missing roles")
-                        logs.append("> Failed to add missing roles")
-                #
-                for permission in missing_permissions:
-                    try:
-                        self.module.context.rpc_manager.call.admin_set_permission_for_role(
-                            project_id, permission["role"], permission["permission"]
-                        )
-                    except:  # pylint: disable=W0702
-                        log.exception(
-                            "Failed to add missing permission: %s:%s",
-                            permission["role"], permission["permission"],
-                        )
-                        #
-                        l_role = permission["role"]
-                        l_perm = permission["permission"]
-                        #
-                        logs.append(
-                            f"> Failed to add missing permission: {l_role}:{l_perm}"
-                        )
-        elif mode in [  # pylint: disable=R1702
-                "add_user_project_permissions",
-                "add_team_project_permissions",
-                "add_public_project_permissions",
-                "delete_user_project_permissions",
-                "delete_team_project_permissions",
-                "delete_public_project_permissions",
-        ]:
-            #
-            # Parse input permissions
-            #
-            permission_items = data.get("permissions", "").strip()
-            #
-            input_permissions = []
-            #
-            for item in permission_items.splitlines():
-                permission, roles = item.split(":", 1)
-                roles = roles.split(",")
-                #
-                input_permissions.append(
-                    (permission, roles)
+        unknown_roles = sorted(set(target) - set(central_permissions))
+        if unknown_roles:
+            logs.append(f"Roles without central (default) definition, permissions skipped: {unknown_roles}")
+            for role in unknown_roles:
+                target[role] = set()
+        #
+        # Projects
+        #
+        project_ids = self._get_project_ids(scope)
+        #
+        if project_ids is None:
+            return {"error": "Personal projects not set"}, 400
+        #
+        log.debug("Project IDs: %s", project_ids)
+        #
+        project_roles = {
+            project_id: {role["name"] for role in roles}
+            for project_id, roles in self.module.get_roles_in_projects(project_ids).items()
+        }
+        #
+        plan = plan_propagation(target, project_roles, central_permissions, remove=remove)
+        plan_ts = time.time()
+        #
+        for project_id, item in sorted(plan["projects"].items()):
+            if item["roles_added"]:
+                logs.append(f"Project {project_id}: roles_added={item['roles_added']}")
+        #
+        action = "remove" if remove else "add"
+        #
+        if plan["permissions"]:
+            logs.append(
+                f"Central (default) role permissions to {action}: {plan['permissions']}"
+            )
+            #
+            if not apply_global:
+                logs.append(
+                    "Permissions are central and not scoped to projects: "
+                    "set 'global' to apply them to every project with the role"
                 )
+        #
+        applied = None
+        #
+        if not dry_run:
+            applied = apply_propagation(plan, remove=remove, apply_permissions=apply_global)
             #
-            # Get projects
-            #
-            personal_project_ids = \
-                self.module.context.rpc_manager.call.projects_get_personal_project_ids()
-            #
-            if not personal_project_ids:
-                return {"error": "Personal projects not set"}, 400
-            #
-            if mode in ["add_user_project_permissions", "delete_user_project_permissions"]:
-                project_ids = personal_project_ids
-            elif mode in ["add_team_project_permissions", "delete_team_project_permissions"]:
-                from tools import elitea_config  # pylint: disable=E0401,C0415
-                #
-                ai_project_id = elitea_config.get("ai_project_id")
-                #
-                if ai_project_id:
-                    ai_project_id = int(ai_project_id)
-                #
-                project_ids = [
-                    i['id']
-                    for i in self.module.context.rpc_manager.call.project_list()
-                    if (i['id'] not in personal_project_ids) and (i['id'] != ai_project_id)
-                ]
-            elif mode in ["add_public_project_permissions", "delete_public_project_permissions"]:
-                from tools import elitea_config  # pylint: disable=E0401,C0415
-                #
-                ai_project_id = elitea_config.get("ai_project_id")
-                #
-                if ai_project_id:
-                    ai_project_id = int(ai_project_id)
-                #
-                project_ids = [ai_project_id]
-            else:
-                project_ids = []
-            #
-            for project_id in project_ids:
-                #
-                # Build project role map
-                #
-                project_roles = self.module.get_roles(project_id)
-                project_permissions = self.module.get_permissions(project_id)
-                #
-                project_role_map = {}
-                #
-                for item in project_roles:
-                    project_role_map[item["name"]] = set()
-                #
-                for item in project_permissions:
-                    project_role_map[item["name"]].add(item["permission"])
-                #
-                for item in project_roles:
-                    project_role_map[item["name"]] = list(project_role_map[item["name"]])
-                    project_role_map[item["name"]].sort()
-                #
-                # Perform
-                #
-                if mode in [
-                        "add_user_project_permissions",
-                        "add_team_project_permissions",
-                        "add_public_project_permissions",
-                ]:
-                    #
-                    # Diff
-                    #
-                    missing_roles = []
-                    missing_permissions = []
-                    #
-                    for permission, roles in input_permissions:
-                        for role in roles:
-                            if role not in project_role_map:
-                                missing_roles.append(role)
-                            #
-                            role_permissions = project_role_map.get(role, [])
-                            #
-                            if permission not in role_permissions:
-                                missing_permissions.append({"role": role, "permission": permission})
-                    #
-                    logs.append(f"Project {project_id}: {missing_roles=} {missing_permissions=}")
-                    #
-                    # Apply
-                    #
-                    if missing_roles:
-                        self.module.context.rpc_manager.call.admin_add_role(
-                            project_id, missing_roles
-                        )
-                    #
-                    for permission in missing_permissions:
-                        self.module.context.rpc_manager.call.admin_set_permission_for_role(
-                            project_id, permission["role"], permission["permission"]
-                        )
-                elif mode in [
-                        "delete_user_project_permissions",
-                        "delete_team_project_permissions",
-                        "delete_public_project_permissions",
-                ]:
-                    #
-                    # Data
-                    #
-                    removed_permissions = []
-                    #
-                    # Apply
-                    #
-                    for permission, roles in input_permissions:
-                        for role in roles:
-                            if role not in project_role_map:
-                                continue
-                            #
-                            role_permissions = project_role_map.get(role, [])
-                            #
-                            if permission in role_permissions:
-                                self.module.context.rpc_manager.call.admin_remove_permission_from_role(  # pylint: disable=C0301
-                                    project_id, role, permission
-                                )
-                                removed_permissions.append(f"{role}:{permission}")
-                    #
-                    # Log
-                    #
-                    logs.append(f"Project {project_id}: {removed_permissions=}")
+            if applied["roles_added"]:
+                self.module.role_map_cache.invalidate()
+                self.module.context.event_manager.fire_event(
+                    "admin_project_roles_changed", {"project_id": None},
+                )
         #
-        else:
-            logs.append(f"Current mode: {mode}")
+        end_ts = time.time()
+        #
+        logs.append(
+            f"{'Dry run: ' if dry_run else ''}{len(project_ids)} projects, "
+            f"{len(plan['roles_to_add'])} roles to add, "
+            f"{len(plan['permissions'])} central permissions to {action}"
+            + ("" if apply_global else " (not applied: 'global' not set)")
+            + (
+                f", written: {applied['roles_added']} roles, {applied['permissions']} permissions"
+                if applied is not None else ""
+            )
+            + f" (plan {plan_ts - start_ts:.3f}s, total {end_ts - start_ts:.3f}s)"
+        )
         #
         return {
             "ok": True,
+            "dry_run": dry_run,
+            "global": apply_global,
+            "projects": {
+                project_id: {"roles_added": item["roles_added"]}
+                for project_id, item in plan["projects"].items()
+            },
+            "central_permissions": {
+                "action": action,
+                "items": [list(item) for item in plan["permissions"]],
+                "applied": apply_global and not dry_run,
+            },
+            "applied": applied,
+            "duration": end_ts - start_ts,
             "logs": "\n".join(logs),
         }
 
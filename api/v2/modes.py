@@ -33,29 +33,59 @@ from tools import api_tools  # pylint: disable=E0401
 class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     @auth.decorators.check_api(["modes.users"])
     def get(self):  # pylint: disable=R0201
-        """ Process GET """
+        """ Process GET: optional search, sort/order and limit/offset """
+        args = flask.request.args
+        #
+        users = {
+            user["id"]: user
+            for user in self.module.context.rpc_manager.call.auth_list_users()
+        }
+        #
+        assignments = self.module.get_users_roles_in_modes(list(theme.modes))
+        #
         result = list()
         #
-        users = self.module.context.rpc_manager.call.auth_list_users()
+        for item in assignments:
+            user = users.get(item["user_id"], None)
+            if user is None:
+                continue
+            #
+            result.append({
+                "id": f'{user["id"]}:{item["mode"]}:{item["role"]}',
+                "user_id": user["id"],
+                "user_email": user["email"],
+                "user_name": user["name"],
+                "mode": item["mode"],
+                "role": item["role"],
+            })
         #
-        for mode_key in theme.modes:
-            for user in users:
-                user_roles = self.module.context.rpc_manager.call.auth_get_user_roles(
-                    user["id"], mode_key
+        search = args.get("search", "").strip().lower()
+        if search:
+            result = [
+                row for row in result
+                if any(
+                    search in str(row[key] or "").lower()
+                    for key in ("user_id", "user_email", "user_name", "mode", "role")
                 )
-                #
-                for role in user_roles:
-                    result.append({
-                        "id": f'{user["id"]}:{mode_key}:{role}',
-                        "user_id": user["id"],
-                        "user_email": user["email"],
-                        "user_name": user["name"],
-                        "mode": mode_key,
-                        "role": role,
-                    })
+            ]
+        #
+        sort = args.get("sort", None)
+        if sort in ("user_id", "user_email", "user_name", "mode", "role"):
+            result.sort(
+                key=lambda row: (row[sort] is None, row[sort] if sort == "user_id" else str(row[sort])),
+                reverse=args.get("order", "asc") == "desc",
+            )
+        #
+        total = len(result)
+        #
+        offset = args.get("offset", 0, type=int)
+        limit = args.get("limit", None, type=int)
+        #
+        if offset or limit:
+            result = result[offset:offset + limit if limit else None]
         #
         return {
-            "total": len(result),
+            "total": total,
             "rows": result,
         }
 
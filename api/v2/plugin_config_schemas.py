@@ -17,8 +17,6 @@
 
 """ API """
 
-import time
-
 import flask  # pylint: disable=E0401,W0611
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
@@ -102,44 +100,35 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         """ Collect admin_schema from all plugins across all active pylons """
         sections = {}
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
-            #
-            if time.time() - data.get("timestamp", 0) > 60:
+        runtimes = self.module.remote_runtimes
+        #
+        for section_id in runtimes.section_ids():
+            fields = runtimes.section_fields(section_id)
+            if not fields:
                 continue
             #
-            runtime_info = data.get("runtime_info", [])
+            sec_meta = SECTION_DEFINITIONS.get(section_id, {})
+            sections[section_id] = {
+                "id": section_id,
+                "title": sec_meta.get("title", section_id.replace("_", " ").title()),
+                "description": sec_meta.get("description", ""),
+                "order": sec_meta.get("order", 99),
+                "icon": sec_meta.get("icon", "settings"),
+                "fields": [],
+            }
             #
-            for plugin in runtime_info:
-                schema = plugin.get("admin_schema")
-                if not schema:
-                    continue
+            for field in fields:
+                prop_def = field["prop_def"]
                 #
-                plugin_name = plugin["name"]
+                # Skip fields that are sync targets (owned by another plugin)
+                if prop_def.get("_is_sync_target"):
+                    continue
                 #
-                for prop_key, prop_def in schema.get("properties", {}).items():
-                    section_id = prop_def.get("section", "runtime")
-                    #
-                    if section_id not in sections:
-                        sec_meta = SECTION_DEFINITIONS.get(section_id, {})
-                        sections[section_id] = {
-                            "id": section_id,
-                            "title": sec_meta.get("title", section_id.replace("_", " ").title()),
-                            "description": sec_meta.get("description", ""),
-                            "order": sec_meta.get("order", 99),
-                            "icon": sec_meta.get("icon", "settings"),
-                            "fields": [],
-                        }
-                    #
-                    # Skip fields that are sync targets (owned by another plugin)
-                    if prop_def.get("_is_sync_target"):
-                        continue
-                    #
-                    field_entry = dict(prop_def)
-                    field_entry["key"] = prop_key
-                    field_entry["plugin"] = plugin_name
-                    field_entry["pylon_id"] = pylon_id
-                    sections[section_id]["fields"].append(field_entry)
+                field_entry = dict(prop_def)
+                field_entry["key"] = field["key"]
+                field_entry["plugin"] = field["plugin"]
+                field_entry["pylon_id"] = field["pylon_id"]
+                sections[section_id]["fields"].append(field_entry)
         #
         # Ensure always-visible sections are included
         for sec_id, sec_meta in SECTION_DEFINITIONS.items():
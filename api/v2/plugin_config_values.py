@@ -17,46 +17,16 @@
 
 """ API """
 
-import time
 import copy
 
 import flask  # pylint: disable=E0401
-import yaml  # pylint: disable=E0401
 
 from pylon.core.tools import log  # pylint: disable=E0611,E0401
 
 from tools import auth  # pylint: disable=E0401
 from tools import api_tools  # pylint: disable=E0401
 
-def get_nested(d, path):
-    """ Get a value from a nested dict using dot-notation path """
-    keys = path.split(".")
-    for key in keys:
-        if isinstance(d, dict):
-            d = d.get(key)
-        else:
-            return None
-    return d
-
-
-def set_nested(d, path, value):
-    """ Set a value in a nested dict using dot-notation path """
-    keys = path.split(".")
-    for key in keys[:-1]:
-        if key not in d or not isinstance(d[key], dict):
-            d[key] = {}
-        d = d[key]
-    d[keys[-1]] = value
-
-
-def find_pylon_id_by_prefix(remote_runtimes, pylon_prefix):
-    """ Find actual pylon_id that contains the given prefix """
-    normalized_prefix = pylon_prefix.replace("-", "_").replace(" ", "_").lower()
-    for pylon_id in remote_runtimes:
-        normalized_id = pylon_id.replace("-", "_").replace(" ", "_").lower()
-        if normalized_prefix in normalized_id:
-            return pylon_id
-    return None
+from ...utils.config_yaml import get_nested, patch_yaml
 
 
 class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
@@ -69,39 +39,25 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         # Pass 1: collect all entries
         raw_entries = []
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
-            #
-            if time.time() - data.get("timestamp", 0) > 60:
-                continue
+        runtimes = self.module.remote_runtimes
+        #
+        for field in runtimes.section_fields(section_id):
+            prop_def = field["prop_def"]
+            plugin = runtimes.get_plugin(field["pylon_id"], field["plugin"], {})
+            config = plugin.get("config") or {}
             #
-            runtime_info = data.get("runtime_info", [])
+            raw_value = get_nested(config, field["path"])
+            if raw_value is None:
+                raw_value = prop_def.get("default")
             #
-            for plugin in runtime_info:
-                schema = plugin.get("admin_schema")
-                if not schema:
-                    continue
-                #
-                plugin_name = plugin["name"]
-                config = plugin.get("config") or {}
-                #
-                for prop_key, prop_def in schema.get("properties", {}).items():
-                    if prop_def.get("section") != section_id:
-                        continue
-                    #
-                    path = prop_def.get("path", prop_key)
-                    raw_value = get_nested(config, path)
-                    if raw_value is None:
-                        raw_value = prop_def.get("default")
-                    #
-                    raw_entries.append({
-                        "prop_key": prop_key,
-                        "pylon_id": pylon_id,
-                        "plugin_name": plugin_name,
-                        "raw_value": raw_value,
-                        "path": path,
-                        "requires_restart": prop_def.get("requires_restart", False),
-                    })
+            raw_entries.append({
+                "prop_key": field["key"],
+                "pylon_id": field["pylon_id"],
+                "plugin_name": field["plugin"],
+                "raw_value": raw_value,
+                "path": field["path"],
+                "requires_restart": prop_def.get("requires_restart", False),
+            })
         #
         # Pass 2: detect multi-pylon keys
         key_pylons = {}
@@ -156,95 +112,74 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         targets = {}  # (pylon_id, plugin_name) -> [(path, value), ...]
         reload_needed = {}  # pylon_id -> set(plugin_names)
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
-            #
-            if time.time() - data.get("timestamp", 0) > 60:
-                continue
-            #
-            runtime_info = data.get("runtime_info", [])
-            #
-            for plugin in runtime_info:
-                schema = plugin.get("admin_schema")
-                if not schema:
+        runtimes = self.module.remote_runtimes
+        #
+        for prop_key in sorted({key for key, _ in parsed_values}):
+            for field in runtimes.key_fields(section_id, prop_key):
+                pylon_id = field["pylon_id"]
+                plugin_name = field["plugin"]
+                prop_def = field["prop_def"]
+                path = field["path"]
+                #
+                # Match: pylon-specific key first, then generic key
+                if (prop_key, pylon_id) in parsed_values:
+                    value = parsed_values[(prop_key, pylon_id)]
+                elif (prop_key, None) in parsed_values:
+                    value = parsed_values[(prop_key, None)]
+                else:
                     continue
                 #
-                plugin_name = plugin["name"]
+                # Skip if value hasn't changed
+                config = runtimes.get_plugin(pylon_id, plugin_name, {}).get("config") or {}
+                current_value = get_nested(config, path)
+                if current_value is None:
+                    current_value = prop_def.get("default")
+                if value == current_value:
+                    continue
                 #
-                config = plugin.get("config") or {}
+                target_key = (pylon_id, plugin_name)
+                if target_key not in targets:
+                    targets[target_key] = []
+                targets[target_key].append((path, value))
                 #
-                for prop_key, prop_def in schema.get("properties", {}).items():
-                    if prop_def.get("section") != section_id:
-                        continue
-                    #
-                    # Match: pylon-specific key first, then generic key
-                    if (prop_key, pylon_id) in parsed_values:
-                        value = parsed_values[(prop_key, pylon_id)]
-                    elif (prop_key, None) in parsed_values:
-                        value = parsed_values[(prop_key, None)]
-                    else:
-                        continue
-                    #
-                    path = prop_def.get("path", prop_key)
+                if prop_def.get("requires_restart", False):
+                    if pylon_id not in reload_needed:
+                        reload_needed[pylon_id] = set()
+                    reload_needed[pylon_id].add(plugin_name)
+                #
+                # Handle sync_targets
+                for sync in prop_def.get("sync_targets", []):
+                    sync_pylon_prefix = sync.get("pylon", "")
+                    sync_plugin = sync.get("plugin", "")
+                    sync_path = sync.get("path", path)
                     #
-                    # Skip if value hasn't changed
-                    current_value = get_nested(config, path)
-                    if current_value is None:
-                        current_value = prop_def.get("default")
-                    if value == current_value:
+                    sync_pylon_id = runtimes.resolve_pylon_prefix(sync_pylon_prefix)
+                    if not sync_pylon_id:
+                        log.warning(
+                            "Sync target pylon not found: %s", sync_pylon_prefix,
+                        )
                         continue
                     #
-                    target_key = (pylon_id, plugin_name)
-                    if target_key not in targets:
-                        targets[target_key] = []
-                    targets[target_key].append((path, value))
+                    st_key = (sync_pylon_id, sync_plugin)
+                    if st_key not in targets:
+                        targets[st_key] = []
+                    targets[st_key].append((sync_path, value))
                     #
                     if prop_def.get("requires_restart", False):
-                        if pylon_id not in reload_needed:
-                            reload_needed[pylon_id] = set()
-                        reload_needed[pylon_id].add(plugin_name)
-                    #
-                    # Handle sync_targets
-                    for sync in prop_def.get("sync_targets", []):
-                        sync_pylon_prefix = sync.get("pylon", "")
-                        sync_plugin = sync.get("plugin", "")
-                        sync_path = sync.get("path", path)
-                        #
-                        sync_pylon_id = find_pylon_id_by_prefix(
-                            self.module.remote_runtimes, sync_pylon_prefix,
-                        )
-                        if not sync_pylon_id:
-                            log.warning(
-                                "Sync target pylon not found: %s", sync_pylon_prefix,
-                            )
-                            continue
-                        #
-                        st_key = (sync_pylon_id, sync_plugin)
-                        if st_key not in targets:
-                            targets[st_key] = []
-                        targets[st_key].append((sync_path, value))
-                        #
-                        if prop_def.get("requires_restart", False):
-                            if sync_pylon_id not in reload_needed:
-                                reload_needed[sync_pylon_id] = set()
-                            reload_needed[sync_pylon_id].add(sync_plugin)
+                        if sync_pylon_id not in reload_needed:
+                            reload_needed[sync_pylon_id] = set()
+                        reload_needed[sync_pylon_id].add(sync_plugin)
         #
         # For each target, patch YAML and fire event
         for (pylon_id, plugin_name), changes in targets.items():
             # Find current config_data for this plugin
-            config_data = ""
-            rt_data = self.module.remote_runtimes.get(pylon_id, {})
-            for plugin in rt_data.get("runtime_info", []):
-                if plugin["name"] == plugin_name:
-                    config_data = plugin.get("config_data", "")
-                    break
-            #
-            config_dict = yaml.safe_load(config_data) or {}
+            plugin = runtimes.get_plugin(pylon_id, plugin_name, {})
+            config_data = plugin.get("config_data", "")
             #
-            for path, value in changes:
-                set_nested(config_dict, path, value)
-            #
-            new_yaml = yaml.dump(config_dict, default_flow_style=False, allow_unicode=True)
+            new_yaml, config_dict = patch_yaml(
+                config_data, changes, self.module.config_yaml_cache.get(config_data),
+            )
+            self.module.config_yaml_cache.put(new_yaml, config_dict)
             #
             log.info("Plugin config update: %s -> %s", pylon_id, plugin_name)
             self.module.context.event_manager.fire_event(
@@ -259,8 +194,9 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
             )
             #
             # Update local cache so subsequent GETs return new values immediately
-            plugin["config"] = config_dict
-            plugin["config_data"] = new_yaml
+            runtimes.update_plugin(
+                pylon_id, plugin_name, config=config_dict, config_data=new_yaml,
+            )
         #
         return {
             "saved": True,
@@ -63,13 +63,18 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903,C0115
         #
         rows = data["rows"]
         #
-        # Enrich only the current page with admin names
+        # Enrich only the current page with admin names: one bulk role read
+        # and one user lookup for the whole page, joined in memory
+        #
+        page_users = self.module.get_users_roles_in_projects(
+            [project["id"] for project in rows],
+        )
+        #
+        page_admin_ids = {}
+        all_user_ids = set()
         #
         for project in rows:
-            project_users = self.module.get_users_roles_in_project(
-                project["id"],
-                filter_system_user=True,
-            )
+            project_users = page_users.get(project["id"], {})
             #
             owner_id = project.get("owner_id")
             is_personal_project = project["name"].startswith("project_user_")
@@ -86,12 +91,28 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903,C0115
                 if "admin" in user_roles
             )
             #
-            all_user_ids = set(project_admin_ids)
+            page_admin_ids[project["id"]] = project_admin_ids
+            all_user_ids.update(project_admin_ids)
             if owner_id:
                 all_user_ids.add(owner_id)
-            #
-            user_infos = auth.list_users(user_ids=all_user_ids)
-            user_map = {u["id"]: (u["name"] or str(u["email"])) for u in user_infos}
+        #
+        user_map = {}
+        user_emails = {}
+        if all_user_ids:
+            for user in auth.list_users(user_ids=all_user_ids):
+                user_map[user["id"]] = user["name"] or str(user["email"])
+                user_emails[user["id"]] = user["email"]
+        #
+        from tools import project_constants as pc  # pylint: disable=E0401,C0415
+        #
+        for project in rows:
+            owner_id = project.get("owner_id")
+            is_personal_project = project["name"].startswith("project_user_")
+            system_email = pc["PROJECT_USER_EMAIL_TEMPLATE"].format(project["id"])
+            project_admin_ids = [
+                uid for uid in page_admin_ids[project["id"]]
+                if user_emails.get(uid) != system_email
+            ]
             #
             owner_name = user_map.get(owner_id, str(owner_id)) if owner_id else ""
             other_admin_names = [
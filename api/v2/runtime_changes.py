@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+""" API """
+
+import json
+import time
+
+import flask  # pylint: disable=E0401,W0611
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+
+from tools import auth  # pylint: disable=E0401
+from tools import api_tools  # pylint: disable=E0401
+
+
+def stream_changes(feed, cursor, heartbeat, max_duration):
+    """ Generate server-sent events for feed changes after cursor """
+    started = time.time()
+    #
+    while time.time() - started < max_duration:
+        changes, new_cursor, reset = feed.wait(cursor, heartbeat)
+        #
+        if reset:
+            yield f"id: {new_cursor}\nevent: reset\ndata: {json.dumps({'cursor': new_cursor})}\n\n"
+        elif changes:
+            for change in changes:
+                yield f"id: {change['cursor']}\ndata: {json.dumps(change)}\n\n"
+        else:
+            yield ": keepalive\n\n"
+        #
+        cursor = new_cursor
+
+
+class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
+    """ API """
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def get(self):
+        """ Process GET: long-poll with cursor/wait, or SSE with stream=true """
+        args = flask.request.args
+        config = self.module.descriptor.config
+        feed = self.module.runtime_changes
+        #
+        cursor = flask.request.headers.get("Last-Event-ID", args.get("cursor", None))
+        #
+        try:
+            feed.parse_cursor(cursor)
+        except ValueError:
+            return {"error": "Invalid cursor"}, 400
+        #
+        if args.get("stream", "false") == "true" or \
+                "text/event-stream" in flask.request.headers.get("Accept", ""):
+            return flask.Response(
+                flask.stream_with_context(
+                    stream_changes(
+                        feed, cursor,
+                        heartbeat=config.get("runtime_changes_heartbeat", 15),
+                        max_duration=config.get("runtime_changes_stream_duration", 300),
+                    )
+                ),
+                mimetype="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "X-Accel-Buffering": "no",
+                },
+            )
+        #
+        wait = min(
+            args.get("wait", 0, type=float),
+            config.get("runtime_changes_max_wait", 30),
+        )
+        #
+        if wait > 0:
+            changes, cursor, reset = feed.wait(cursor, wait)
+        else:
+            changes, cursor, reset = feed.since(cursor)
+        #
+        return {
+            "cursor": cursor,
+            "reset": reset,
+            "changes": changes,
+        }
+
+
+class API(api_tools.APIBase):  # pylint: disable=R0903
+    """ API """
+
+    url_params = [
+        "<string:mode>",
+    ]
+
+    mode_handlers = {
+        'administration': AdminAPI,
+    }
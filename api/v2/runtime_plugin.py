@@ -34,33 +34,19 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     @auth.decorators.check_api(["runtime.plugins"])
     def get(self, plugin):  # pylint: disable=R0201
         """ Process GET """
-        module_manager = self.module.context.module_manager
+        result = self.module.repo_version_cache.get(
+            plugin, refresh=flask.request.args.get("refresh", "false") == "true",
+        )
         #
-        if "bootstrap" not in module_manager.modules:
+        if result["error"] is not None:
             return {
                 "ok": False,
-                "error": "Bootstrap plugin is not installed",
+                "error": result["error"],
             }
         #
-        bootstrap = module_manager.modules["bootstrap"].module
-        repo_resolver = bootstrap.repo_resolver
-        #
-        plugin_info = repo_resolver.resolve(plugin)
-        #
-        if plugin_info is None:
-            return {
-                "ok": False,
-                "error": "Plugin is not known by repo resolver(s)",
-            }
-        #
-        metadata_provider = repo_resolver.get_metadata_provider(plugin)
-        #
-        metadata_url = plugin_info["objects"]["metadata"]
-        metadata = metadata_provider.get_metadata({"source": metadata_url})
-        #
         return {
             "ok": True,
-            "repo_version": metadata.get("version", "0.0.0"),
+            "repo_version": result["version"],
         }
 
     @auth.decorators.check_api(["runtime.plugins"])
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+""" API """
+
+import flask  # pylint: disable=E0401,W0611
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+
+from tools import auth  # pylint: disable=E0401
+from tools import api_tools  # pylint: disable=E0401
+
+
+class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
+    """ API """
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def get(self):
+        """ Process GET: repo versions of plugins (all local plugins by default) """
+        plugins = [
+            item.strip()
+            for item in flask.request.args.get("plugins", "").split(",")
+            if item.strip()
+        ]
+        #
+        if not plugins:
+            plugins = sorted(self.module.context.module_manager.modules)
+        #
+        versions = self.module.repo_version_cache.get_many(
+            plugins, refresh=flask.request.args.get("refresh", "false") == "true",
+        )
+        #
+        return {
+            "ok": True,
+            "versions": versions,
+        }
+
+
+class API(api_tools.APIBase):  # pylint: disable=R0903
+    """ API """
+
+    url_params = [
+        "<string:mode>",
+    ]
+
+    mode_handlers = {
+        'administration': AdminAPI,
+    }
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+""" API """
+
+import flask  # pylint: disable=E0401,W0611
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+
+from tools import auth  # pylint: disable=E0401
+from tools import api_tools  # pylint: disable=E0401
+
+from ...utils.plugin_updates import merge_update_matrix
+
+
+class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
+    """ API """
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def get(self):
+        """ Process GET: acknowledgement status of bulk update """
+        update = self.module.plugin_update_tracker.get(flask.request.args.get("id", ""))
+        #
+        if update is None:
+            return {"ok": False, "error": "Update not found"}, 404
+        #
+        return {"ok": True, "update": update}
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def post(self):
+        """ Process POST: {"plugins": {plugin: [pylon_id, ...]}}, one event per pylon """
+        data = flask.request.get_json(silent=True) or {}
+        matrix = data.get("plugins", {})
+        #
+        if not isinstance(matrix, dict) or not any(matrix.values()):
+            return {
+                "ok": False,
+                "error": "No target plugins/pylon_ids provided",
+            }
+        #
+        pylon_plugins = merge_update_matrix(matrix)
+        #
+        events = []
+        #
+        for pylon_id, plugins in pylon_plugins.items():
+            log.info("Requesting plugin update(s): %s -> %s", pylon_id, plugins)
+            #
+            event_data = {
+                "pylon_id": pylon_id,
+                "plugins": plugins,
+                "restart": False,
+                "pylon_pid": 1,
+            }
+            #
+            if pylon_id == self.module.context.id:
+                events.append(event_data)
+            else:
+                events.insert(0, event_data)
+        #
+        update_id = self.module.plugin_update_tracker.track(pylon_plugins)
+        #
+        for event_item in events:
+            self.module.context.event_manager.fire_event(
+                "bootstrap_runtime_update",
+                event_item,
+            )
+        #
+        return {
+            "ok": True,
+            "id": update_id,
+            "events": len(events),
+            "message": f"Plugin update requested on {len(events)} pylon(s), restart to enable new version",
+        }
+
+
+class API(api_tools.APIBase):  # pylint: disable=R0903
+    """ API """
+
+    url_params = [
+        "<string:mode>",
+    ]
+
+    mode_handlers = {
+        'administration': AdminAPI,
+    }
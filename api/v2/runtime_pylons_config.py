@@ -32,21 +32,19 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
     @auth.decorators.check_api(["runtime.plugins"])
     def get(self, target_pylon_id):
         """ Process GET """
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            if pylon_id != target_pylon_id:
-                continue
-            #
-            data = self.module.remote_runtimes[pylon_id]
-            pylon_settings = data.get("pylon_settings", {})
-            #
-            if flask.request.args.get("raw", "false") == "true":
-                config_data = pylon_settings.get("tunable", "")
-            else:
-                config_data = yaml.dump(pylon_settings.get("active", ""))
-            #
-            return {"config": config_data}
+        data = self.module.remote_runtimes.get(target_pylon_id, None)
+        #
+        if data is None:  # Unknown or pruned concurrently
+            return {"config": ""}
+        #
+        pylon_settings = data.get("pylon_settings", {})
+        #
+        if flask.request.args.get("raw", "false") == "true":
+            config_data = pylon_settings.get("tunable", "")
+        else:
+            config_data = yaml.dump(pylon_settings.get("active", ""))
         #
-        return {"config": ""}
+        return {"config": config_data}
 
     @auth.decorators.check_api(["runtime.plugins"])
     def post(self, target_pylon_id):
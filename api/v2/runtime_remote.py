@@ -20,7 +20,10 @@
 import io
 import json
 import time
+import shutil
+import hashlib
 import zipfile
+import tempfile
 
 import flask  # pylint: disable=E0401,W0611
 
@@ -30,42 +33,208 @@ from tools import auth  # pylint: disable=E0401
 from tools import api_tools  # pylint: disable=E0401
 
 
-class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
-    """ API """
+COPY_CHUNK_SIZE = 64 * 1024
 
-    @auth.decorators.check_api(["runtime.plugins"])
-    def get(self):
-        """ Process GET """
-        result = []
-        #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            data = self.module.remote_runtimes[pylon_id]
+
+class ZipChunkWriter(io.RawIOBase):
+    """ Write-only, unseekable sink: collects ZipFile output for streaming """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self):
+        """ Get and forget data written so far """
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_config_export(remote_runtimes, targets):
+    """ Generate ZIP with pylon and plugin configs, one entry at a time """
+    sink = ZipChunkWriter()
+    #
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zfile:
+        for pylon_id in sorted(targets):
+            data = remote_runtimes.get(pylon_id, None)
             #
-            if time.time() - data["timestamp"] > 60:  # 4 announces missing (for 15s interval)
-                self.module.remote_runtimes.pop(pylon_id, None)
+            if data is None:
                 continue
             #
-            runtime_info = data["runtime_info"]
+            try:
+                pylon_settings = data["pylon_settings"]["tunable"]
+                #
+                if pylon_settings:
+                    zfile.writestr(f"{pylon_id}/pylon.yml", pylon_settings)
+                    yield sink.drain()
+            except:  # pylint: disable=W0702
+                pass
             #
-            for plugin in sorted(runtime_info, key=lambda x: x["name"]):
-                item = plugin.copy()
+            for plugin_name in sorted(targets[pylon_id]):
+                plugin = remote_runtimes.get_plugin(pylon_id, plugin_name, {})
+                config_data = plugin.get("config_data", "")
                 #
-                item["pylon_id"] = pylon_id
+                if not config_data:
+                    continue
                 #
-                item.pop("config", None)
-                item.pop("config_data", None)
+                zfile.writestr(f"{pylon_id}/{plugin_name}.yml", config_data)
+                yield sink.drain()
+    #
+    yield sink.drain()
+
+
+def iter_config_import(zip_data):
+    """ Read config ZIP entry by entry, yield update event data per complete pylon """
+    with zipfile.ZipFile(zip_data) as zfile:
+        remaining = {}  # pylon_id -> entries left
+        #
+        for info in zfile.infolist():
+            if "/" in info.filename:
+                pylon_id = info.filename.split("/", 1)[0]
+                remaining[pylon_id] = remaining.get(pylon_id, 0) + 1
+        #
+        target_events = {}
+        #
+        for info in zfile.infolist():
+            if "/" not in info.filename:
+                continue
+            #
+            pylon_id, name = info.filename.split("/", 1)
+            #
+            if pylon_id not in target_events:
+                target_events[pylon_id] = {
+                    "pylon_id": pylon_id,
+                    "configs": {},
+                    "actions": [],
+                    "restart": False,
+                }
+            #
+            if name.endswith(".yml"):
+                base_name = name.rsplit(".", 1)[0]
                 #
-                if "git_head" in item.get("metadata", {}):
-                    item_version = item.get("local_version", "-")
-                    item_git_head = item["metadata"]["git_head"][:7]
-                    item["local_version"] = f"{item_version} ({item_git_head})"
+                with zfile.open(info) as ifile:
+                    base_data = ifile.read().decode()
                 #
-                result.append(item)
+                if base_name == "pylon":
+                    target_events[pylon_id]["actions"].append(
+                        ["update_pylon_config", base_data]
+                    )
+                else:
+                    target_events[pylon_id]["configs"][base_name] = base_data
+            #
+            remaining[pylon_id] -= 1
+            #
+            if not remaining[pylon_id]:
+                yield target_events.pop(pylon_id)
+
+
+ROW_FILTERS = {  # query arg -> index in row keys
+    "pylon_id": 0,
+    "name": 1,
+    "version": 2,
+    "search": 3,
+}
+ROW_SORT_KEYS = (
+    "pylon_id", "name", "description", "prepared", "activated", "local_version",
+)
+
+
+def build_plugin_rows(remote_runtimes):
+    """ Flattened table rows: [(row, (pylon_id, name, version, any) lowercased)] """
+    result = []
+    #
+    for pylon_id, data in remote_runtimes.snapshot():
+        for plugin in data["runtime_info"]:  # Kept sorted by name
+            item = plugin.copy()
+            #
+            item["pylon_id"] = pylon_id
+            #
+            item.pop("config", None)
+            item.pop("config_data", None)
+            #
+            if "git_head" in item.get("metadata", {}):
+                item_version = item.get("local_version", "-")
+                item_git_head = item["metadata"]["git_head"][:7]
+                item["local_version"] = f"{item_version} ({item_git_head})"
+            #
+            keys = (
+                pylon_id.lower(),
+                str(item.get("name", "")).lower(),
+                str(item.get("local_version", "")).lower(),
+            )
+            #
+            result.append((
+                item,
+                keys + (" ".join(keys + (str(item.get("description", "")).lower(),)),),
+            ))
+    #
+    return result
+
+
+class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
+    """ API """
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def get(self):
+        """ Process GET: optional limit/offset, filters, sort/order, ETag """
+        args = flask.request.args
+        #
+        _, (digest, rows) = self.module.remote_runtimes.cached_view(
+            "runtime_remote_rows",
+            lambda registry: (registry.plugins_digest(), build_plugin_rows(registry)),
+        )
+        #
+        # Content based: stays valid across restarts and pylons behind a balancer
+        etag = hashlib.sha1(
+            f"{digest}:{sorted(args.items(multi=True))}".encode()
+        ).hexdigest()
+        #
+        if flask.request.if_none_match.contains(etag):
+            response = flask.make_response("", 304)
+            response.set_etag(etag)
+            return response
+        #
+        filters = [
+            (ROW_FILTERS[name], args[name].lower())
+            for name in ROW_FILTERS
+            if args.get(name, "")
+        ]
+        #
+        result = [
+            row for row, keys in rows
+            if all(value in keys[idx] for idx, value in filters)
+        ]
         #
-        return {
-            "total": len(result),
+        sort = args.get("sort", None)
+        if sort in ROW_SORT_KEYS:
+            result.sort(
+                key=lambda row: (row.get(sort) is None, str(row.get(sort))),
+                reverse=args.get("order", "asc") == "desc",
+            )
+        #
+        total = len(result)
+        #
+        offset = args.get("offset", 0, type=int)
+        limit = args.get("limit", None, type=int)
+        #
+        if offset or limit:
+            result = result[offset:offset + limit if limit else None]
+        #
+        response = flask.make_response({
+            "total": total,
             "rows": result,
-        }
+        })
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        #
+        return response
 
     @auth.decorators.check_api(["runtime.plugins"])
     def post(self):  # pylint: disable=R0912,R0915,R0914
@@ -103,46 +272,15 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 #
                 # ---
                 #
-                file_obj = io.BytesIO()
-                #
-                with zipfile.ZipFile(file_obj, mode="w", compression=zipfile.ZIP_DEFLATED) as zfile:
-                    for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-                        if pylon_id not in targets:
-                            continue
-                        #
-                        data = self.module.remote_runtimes[pylon_id]
-                        #
-                        try:
-                            pylon_settings = data["pylon_settings"]["tunable"]
-                            #
-                            if pylon_settings:
-                                zfile.writestr(f"{pylon_id}/pylon.yml", pylon_settings)
-                        except:  # pylint: disable=W0702
-                            pass
-                        #
-                        runtime_info = data["runtime_info"]
-                        for plugin in sorted(runtime_info, key=lambda x: x["name"]):
-                            plugin_name = plugin["name"]
-                            #
-                            if plugin_name not in targets[pylon_id]:
-                                continue
-                            #
-                            config_data = plugin.get("config_data", "")
-                            #
-                            if not config_data:
-                                continue
-                            #
-                            zfile.writestr(f"{pylon_id}/{plugin_name}.yml", config_data)
-                #
-                file_obj.seek(0)
-                #
-                # ---
-                #
-                return flask.send_file(
-                    file_obj,
+                return flask.Response(
+                    flask.stream_with_context(
+                        stream_config_export(self.module.remote_runtimes, targets)
+                    ),
                     mimetype="application/zip",
-                    as_attachment=True,
-                    download_name=f"config_export_{int(time.time())}.zip",
+                    headers={
+                        "Content-Disposition":
+                            f"attachment; filename=config_export_{int(time.time())}.zip",
+                    },
                 )
             #
             if action == "import_configs":
@@ -151,44 +289,19 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                     #
                     log.info("Importing config from: %s", file_data.filename)
                     #
-                    zip_data = io.BytesIO(file_data.stream.read())
-                    target_events = {}
-                    #
-                    with zipfile.ZipFile(zip_data) as zfile:
-                        for item in zfile.namelist():
-                            if "/" not in item:
-                                continue
-                            #
-                            pylon_id, name = item.split("/", 1)
-                            #
-                            if pylon_id not in target_events:
-                                target_events[pylon_id] = {
-                                    "pylon_id": pylon_id,
-                                    "configs": {},
-                                    "actions": [],
-                                    "restart": False,
-                                }
-                            #
-                            if not name.endswith(".yml"):
-                                continue
-                            #
-                            base_name = name.rsplit(".", 1)[0]
-                            #
-                            with zfile.open(item) as ifile:
-                                base_data = ifile.read().decode()
-                            #
-                            if base_name == "pylon":
-                                target_events[pylon_id]["actions"].append(
-                                    ["update_pylon_config", base_data]
-                                )
-                            else:
-                                target_events[pylon_id]["configs"][base_name] = base_data
+                    spool_size = self.module.descriptor.config.get(
+                        "config_import_spool_size", 8 * 1024 * 1024,
+                    )
                     #
-                    for event_data in target_events.values():
-                        self.module.context.event_manager.fire_event(
-                            "bootstrap_runtime_update",
-                            event_data,
-                        )
+                    with tempfile.SpooledTemporaryFile(max_size=spool_size) as zip_data:
+                        shutil.copyfileobj(file_data.stream, zip_data, COPY_CHUNK_SIZE)
+                        zip_data.seek(0)
+                        #
+                        for event_data in iter_config_import(zip_data):
+                            self.module.context.event_manager.fire_event(
+                                "bootstrap_runtime_update",
+                                event_data,
+                            )
                 #
                 return {"ok": True}
             #
@@ -226,6 +339,7 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 targets[pylon_id].append(plugin_name)
         #
         events = []
+        own_event = None
         #
         for pylon_id, plugins in targets.items():
             if not plugins:
@@ -242,9 +356,9 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 }
                 #
                 if pylon_id == self.module.context.id:
-                    events.append(event_data)
+                    own_event = event_data
                 else:
-                    events.insert(0, event_data)
+                    events.append(event_data)
             #
             elif action == "update_with_reqs":
                 log.info("Requesting plugin update(s)+req(s): %s -> %s", pylon_id, plugins)
@@ -260,9 +374,9 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 }
                 #
                 if pylon_id == self.module.context.id:
-                    events.append(event_data)
+                    own_event = event_data
                 else:
-                    events.insert(0, event_data)
+                    events.append(event_data)
             #
             elif action == "purge_reqs":
                 log.info("Requesting reqs purge(s): %s -> %s", pylon_id, plugins)
@@ -277,9 +391,9 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 }
                 #
                 if pylon_id == self.module.context.id:
-                    events.append(event_data)
+                    own_event = event_data
                 else:
-                    events.insert(0, event_data)
+                    events.append(event_data)
             #
             elif action == "delete":
                 log.info("Requesting plugin delete(s): %s -> %s", pylon_id, plugins)
@@ -294,9 +408,9 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 }
                 #
                 if pylon_id == self.module.context.id:
-                    events.append(event_data)
+                    own_event = event_data
                 else:
-                    events.insert(0, event_data)
+                    events.append(event_data)
             #
             elif action == "reload":
                 log.info("Requesting plugin reload(s): %s -> %s", pylon_id, plugins)
@@ -308,19 +422,25 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 }
                 #
                 if pylon_id == self.module.context.id:
-                    events.append(event_data)
+                    own_event = event_data
                 else:
-                    events.insert(0, event_data)
+                    events.append(event_data)
         #
-        # Emit events
+        # Emit events: in waves, own pylon last
         #
-        for event_item in events:
-            self.module.context.event_manager.fire_event(
-                "bootstrap_runtime_update",
-                event_item,
-            )
+        if not events and own_event is None:
+            return {"ok": True}
+        #
+        rollout_settings = data.get("rollout", {}) or {}
+        #
+        rollout = self.module.start_rollout(
+            action, events,
+            own_event=own_event,
+            batch_size=rollout_settings.get("batch_size", None),
+            batch_percent=rollout_settings.get("batch_percent", None),
+        )
         #
-        return {"ok": True}
+        return {"ok": True, "rollout": rollout.to_dict()}
 
 
 class API(api_tools.APIBase):  # pylint: disable=R0903
@@ -34,46 +34,35 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
         """ Process GET """
         if ":" not in plugin_id:
             # Pylon-level config
-            target_pylon_id = plugin_id
-            for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-                if pylon_id != target_pylon_id:
-                    continue
-                #
-                data = self.module.remote_runtimes[pylon_id]
-                pylon_settings = data.get("pylon_settings", {})
-                #
-                if flask.request.args.get("raw", "false") == "true":
-                    config_data = pylon_settings.get("tunable", "")
-                else:
-                    config_data = pylon_settings.get("tunable", "")
-                    if not config_data:
-                        config_data = yaml.dump(pylon_settings) if pylon_settings else ""
-                #
-                return {"config": config_data}
+            data = self.module.remote_runtimes.get(plugin_id, None)
             #
-            return {"config": ""}
+            if data is None:  # Unknown or pruned concurrently
+                return {"config": ""}
+            #
+            pylon_settings = data.get("pylon_settings", {})
+            #
+            if flask.request.args.get("raw", "false") == "true":
+                config_data = pylon_settings.get("tunable", "")
+            else:
+                config_data = pylon_settings.get("tunable", "")
+                if not config_data:
+                    config_data = yaml.dump(pylon_settings) if pylon_settings else ""
+            #
+            return {"config": config_data}
         #
         target_pylon_id, target_plugin = plugin_id.split(":", 1)
         #
-        for pylon_id in list(sorted(self.module.remote_runtimes.keys())):
-            if pylon_id != target_pylon_id:
-                continue
-            #
-            data = self.module.remote_runtimes[pylon_id]
-            runtime_info = data["runtime_info"]
-            #
-            for plugin in sorted(runtime_info, key=lambda x: x["name"]):
-                if plugin["name"] != target_plugin:
-                    continue
-                #
-                if flask.request.args.get("raw", "false") == "true":
-                    config_data = plugin.get("config_data", "")
-                else:
-                    config_data = yaml.dump(plugin.get("config", ""))
-                #
-                return {"config": config_data}
+        plugin = self.module.remote_runtimes.get_plugin(target_pylon_id, target_plugin)
+        #
+        if plugin is None:  # Unknown or pruned concurrently
+            return {"config": ""}
+        #
+        if flask.request.args.get("raw", "false") == "true":
+            config_data = plugin.get("config_data", "")
+        else:
+            config_data = yaml.dump(plugin.get("config", ""))
         #
-        return {"config": ""}
+        return {"config": config_data}
 
     @auth.decorators.check_api(["runtime.plugins"])
     def post(self, plugin_id):
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" API """
+
+import flask  # pylint: disable=E0401,W0611
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+
+from tools import auth  # pylint: disable=E0401
+from tools import api_tools  # pylint: disable=E0401
+
+
+class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
+    """ API """
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def get(self):
+        """ Process GET: all rollouts or one with id=... """
+        rollout_id = flask.request.args.get("id", None)
+        #
+        if rollout_id is not None:
+            rollout = self.module.rollout_manager.get(rollout_id)
+            #
+            if rollout is None:
+                return {"ok": False, "error": "Rollout not found"}, 404
+            #
+            return {"ok": True, "rollout": rollout.to_dict()}
+        #
+        result = [rollout.to_dict() for rollout in self.module.rollout_manager.list()]
+        #
+        return {
+            "total": len(result),
+            "rows": result,
+        }
+
+    @auth.decorators.check_api(["runtime.plugins"])
+    def post(self):
+        """ Process POST: resume or cancel rollout """
+        data = flask.request.get_json()
+        #
+        rollout_id = data.get("id", None)
+        action = data.get("action", None)
+        #
+        if action == "resume":
+            return {"ok": self.module.rollout_manager.resume(rollout_id)}
+        #
+        if action == "cancel":
+            return {"ok": self.module.rollout_manager.cancel(rollout_id)}
+        #
+        return {"ok": False, "error": "Unknown action"}, 400
+
+
+class API(api_tools.APIBase):  # pylint: disable=R0903
+    """ API """
+
+    url_params = [
+        "<string:mode>",
+    ]
+
+    mode_handlers = {
+        'administration': AdminAPI,
+    }
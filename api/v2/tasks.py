@@ -232,6 +232,14 @@ class AdminAPI(api_tools.APIModeHandler):  # pylint: disable=R0903
                 "tasks": self.module.present_admin_tasks_with_descriptions(),
             }
         #
+        # overhead
+        #
+        if action == "overhead":
+            return {
+                "ok": True,
+                "overhead": self.module.admin_task_overhead_stats(),
+            }
+        #
         return {
             "ok": False,
             "error": "unknown action",
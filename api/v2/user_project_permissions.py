@@ -123,14 +123,11 @@ class AdminAPI(api_tools.APIModeHandler):
                         commit=False
                     )
                 session.commit()
-                if append_user_role:
-                    project_users = self.module.get_users_roles_in_project(project_id, filter_system_user=True)
-                    for user_id, user_roles in project_users.items():
-                        if missing_user_roles := set(role_map.keys()) - set(user_roles):
-                            user_roles.extend(missing_user_roles)
-                            self.module.context.rpc_manager.call.update_roles_for_user(
-                                project_id, user_id, user_roles
-                            )
+        if append_user_role:
+            self.module.update_roles_for_users_in_projects(
+                project_ids, None, list(role_map.keys()),
+                append=True, filter_system_user=True,
+            )
         return {'role_map': dict(role_map)}, 200
 
 
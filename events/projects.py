@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+""" Event """
+
+from pylon.core.tools import log, web  # pylint: disable=E0611,E0401,W0611
+
+
+def invalidate_redirect_decisions(module, payload):
+    """ Drop cached redirect decisions of users from membership event payload """
+    user_ids = payload.get("user_ids", None) if isinstance(payload, dict) else None
+    #
+    if not user_ids:
+        module.redirect_decision_cache.invalidate()
+        return
+    #
+    module.redirect_decision_cache.invalidate_users(user_ids)
+
+
+class Event:  # pylint: disable=R0903,E1101
+    """ Event """
+
+    @web.event("user_added_to_project")
+    def _user_added_to_project(self, context, event, payload):
+        _ = context, event
+        #
+        invalidate_redirect_decisions(self, payload)
+
+    @web.event("user_removed_from_project")
+    def _user_removed_from_project(self, context, event, payload):
+        _ = context, event
+        #
+        invalidate_redirect_decisions(self, payload)
+
+    @web.event("admin_project_members_changed")
+    def _admin_project_members_changed(self, context, event, payload):
+        _ = context, event
+        #
+        invalidate_redirect_decisions(self, payload)
@@ -0,0 +1,38 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Event """
+
+from pylon.core.tools import log, web  # pylint: disable=E0611,E0401,W0611
+
+
+class Event:  # pylint: disable=R0903,E1101
+    """ Event """
+
+    @web.event("admin_project_roles_changed")
+    def _admin_project_roles_changed(self, context, event, payload):
+        _ = context, event
+        #
+        if not isinstance(payload, dict):
+            return
+        #
+        if "project_ids" in payload:
+            for project_id in payload["project_ids"]:
+                self.role_map_cache.invalidate(project_id)
+            return
+        #
+        self.role_map_cache.invalidate(payload.get("project_id", None))
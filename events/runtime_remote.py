@@ -17,8 +17,6 @@
 
 """ Event """
 
-import time
-
 from pylon.core.tools import log, web  # pylint: disable=E0611,E0401,W0611
 
 
@@ -37,9 +35,7 @@ class Event:  # pylint: disable=R0903,E1101
         if not pylon_id:
             return
         #
-        data = payload.copy()
-        data["timestamp"] = time.time()
-        self.remote_runtimes[pylon_id] = data
+        self.remote_runtimes.announce(payload)
 
     @web.event("bootstrap_runtime_info_prune")
     def _bootstrap_runtime_info_prune(self, context, event, payload):  # pylint: disable=R0914
@@ -53,4 +49,4 @@ class Event:  # pylint: disable=R0903,E1101
         if not pylon_id:
             return
         #
-        self.remote_runtimes.pop(pylon_id, None)
+        self.remote_runtimes.prune(pylon_id)
@@ -26,6 +26,28 @@ from pylon.core.tools import web  # pylint: disable=E0611,E0401
 from tools import auth  # pylint: disable=E0401
 from tools import theme  # pylint: disable=E0401
 
+from ..utils.redirect_cache import MISSING
+
+
+def is_static_endpoint(endpoint):
+    """ Static files and assets: never redirected """
+    return endpoint is None or endpoint == "static" or endpoint.endswith(".static")
+
+
+def get_redirect_decision(module):
+    """ None (no redirect), "administration", "empty" or "select_project" """
+    user_projects = module.context.rpc_manager.call.list_user_projects(flask.g.auth.id)
+    #
+    if not user_projects:
+        if auth.resolve_permissions(mode='administration'):
+            return "administration"
+        return "empty"
+    #
+    if not module.context.rpc_manager.call.project_get_id():
+        return "select_project"
+    #
+    return None
+
 
 class Method:  # pylint: disable=E1101,R0903
     """
@@ -46,6 +68,9 @@ class Method:  # pylint: disable=E1101,R0903
     def _before_request_hook(  # pylint: disable=R0913
             self,
     ):
+        if is_static_endpoint(request.endpoint):
+            return
+        #
         if flask.g.auth.id == "-":
             return
         #
@@ -82,21 +107,30 @@ class Method:  # pylint: disable=E1101,R0903
         #
         if not project_mode_target or empty_page_target:
             return
-
         #
-        user_projects = self.context.rpc_manager.call.list_user_projects(flask.g.auth.id)
-        user_is_admin = auth.resolve_permissions(mode='administration')
-
-        if user_is_admin and not user_projects:
+        session_key = request.cookies.get(
+            self.context.app.config.get("SESSION_COOKIE_NAME", "session"), ""
+        )
+        #
+        decision = self.redirect_decision_cache.get(flask.g.auth.id, session_key)
+        #
+        if decision is MISSING:
+            decision = get_redirect_decision(self)
+            #
+            # "empty" because of no selected project is resolved by the user
+            # on the empty page, so it is always re-checked
+            if decision != "select_project":
+                self.redirect_decision_cache.put(flask.g.auth.id, session_key, decision)
+        #
+        if decision == "administration":
             return flask.redirect(
                 flask.url_for(
                     "theme.route_mode_section",
                     mode='administration', section='projects'
                 )
             )
-        selected_project = self.context.rpc_manager.call.project_get_id()
         #
-        if not user_projects or not selected_project:
+        if decision in ("empty", "select_project"):
             log.info("--- [REDIRECT] --- Request endpoint: %s", request.endpoint)
             log.info("--- [REDIRECT] --- Request view_args: %s", request.view_args)
             #
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Method """
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+from pylon.core.tools import web  # pylint: disable=E0611,E0401
+
+from ..utils.rollout import RolloutManager
+
+
+class Method:  # pylint: disable=E1101,R0903
+    """
+        Method Resource
+
+        self is pointing to current Module instance
+
+        web.method decorator takes zero or one argument: method name
+        Note: web.method decorator must be the last decorator (at top)
+
+    """
+
+    @web.init()
+    def _rollouts_init(self):
+        self.rollout_manager = RolloutManager(
+            self,
+            settle_time=self.descriptor.config.get("rollout_settle_time", 15),
+            wait_timeout=self.descriptor.config.get("rollout_wait_timeout", 300),
+            poll_interval=self.descriptor.config.get("rollout_poll_interval", 1.0),
+            history_size=self.descriptor.config.get("rollout_history_size", 50),
+        )
+
+    @web.deinit()
+    def _rollouts_deinit(self):
+        self.rollout_manager.stop()
+
+    @web.method()
+    def start_rollout(  # pylint: disable=R0913
+            self, action, events, own_event=None, batch_size=None, batch_percent=None,
+    ):
+        """ Fire bootstrap_runtime_update events in health-gated waves """
+        if batch_size is None and batch_percent is None:
+            batch_size = self.descriptor.config.get("rollout_batch_size", None)
+            batch_percent = self.descriptor.config.get("rollout_batch_percent", 25)
+        #
+        return self.rollout_manager.start(
+            action, events,
+            own_event=own_event,
+            batch_size=batch_size,
+            batch_percent=batch_percent,
+        )
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Method """
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401,W0611
+from pylon.core.tools import web  # pylint: disable=E0611,E0401
+
+from ..utils.runtime_registry import RuntimeHousekeeper
+from ..utils.change_feed import ChangeFeed, TaskStateWatcher
+from ..utils.repo_versions import RepoVersionCache, RepoVersionError, LocalRepoResolver
+from ..utils.plugin_updates import PluginUpdateTracker
+
+
+class Method:  # pylint: disable=E1101,R0903
+    """
+        Method Resource
+
+        self is pointing to current Module instance
+
+        web.method decorator takes zero or one argument: method name
+        Note: web.method decorator must be the last decorator (at top)
+
+    """
+
+    @web.init()
+    def _runtimes_init(self):
+        self.runtime_changes = ChangeFeed(
+            max_size=self.descriptor.config.get("runtime_changes_size", 1000),
+        )
+        self.remote_runtimes.listeners.append(self.runtime_changes.publish)
+        #
+        self.task_state_watcher = TaskStateWatcher(
+            self, self.runtime_changes,
+            interval=self.descriptor.config.get("runtime_changes_task_interval", 2),
+        )
+        self.task_state_watcher.start()
+        #
+        self.runtime_housekeeper = RuntimeHousekeeper(
+            self.remote_runtimes,
+            on_expired=self.runtime_expired,
+            timeout=self.descriptor.config.get("remote_runtime_timeout", 60),
+            interval=self.descriptor.config.get("remote_runtime_housekeeping_interval", 5),
+        )
+        self.runtime_housekeeper.start()
+        #
+        local_versions = self.descriptor.config.get("repo_resolver_versions", None)
+        self.local_repo_resolver = None
+        #
+        if local_versions is not None:
+            self.local_repo_resolver = LocalRepoResolver(local_versions)
+        #
+        self.repo_version_cache = RepoVersionCache(
+            self.get_repo_resolver,
+            ttl=self.descriptor.config.get("repo_version_ttl", 600),
+            error_ttl=self.descriptor.config.get("repo_version_error_ttl", 60),
+            refresh_interval=self.descriptor.config.get("repo_version_refresh_interval", 30),
+            workers=self.descriptor.config.get("repo_version_workers", 8),
+        )
+        self.repo_version_cache.start()
+        #
+        self.plugin_update_tracker = PluginUpdateTracker(
+            self.remote_runtimes,
+            ack_timeout=self.descriptor.config.get("plugin_update_ack_timeout", 300),
+            history_size=self.descriptor.config.get("plugin_update_history_size", 50),
+        )
+        self.remote_runtimes.listeners.append(self.plugin_update_tracker.on_change)
+
+    @web.deinit()
+    def _runtimes_deinit(self):
+        self.runtime_housekeeper.stop()
+        self.task_state_watcher.stop()
+        self.repo_version_cache.stop()
+        self.remote_runtimes.listeners.remove(self.runtime_changes.publish)
+        self.remote_runtimes.listeners.remove(self.plugin_update_tracker.on_change)
+
+    @web.method()
+    def runtime_expired(self, pylon_id, last_seen):
+        """ Called by housekeeper for each pylon that stopped announcing """
+        self.context.event_manager.fire_event(
+            "admin_runtime_expired",
+            {
+                "pylon_id": pylon_id,
+                "last_seen": last_seen,
+            },
+        )
+
+    @web.method()
+    def get_repo_resolver(self):
+        """ Repo resolver: local stand-in (if configured) or bootstrap one """
+        if self.local_repo_resolver is not None:
+            return self.local_repo_resolver
+        #
+        module_manager = self.context.module_manager
+        #
+        if "bootstrap" not in module_manager.modules:
+            raise RepoVersionError("Bootstrap plugin is not installed")
+        #
+        return module_manager.modules["bootstrap"].module.repo_resolver
@@ -19,6 +19,7 @@
 
 import time
 import functools
+import collections
 
 import arbiter
 
@@ -30,6 +31,25 @@ from ..tasks import db_tasks
 from ..tasks import indexer_tasks
 from ..tasks import project_tasks
 from ..tasks import mesh_tasks
+from ..tasks import roles_tasks
+from ..tasks import invite_tasks
+from ..utils.task_metrics import AdminTaskRecorder
+
+
+def _close_log_handler(handler):
+    """ Flush and close task log handler, return time spent """
+    start_ts = time.time()
+    #
+    # logging.Handler contract: flush() returns once buffered records are out
+    try:
+        handler.flush()
+    except:  # pylint: disable=W0702
+        pass
+    #
+    delattr(log.state.local, "handler")
+    handler.close()
+    #
+    return time.time() - start_ts
 
 
 class Method:  # pylint: disable=E1101,R0903
@@ -46,6 +66,13 @@ class Method:  # pylint: disable=E1101,R0903
     @web.init()
     def _tasks_init(self):
         self.admin_tasks = {}  # name -> func
+        self.admin_task_overheads = collections.deque(maxlen=256)  # seconds
+        #
+        self.admin_task_recorder = AdminTaskRecorder(
+            ring_size=self.descriptor.config.get("admin_task_metrics_ring_size", 100),
+            tracing=self.descriptor.config.get("admin_task_tracing", False),
+        )
+        self.admin_task_recorder.start()
         #
         self.event_node = arbiter.make_event_node(
             config={
@@ -78,6 +105,7 @@ class Method:  # pylint: disable=E1101,R0903
             ("create_tables_for_failed", db_tasks.create_tables_for_failed),
             ("propose_migrations", db_tasks.propose_migrations),
             ("create_database", db_tasks.create_database),
+            ("migration_db", db_tasks.migration_db),
             #
             ("indexer_migrate", indexer_tasks.indexer_migrate),
             #
@@ -88,6 +116,10 @@ class Method:  # pylint: disable=E1101,R0903
             ("recreate_project_tokens", project_tasks.recreate_project_tokens),
             ("delete_ghost_users", project_tasks.delete_ghost_users),
             #
+            ("migrate_roles", roles_tasks.migrate_roles),
+            #
+            ("invite_bulk_users", invite_tasks.invite_bulk_users),
+            #
             ("mesh_get_plugin_frozen_requirements", mesh_tasks.mesh_get_plugin_frozen_requirements),
         ]
         #
@@ -117,19 +149,27 @@ class Method:  # pylint: disable=E1101,R0903
         #
         self.task_node.unregister_task(partial_func, name)
 
-    @staticmethod
-    def _get_tracer():
-        """ Get OpenTelemetry tracer if tracing is enabled """
+    @web.method()
+    def admin_task_overhead_stats(self):
+        """ Start-to-end overhead of admin tasks (setup + log flush), in seconds """
+        values = sorted(self.admin_task_overheads)
         #
-        # NOTE: tracing calls (this.for_module, get_tracer) deadlock in task
-        # threads due to gevent cooperative scheduling and internal locks.
-        # Disabled for now; admin task auditing will use a different approach.
+        if not values:
+            return {"count": 0}
         #
-        return None
+        return {
+            "count": len(values),
+            "avg": sum(values) / len(values),
+            "p50": values[len(values) // 2],
+            "p95": values[min(int(len(values) * 0.95), len(values) - 1)],
+            "max": values[-1],
+            "last": self.admin_task_overheads[-1],
+        }
 
     @web.method()
     def execute_admin_task(self, func, *args, **kwargs):
         """ Method """
+        entry_ts = time.time()
         #
         # Extract audit context (injected by API handler)
         #
@@ -137,7 +177,7 @@ class Method:  # pylint: disable=E1101,R0903
         #
         handler = None
         task_id = None
-        task_name = "unknown"
+        task_name = getattr(func, "__name__", "unknown")
         #
         try:
             event_node_config = context.module_manager.descriptors[
@@ -147,7 +187,7 @@ class Method:  # pylint: disable=E1101,R0903
             import tasknode_task  # pylint: disable=E0401,C0415
             #
             task_id = tasknode_task.id
-            task_name = getattr(tasknode_task, 'name', 'unknown')
+            task_name = getattr(tasknode_task, 'name', task_name)
             #
             handler = EventNodeLogHandler({
                 "event_node": event_node_config,
@@ -164,53 +204,36 @@ class Method:  # pylint: disable=E1101,R0903
         #
         log.info("Starting")
         start_ts = time.time()
+        status = "error"
+        error = None
         #
         try:
-            return func(*args, **kwargs)
-        except:  # pylint: disable=W0702
+            result = func(*args, **kwargs)
+            status = "ok"
+            return result
+        except BaseException as exc:  # pylint: disable=W0703
             log.exception("Got exception, stopping")
+            error = str(exc)
             raise
         #
         finally:
             end_ts = time.time()
             log.info("Exiting (duration = %s)", end_ts - start_ts)
             #
+            self.admin_task_recorder.record(
+                task_name, task_id, user_id, kwargs, status, start_ts, end_ts, error,
+            )
+            #
+            flush_duration = 0.0
             if handler is not None:
-                # Allow time for the EventNode to flush buffered log
-                # messages through Redis before closing the connection
-                time.sleep(0.5)
-                delattr(log.state.local, "handler")
-                handler.close()
-
-    def _execute_traced(self, tracer, func, args, kwargs,
-                        task_name, task_id, user_id, start_ts):
-        """ Execute task function with OTEL tracing span """
-        from opentelemetry.trace import SpanKind, Status, StatusCode  # pylint: disable=C0415
-        #
-        attributes = {
-            'telemetry.data_type': 'admin_task_execution',
-            'task.name': task_name or 'unknown',
-            'task.id': task_id or '',
-        }
-        if user_id is not None:
-            attributes['user.id'] = user_id
-        #
-        with tracer.start_as_current_span(
-            f"Admin Task: {task_name}",
-            kind=SpanKind.INTERNAL,
-            attributes=attributes,
-        ) as span:
-            try:
-                result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_ts) * 1000
-                span.set_attribute('task.duration_ms', duration_ms)
-                span.set_status(Status(StatusCode.OK))
-                return result
-            except Exception as exc:
-                duration_ms = (time.time() - start_ts) * 1000
-                span.set_attribute('task.duration_ms', duration_ms)
-                span.set_status(Status(StatusCode.ERROR, str(exc)))
-                raise
+                flush_duration = _close_log_handler(handler)
+            #
+            overhead = (start_ts - entry_ts) + (time.time() - end_ts)
+            self.admin_task_overheads.append(overhead)
+            log.debug(
+                "Task %s (%s) overhead: %.3fs (log flush %.3fs)",
+                task_name, task_id, overhead, flush_duration,
+            )
 
     @web.method()
     def present_admin_tasks(self):
@@ -259,9 +282,15 @@ class Method:  # pylint: disable=E1101,R0903
             result.append({"name": name, "description": description})
         return result
 
+    @web.method()
+    def admin_task_metrics(self, task_name=None, limit=None):
+        """ Recent admin task runs (duration, status, user, params) per task name """
+        return self.admin_task_recorder.snapshot(task_name, limit)
+
     @web.deinit()
     def _tasks_deinit(self):
         for task_name, task_func in list(self.admin_tasks.items()):
             self.unregister_admin_task(task_name, task_func)
         #
         self.task_node.stop()
+        self.admin_task_recorder.stop()
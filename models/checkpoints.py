@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, String, DateTime, UniqueConstraint, func
+
+from tools import db, config as c
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class RunCheckpoint(db.Base):
+    __tablename__ = 'admin_run_checkpoint'
+    __table_args__ = (
+        UniqueConstraint('run_key', 'project_id', name='_admin_run_checkpoint_uc'),
+        {'schema': c.POSTGRES_SCHEMA},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    run_key: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
+    project_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
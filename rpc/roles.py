@@ -2,14 +2,193 @@ from collections import defaultdict
 from typing import Optional, List
 
 from flask import g
+from sqlalchemy import text
 
 from tools import rpc_tools, db, db_tools, auth
+from tools import constants as c
 
 from pylon.core.tools import web, log
 
 
+PROJECT_ROLE_TABLE = "auth_core__project_role"
+PROJECT_USER_ROLE_TABLE = "auth_core__project_user_role"
+ROLE_TABLE = "auth_core__role"
+USER_ROLE_TABLE = "auth_core__user_role"
+WRITE_BATCH_SIZE = 1000
+
+
+def _select_project_roles(project_ids: list[int]) -> dict[int, list[dict]]:
+    """ Read roles for several projects in one query: all role table columns per role """
+    result = {project_id: [] for project_id in project_ids}
+    if not project_ids:
+        return result
+    #
+    with db.get_session(None) as session:
+        rows = session.execute(
+            text(
+                f'SELECT * FROM {c.POSTGRES_SCHEMA}.{PROJECT_ROLE_TABLE} '
+                'WHERE project_id = ANY(:project_ids)'
+            ),
+            {"project_ids": list(project_ids)},
+        ).mappings().all()
+    #
+    for row in rows:
+        result[row["project_id"]].append(dict(row))
+    return result
+
+
+def load_project_roles(project_ids: list[int]) -> dict[int, list[dict]]:
+    """ Role cache loader: one query, same full role rows for any project count """
+    return _select_project_roles(project_ids)
+
+
+def _select_project_user_roles(
+        project_ids: list[int], user_ids: Optional[list[int]] = None,
+) -> list[tuple[int, int, int]]:
+    """ Read (project_id, user_id, role_id) assignments for several projects in one query """
+    if not project_ids:
+        return []
+    #
+    query = f'SELECT project_id, user_id, role_id FROM {c.POSTGRES_SCHEMA}.{PROJECT_USER_ROLE_TABLE} ' \
+            'WHERE project_id = ANY(:project_ids)'
+    params = {"project_ids": list(project_ids)}
+    #
+    if user_ids is not None:
+        query += ' AND user_id = ANY(:user_ids)'
+        params["user_ids"] = list(user_ids)
+    #
+    with db.get_session(None) as session:
+        rows = session.execute(text(query), params).fetchall()
+    #
+    return [tuple(row) for row in rows]
+
+
+def _unnest_params(rows: list[tuple[int, int, int]]) -> dict[str, list[int]]:
+    """ (project_id, user_id, role_id) rows -> column arrays for unnest() """
+    return {
+        "project_ids": [row[0] for row in rows],
+        "user_ids": [row[1] for row in rows],
+        "role_ids": [row[2] for row in rows],
+    }
+
+
+def _write_project_user_roles(
+        to_add: list[tuple[int, int, int]], to_remove: list[tuple[int, int, int]],
+) -> None:
+    """
+        Apply (project_id, user_id, role_id) assignment changes in one transaction
+
+        Rows are sent as arrays, WRITE_BATCH_SIZE rows per statement. Writes the
+        auth_core table directly: auth.update_project_user_roles side effects are
+        skipped, so only used with role_assignment_direct_sql enabled
+    """
+    if not to_add and not to_remove:
+        return
+    #
+    table = f'{c.POSTGRES_SCHEMA}.{PROJECT_USER_ROLE_TABLE}'
+    rows = 'unnest(CAST(:project_ids AS integer[]), CAST(:user_ids AS integer[]), ' \
+           'CAST(:role_ids AS integer[])) AS v(project_id, user_id, role_id)'
+    #
+    with db.get_session(None) as session:
+        for idx in range(0, len(to_remove), WRITE_BATCH_SIZE):
+            session.execute(
+                text(
+                    f'DELETE FROM {table} existing USING {rows} '
+                    'WHERE existing.project_id = v.project_id '
+                    'AND existing.user_id = v.user_id AND existing.role_id = v.role_id'
+                ),
+                _unnest_params(to_remove[idx:idx + WRITE_BATCH_SIZE]),
+            )
+        #
+        for idx in range(0, len(to_add), WRITE_BATCH_SIZE):
+            session.execute(
+                text(
+                    f'INSERT INTO {table} (project_id, user_id, role_id) '
+                    f'SELECT v.project_id, v.user_id, v.role_id FROM {rows} '
+                    f'WHERE NOT EXISTS (SELECT 1 FROM {table} existing '
+                    'WHERE existing.project_id = v.project_id '
+                    'AND existing.user_id = v.user_id AND existing.role_id = v.role_id)'
+                ),
+                _unnest_params(to_add[idx:idx + WRITE_BATCH_SIZE]),
+            )
+        #
+        session.commit()
+
+
+def _select_system_user_ids(project_ids: list[int], user_ids: set[int]) -> dict[int, int]:
+    """ Find project system users among user_ids with one auth call: project_id -> user_id """
+    from tools import project_constants as pc  # pylint: disable=E0401,C0415
+    #
+    if not user_ids:
+        return {}
+    #
+    system_emails = {
+        pc['PROJECT_USER_EMAIL_TEMPLATE'].format(project_id): project_id
+        for project_id in project_ids
+    }
+    #
+    result = {}
+    for user in auth.list_users(user_ids=user_ids):
+        project_id = system_emails.get(user.get('email'))
+        if project_id is not None:
+            result[project_id] = int(user['id'])
+    return result
+
+
+def _select_users_mode_roles(mode_keys: list[str]) -> list[tuple[int, str, str]]:
+    """ Read (user_id, mode, role_name) assignments for several modes in one query """
+    if not mode_keys:
+        return []
+    #
+    with db.get_session(None) as session:
+        rows = session.execute(
+            text(
+                f'SELECT ur.user_id, r.mode, r.name FROM {c.POSTGRES_SCHEMA}.{USER_ROLE_TABLE} ur '
+                f'JOIN {c.POSTGRES_SCHEMA}.{ROLE_TABLE} r ON r.id = ur.role_id '
+                'WHERE r.mode = ANY(:mode_keys) '
+                'ORDER BY r.mode, ur.user_id, r.name'
+            ),
+            {"mode_keys": list(mode_keys)},
+        ).fetchall()
+    #
+    return [tuple(row) for row in rows]
+
+
+def _get_role_maps(module, project_ids) -> dict[int, dict[int, str]]:
+    """ role_id -> name maps for several projects, served from the role cache """
+    return {
+        project_id: {r['id']: r['name'] for r in roles}
+        for project_id, roles in module.role_map_cache.get_many(project_ids).items()
+    }
+
+
+def _invalidate_role_map(module, project_id: int) -> None:
+    """ Drop cached roles locally and tell other pylons to do the same """
+    module.role_map_cache.invalidate(project_id)
+    module.context.event_manager.fire_event(
+        "admin_project_roles_changed", {"project_id": int(project_id)},
+    )
+
+
+def _invalidate_members(module, changes: dict) -> None:
+    """ Drop cached redirect decisions locally and tell other pylons: project_id -> {user_id, ...} """
+    for project_id, user_ids in changes.items():
+        if not user_ids:
+            continue
+        #
+        user_ids = sorted(user_ids)
+        module.redirect_decision_cache.invalidate_users(user_ids)
+        module.context.event_manager.fire_event(
+            "admin_project_members_changed", {"project_id": int(project_id), "user_ids": user_ids},
+        )
+
+
 class RPC:
 
+    @web.rpc("admin_get_role_map_cache_stats", "get_role_map_cache_stats")
+    def get_role_map_cache_stats(self, **kwargs) -> dict:
+        return self.role_map_cache.stats()
+
     #
     # project_role
     #
@@ -28,11 +207,13 @@ class RPC:
         for role_name in role_names:
             role_id = auth.add_project_role(project_id, role_name)
             last_role = auth.get_project_role(project_id, id_=role_id)
+        _invalidate_role_map(self, project_id)
         return last_role
 
     @web.rpc("admin_delete_role", "delete_role")
     def delete_role(self, project_id: int, role_name: str, **kwargs) -> bool:
         auth.delete_project_role(project_id, name=role_name)
+        _invalidate_role_map(self, project_id)
         return True
 
     @web.rpc("admin_update_role_name", "update_role_name")
@@ -40,6 +221,7 @@ class RPC:
         role = auth.get_project_role(project_id, name=role_name)
         if role:
             auth.update_project_role(project_id, role['id'], new_role_name)
+            _invalidate_role_map(self, project_id)
         return True
 
     #
@@ -92,16 +274,21 @@ class RPC:
     def add_user_to_project(self, project_id: int, user_id: int, role_names: list[str], **kwargs) -> bool:
         user_roles = auth.list_project_user_roles(project_id, user_id)
         existing_role_ids = {r['role_id'] for r in user_roles}
+        added = False
         for role_name in role_names:
             role = auth.get_project_role(project_id, name=role_name)
             if role and role['id'] not in existing_role_ids:
                 auth.add_project_user_role(project_id, user_id, role['id'])
+                added = True
+        if added and not existing_role_ids:
+            _invalidate_members(self, {project_id: {user_id}})
         return True
 
     @web.rpc("admin_remove_users_from_project", "remove_users_from_project")
     def remove_users_from_project(self, project_id: int, user_ids: list[int], **kwargs) -> bool:
         for user_id in user_ids:
             auth.update_project_user_roles(project_id, user_id, [])
+        _invalidate_members(self, {project_id: set(user_ids)})
         return True
 
     @web.rpc("admin_get_permissions_in_project", "get_permissions_in_project")
@@ -120,8 +307,7 @@ class RPC:
     @web.rpc("admin_get_users_roles_in_project", "get_users_roles_in_project")
     def get_users_roles_in_project(self, project_id: int, filter_system_user: bool = False, **kwargs) -> dict[list]:
         user_roles_data = auth.list_project_user_roles(project_id)
-        roles_data = auth.list_project_roles(project_id)
-        role_map = {r['id']: r['name'] for r in roles_data}
+        role_map = self.role_map_cache.get_role_map(project_id)
 
         user_roles = defaultdict(list)
         for ur in user_roles_data:
@@ -134,17 +320,160 @@ class RPC:
                 del user_roles[int(system_user['id'])]
         return user_roles
 
+    @web.rpc("admin_get_users_roles_in_projects", "get_users_roles_in_projects")
+    def get_users_roles_in_projects(
+            self, project_ids: list[int], filter_system_user: bool = False, **kwargs
+    ) -> dict[int, dict[int, list[str]]]:
+        """ Bulk variant of get_users_roles_in_project: project_id -> user_id -> role names """
+        project_ids = list({int(project_id) for project_id in project_ids})
+        role_maps = _get_role_maps(self, project_ids)
+        #
+        result = {project_id: defaultdict(list) for project_id in project_ids}
+        for project_id, user_id, role_id in _select_project_user_roles(project_ids):
+            role_name = role_maps[project_id].get(role_id)
+            if role_name is not None:
+                result[project_id][user_id].append(role_name)
+        #
+        if filter_system_user:
+            all_user_ids = {user_id for users in result.values() for user_id in users}
+            for project_id, user_id in _select_system_user_ids(project_ids, all_user_ids).items():
+                result[project_id].pop(user_id, None)
+        return result
+
+    @web.rpc("admin_get_users_roles_in_modes", "get_users_roles_in_modes")
+    def get_users_roles_in_modes(self, mode_keys: List[str]) -> list[dict]:
+        """ All (user_id, mode, role) assignments in given modes, one query """
+        return [
+            {"user_id": user_id, "mode": mode, "role": role}
+            for user_id, mode, role in _select_users_mode_roles(mode_keys)
+        ]
+
+    @web.rpc("admin_get_roles_in_projects", "get_roles_in_projects")
+    def get_roles_in_projects(self, project_ids: list[int], **kwargs) -> dict[int, list[dict]]:
+        """ Bulk variant of get_roles: project_id -> roles """
+        project_ids = list({int(project_id) for project_id in project_ids})
+        return self.role_map_cache.get_many(project_ids)
+
+    @web.rpc("admin_get_user_roles_in_projects", "get_user_roles_in_projects")
+    def get_user_roles_in_projects(self, project_ids: list[int], user_id: int, **kwargs) -> dict[int, list[dict]]:
+        """ Bulk variant of get_user_roles: project_id -> roles held by user_id """
+        project_ids = list({int(project_id) for project_id in project_ids})
+        role_maps = _get_role_maps(self, project_ids)
+        #
+        result = {project_id: [] for project_id in project_ids}
+        for project_id, _, role_id in _select_project_user_roles(project_ids, [user_id]):
+            if role_id in role_maps[project_id]:
+                result[project_id].append({"id": role_id, "name": role_maps[project_id][role_id]})
+        return result
+
+    @web.rpc("admin_check_user_is_admin_in_projects", "check_user_is_admin_in_projects")
+    def check_user_is_admin_in_projects(self, project_ids: list[int], user_id: int, **kwargs) -> list[int]:
+        """ Bulk variant of check_user_is_admin: IDs of projects where user_id is an admin """
+        return [
+            project_id
+            for project_id, roles in self.get_user_roles_in_projects(project_ids, user_id).items()
+            if any('admin' in role['name'].lower() for role in roles)
+        ]
+
+    @web.rpc("admin_update_roles_for_users_in_projects", "update_roles_for_users_in_projects")
+    def update_roles_for_users_in_projects(
+            self, project_ids: list[int], user_ids: Optional[List[int]], new_roles: List[str],
+            append: bool = False, filter_system_user: bool = False,
+            dry_run: bool = False, details: bool = False, **kwargs
+    ) -> dict[int, dict]:
+        """
+            Bulk variant of update_roles_for_user
+
+            Sets (or, with append, adds) new_roles for user_ids in every project, using
+            a fixed number of queries. user_ids=None targets current project members.
+            Returns project_id -> {"added": N, "removed": N}
+
+            With details, result also has "users": user_id -> {"added": [...], "removed": [...]}
+            (role names) for changed users only and "missing_roles": new_roles not found
+            in the project. With dry_run, nothing is written.
+        """
+        project_ids = list({int(project_id) for project_id in project_ids})
+        if user_ids is not None:
+            user_ids = list({int(user_id) for user_id in user_ids})
+        #
+        role_maps = _get_role_maps(self, project_ids)
+        #
+        current = defaultdict(set)
+        members = defaultdict(set)
+        for project_id, user_id, role_id in _select_project_user_roles(project_ids, user_ids):
+            current[(project_id, user_id)].add(role_id)
+            members[project_id].add(user_id)
+        #
+        if filter_system_user:
+            all_user_ids = set(user_ids) if user_ids is not None else \
+                {user_id for users in members.values() for user_id in users}
+            system_users = _select_system_user_ids(project_ids, all_user_ids)
+        else:
+            system_users = {}
+        #
+        to_add = []
+        to_remove = []
+        updates = []  # (project_id, user_id, role_ids) of changed users
+        membership = defaultdict(set)  # project_id -> users who joined or left
+        result = {}
+        #
+        for project_id in project_ids:
+            target_role_ids = {
+                role_id for role_id, name in role_maps[project_id].items()
+                if name in new_roles
+            }
+            target_user_ids = user_ids if user_ids is not None else members[project_id]
+            added = removed = 0
+            changed_users = {}
+            #
+            for user_id in target_user_ids:
+                if system_users.get(project_id) == user_id:
+                    continue
+                #
+                have = current[(project_id, user_id)]
+                want = have | target_role_ids if append else target_role_ids
+                #
+                for role_id in want - have:
+                    to_add.append((project_id, user_id, role_id))
+                    added += 1
+                for role_id in have - want:
+                    to_remove.append((project_id, user_id, role_id))
+                    removed += 1
+                #
+                if want != have:
+                    updates.append((project_id, user_id, sorted(want)))
+                #
+                if bool(want) != bool(have):
+                    membership[project_id].add(user_id)
+                #
+                if details and want != have:
+                    role_map = role_maps[project_id]
+                    changed_users[user_id] = {
+                        "added": sorted(role_map.get(r, str(r)) for r in want - have),
+                        "removed": sorted(role_map.get(r, str(r)) for r in have - want),
+                    }
+            #
+            result[project_id] = {"added": added, "removed": removed}
+            if details:
+                result[project_id]["users"] = changed_users
+                result[project_id]["missing_roles"] = sorted(
+                    set(new_roles) - set(role_maps[project_id].values())
+                )
+        #
+        if not dry_run:
+            if self.descriptor.config.get("role_assignment_direct_sql", False):
+                # Batched, but bypasses any auth_core side effects / caches
+                _write_project_user_roles(to_add, to_remove)
+            else:
+                # auth has no bulk user role write: one call per changed user, unchanged users are skipped
+                for project_id, user_id, role_ids in updates:
+                    auth.update_project_user_roles(project_id, user_id, role_ids)
+            _invalidate_members(self, membership)
+        return result
+
     @web.rpc("update_roles_for_user", "admin_update_roles_for_user")
     def update_roles_for_user(self, project_id: int, user_ids: List[int], new_roles: List[str], **kwargs) -> bool:
-        roles_data = auth.list_project_roles(project_id)
-        role_name_map = {r['name']: r['id'] for r in roles_data}
-        target_role_ids = []
-        for name in new_roles:
-            if name in role_name_map:
-                target_role_ids.append(role_name_map[name])
-
-        for user_id in user_ids:
-            auth.update_project_user_roles(project_id, user_id, target_role_ids)
+        self.update_roles_for_users_in_projects([project_id], user_ids, new_roles)
         return True
 
     @web.rpc("admin_get_user_roles", "get_user_roles")
@@ -152,14 +481,14 @@ class RPC:
         assert project_id is not None, 'project_id cannot be None'
         user_roles_data = auth.list_project_user_roles(project_id, user_id)
         my_role_ids = {ur['role_id'] for ur in user_roles_data}
-        roles_data = auth.list_project_roles(project_id)
+        roles_data = self.role_map_cache.get(project_id)
         return [r for r in roles_data if r['id'] in my_role_ids]
 
     @web.rpc("admin_check_user_is_admin", "check_user_is_admin")
     def check_user_is_admin(self, project_id: int, user_id: int) -> bool:
         user_roles_data = auth.list_project_user_roles(project_id, user_id)
         my_role_ids = {ur['role_id'] for ur in user_roles_data}
-        roles_data = auth.list_project_roles(project_id)
+        roles_data = self.role_map_cache.get(project_id)
         for r in roles_data:
             if r['id'] in my_role_ids and 'admin' in r['name'].lower():
                 return True
@@ -5,6 +5,7 @@ $("#btn-add-user-to-selected").click(function() {
       user_id: $("#input-user-id").val(),
       roles: $("#input-roles").val(),
       projects: $("#table").bootstrapTable("getSelections"),
+      dry_run: $("#input-dry-run").is(":checked"),
     })
     .then(function (response) {
       showNotify("SUCCESS", "Action performed")
@@ -1,13 +1,38 @@
+var invites_bulkusers_task_id = null;
+
+
+function invites_bulkusers_subscribe(task_id) {
+  if (invites_bulkusers_task_id !== null) {
+    window.socket.emit("task_logs_unsubscribe", {"tasknode_task": "id:" + invites_bulkusers_task_id});
+  }
+  //
+  invites_bulkusers_task_id = task_id;
+  window.socket.emit("task_logs_subscribe", {"tasknode_task": "id:" + task_id});
+}
+
+
+$(document).on("vue_init", () => {
+  window.socket.on("log_data", (data) => {
+    data.forEach((item) => {
+      $("#textarea-logs").val(
+        $("#textarea-logs").val() + item.line + "\n"
+      );
+    });
+  });
+});
+
+
 $("#btn-add-all-users").click(function() {
   $("#textarea-logs").val("");
   //
   axios.post(invites_bulkusers_api_url, {
       project_id: $("#input-project-id").val(),
       roles: $("#input-roles").val(),
+      dry_run: $("#input-dry-run").is(":checked"),
     })
     .then(function (response) {
-      showNotify("SUCCESS", "Action performed")
-      $("#textarea-logs").val(response.data.logs);
+      showNotify("SUCCESS", "Task started")
+      invites_bulkusers_subscribe(response.data.task_id);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during action")
@@ -1,20 +1,43 @@
+var migration_db_task_id = null;
+
+
 $("#btn-execute").click(function() {
   $("#textarea-logs").val("");
   //
   axios.post(migration_db_api_url, {
       sqls: $("#textarea-sqls").val(),
       exceptions: $("#textarea-exceptions").val(),
+      workers: parseInt($("#input-workers").val()) || 4,
+      resume: $("#checkbox-resume").is(":checked"),
     })
     .then(function (response) {
-      if (response.data.ok) {
-        showNotify("SUCCESS", "Action performed")
-      } else {
-        showNotify("WARNING", "Action performed with warnings")
+      if (!response.data.ok) {
+        showNotify("ERROR", response.data.error);
+        return;
       }
-      $("#textarea-logs").val(response.data.logs);
+      //
+      showNotify("SUCCESS", "Migration task started");
+      //
+      if (migration_db_task_id !== null) {
+        window.socket.emit("task_logs_unsubscribe", {"tasknode_task": "id:" + migration_db_task_id});
+      }
+      //
+      migration_db_task_id = response.data.task_id;
+      window.socket.emit("task_logs_subscribe", {"tasknode_task": "id:" + migration_db_task_id});
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during action")
       console.log(error);
     });
 });
+
+
+$(document).on("vue_init", () => {
+  window.socket.on("log_data", (data) => {
+    data.forEach((item) => {
+      $("#textarea-logs").val(
+        $("#textarea-logs").val() + item.line + "\n"
+      );
+    });
+  });
+});
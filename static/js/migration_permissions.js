@@ -3,6 +3,8 @@ $("#btn-add-user-project-defaults").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_user_project_defaults",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       concurrent_tasks: $("#concurrent-tasks").val(),
   })
     .then(function (response) {
@@ -20,6 +22,8 @@ $("#btn-add-team-project-defaults").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_team_project_defaults",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       concurrent_tasks: $("#concurrent-tasks").val(),
   })
     .then(function (response) {
@@ -37,6 +41,8 @@ $("#btn-add-public-project-defaults").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_public_project_defaults",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       concurrent_tasks: $("#concurrent-tasks").val(),
   })
     .then(function (response) {
@@ -54,6 +60,8 @@ $("#btn-add-user-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_user_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
@@ -72,6 +80,8 @@ $("#btn-add-team-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_team_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
@@ -90,6 +100,8 @@ $("#btn-add-public-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "add_public_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
@@ -108,6 +120,8 @@ $("#btn-delete-user-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "delete_user_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
@@ -126,6 +140,8 @@ $("#btn-delete-team-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "delete_team_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
@@ -144,6 +160,8 @@ $("#btn-delete-public-project-permissions").click(function() {
   //
   axios.post(migration_permissions_api_url, {
       mode: "delete_public_project_permissions",
+      dry_run: $("#input-dry-run").is(":checked"),
+      global: $("#input-global").is(":checked"),
       permissions: $("#textarea-permissions").val(),
       concurrent_tasks: $("#concurrent-tasks").val(),
     })
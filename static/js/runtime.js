@@ -80,3 +80,30 @@ window.actionsEvents = {
       });
   }
 }
+
+
+$("#table").on("load-success.bs.table", function (e, data) {
+  axios.get(plugin_versions_api_url)
+    .then(function (response) {
+      if (!response.data.ok) {
+        return;
+      }
+      //
+      var rows = $("#table").bootstrapTable("getData");
+      //
+      for (var idx = 0; idx < rows.length; idx++) {
+        var item = response.data.versions[rows[idx].name];
+        //
+        if (item && item.version) {
+          $("#table").bootstrapTable("updateCell", {
+            index: idx,
+            field: "repo_version",
+            value: item.version
+          });
+        }
+      }
+    })
+    .catch(function (error) {
+      console.log(error);
+    });
+});
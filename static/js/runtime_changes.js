@@ -0,0 +1,30 @@
+function subscribeRuntimeChanges(url, kinds, callback) {
+  if (typeof(EventSource) === "undefined") {
+    return null;
+  }
+  //
+  var source = new EventSource(url + "?stream=true");
+  var timer = null;
+  //
+  var schedule = function () {
+    if (timer !== null) {
+      return;
+    }
+    //
+    timer = setTimeout(function () {
+      timer = null;
+      callback();
+    }, 1000);
+  };
+  //
+  source.addEventListener("reset", schedule);
+  source.onmessage = function (e) {
+    var change = JSON.parse(e.data);
+    //
+    if (kinds.indexOf(change.kind) !== -1) {
+      schedule();
+    }
+  };
+  //
+  return source;
+}
@@ -220,3 +220,12 @@ window.pylonsActionsEvents = {
     $("#modal-pylon-splash").modal("show");
   }
 }
+
+
+subscribeRuntimeChanges(
+  changes_api_url,
+  ["pylon_added", "pylon_removed"],
+  function () {
+    $("#table").bootstrapTable("refresh", {silent: true});
+  }
+);
@@ -4,6 +4,7 @@ $("#btn-update").click(function() {
   axios.post(remote_api_url, {data: data, action: "update"})
     .then(function (response) {
       showNotify("SUCCESS", "Update and restart requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during update and restart request")
@@ -18,6 +19,7 @@ $("#btn-update-with-reqs").click(function() {
   axios.post(remote_api_url, {data: data, action: "update_with_reqs"})
     .then(function (response) {
       showNotify("SUCCESS", "Update and restart requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during update and restart request")
@@ -32,6 +34,7 @@ $("#btn-purge-reqs").click(function() {
   axios.post(remote_api_url, {data: data, action: "purge_reqs"})
     .then(function (response) {
       showNotify("SUCCESS", "Purge and restart requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during purge and restart request")
@@ -46,6 +49,7 @@ $("#btn-delete").click(function() {
   axios.post(remote_api_url, {data: data, action: "delete"})
     .then(function (response) {
       showNotify("SUCCESS", "Deletion and restart requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during deletion and restart request")
@@ -68,6 +72,7 @@ $("#btn-reload").click(function() {
   axios.post(remote_api_url, {data: data, action: "reload"})
     .then(function (response) {
       showNotify("SUCCESS", "Reload requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during reload request")
@@ -102,6 +107,7 @@ $("#btn-manual").click(function() {
   axios.post(remote_api_url, {data: result})
     .then(function (response) {
       showNotify("SUCCESS", "Update and restart requested")
+      trackRollout(response.data);
     })
     .catch(function (error) {
       showNotify("ERROR", "Error during update and restart request")
@@ -200,3 +206,107 @@ window.editConfigActionsEvents = {
     $("#modal-edit-config").modal("show");
   }
 }
+
+
+subscribeRuntimeChanges(
+  changes_api_url,
+  ["pylon_added", "pylon_removed", "plugin_added", "plugin_changed", "plugin_removed"],
+  function () {
+    // Keep user selection intact: refresh only when nothing is selected
+    if ($("#table").bootstrapTable("getSelections").length === 0) {
+      $("#table").bootstrapTable("refresh", {silent: true});
+    }
+  }
+);
+
+
+function rolloutStatusText(rollout) {
+  var text = rollout.action + ": " + rollout.status +
+    " (waves " + rollout.done_waves + "/" + rollout.total_waves +
+    ", pylons " + rollout.total_pylons + ")";
+  //
+  if (rollout.error) {
+    text += " - " + rollout.error;
+  }
+  //
+  return text;
+}
+
+
+function showRollout(rollout) {
+  $("#rollout-status").text(rolloutStatusText(rollout));
+  $("#btn-rollout-resume").toggle(rollout.status === "paused");
+  $("#btn-rollout-cancel").toggle(["pending", "running", "paused"].includes(rollout.status));
+  $("#row-rollout").show();
+}
+
+
+function scheduleRolloutPoll() {
+  clearTimeout(rollout_poll_timer);
+  rollout_poll_timer = setTimeout(pollRollout, 2000);
+}
+
+
+function pollRollout() {
+  if (rollout_id === null) {
+    return;
+  }
+  //
+  var polled_id = rollout_id;
+  //
+  axios.get(rollouts_api_url, {params: {id: polled_id}})
+    .then(function (response) {
+      if (polled_id !== rollout_id) {
+        return;
+      }
+      //
+      var rollout = response.data.rollout;
+      showRollout(rollout);
+      //
+      if (["pending", "running", "paused"].includes(rollout.status)) {
+        scheduleRolloutPoll();
+      }
+    })
+    .catch(function (error) {
+      console.log(error);
+    });
+}
+
+
+function trackRollout(data) {
+  if (!data || !data.rollout) {
+    return;
+  }
+  //
+  rollout_id = data.rollout.id;
+  showRollout(data.rollout);
+  scheduleRolloutPoll();
+}
+
+
+function rolloutAction(action, message) {
+  axios.post(rollouts_api_url, {id: rollout_id, action: action})
+    .then(function (response) {
+      if (response.data.ok) {
+        showNotify("SUCCESS", message)
+      } else {
+        showNotify("ERROR", "Rollout is not in a state to " + action)
+      }
+      //
+      pollRollout();
+    })
+    .catch(function (error) {
+      showNotify("ERROR", "Error during rollout " + action + " request")
+      console.log(error);
+    });
+}
+
+
+$("#btn-rollout-resume").click(function() {
+  rolloutAction("resume", "Rollout resume requested");
+});
+
+
+$("#btn-rollout-cancel").click(function() {
+  rolloutAction("cancel", "Rollout cancel requested");
+});
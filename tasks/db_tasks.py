@@ -19,10 +19,14 @@
 
 import io
 import time
+import hashlib
+import functools
 
 from tools import context  # pylint: disable=E0401
 
 from .logs import make_logger
+from ..utils.db_workers import make_pooled_engine, run_parallel
+from ..utils.checkpoints import load_checkpoint, save_checkpoint, clear_checkpoint
 
 
 def create_database(*args, **kwargs):
@@ -72,8 +76,121 @@ def create_database(*args, **kwargs):
         log.info("Exiting (duration = %s)", end_ts - start_ts)
 
 
+def _parse_sync_param(param):
+    """ Parse 'workers=N' and 'force' flags from task param """
+    workers = None
+    force = False
+    #
+    for item in (param or "").split():
+        if item == "force":
+            force = True
+        elif item.startswith("workers="):
+            workers = int(item.split("=", 1)[1])
+    #
+    return workers, force
+
+
+def _create_tenant_tables(engine, tenant_metadata, schema):
+    """ create_all for one project on a worker connection, return duration """
+    from tools import config as c  # pylint: disable=C0415,E0401
+    #
+    start_ts = time.time()
+    #
+    with engine.connect() as connection:
+        connection = connection.execution_options(
+            schema_translate_map={c.POSTGRES_TENANT_SCHEMA: schema},
+        )
+        tenant_metadata.create_all(bind=connection)
+        connection.commit()
+    #
+    return time.time() - start_ts
+
+
+def _sync_tenant_schemas(log, tenant_metadata, project_list, param):  # pylint: disable=R0914
+    """ Apply tenant metadata to all projects in parallel, skipping up-to-date schemas """
+    import sqlalchemy  # pylint: disable=C0415,E0401
+    from tools import project_constants as pc  # pylint: disable=E0401,C0415
+    #
+    admin_config = context.module_manager.descriptors["admin"].config
+    #
+    workers, force = _parse_sync_param(param)
+    if workers is None:
+        workers = int(admin_config.get("create_tables_workers", 1))
+    #
+    schemas = {
+        int(project["id"]): pc["PROJECT_SCHEMA_TEMPLATE"].format(project["id"])
+        for project in project_list
+    }
+    expected_tables = {table.name for table in tenant_metadata.sorted_tables}
+    #
+    engine = make_pooled_engine(workers)
+    try:
+        #
+        # One catalog query for all schemas: skip projects that already have every table
+        #
+        existing_tables = {}
+        if not force and schemas:
+            with engine.connect() as connection:
+                rows = connection.execute(
+                    sqlalchemy.text(
+                        "SELECT table_schema, table_name FROM information_schema.tables "
+                        "WHERE table_schema = ANY(:schemas)"
+                    ),
+                    {"schemas": list(schemas.values())},
+                ).fetchall()
+            #
+            for table_schema, table_name in rows:
+                existing_tables.setdefault(table_schema, set()).add(table_name)
+        #
+        todo = [
+            project_id for project_id, schema in schemas.items()
+            if force or not expected_tables.issubset(existing_tables.get(schema, set()))
+        ]
+        #
+        log.info(
+            "Projects: %s total, %s up to date, %s to apply, %s workers",
+            len(schemas), len(schemas) - len(todo), len(todo), workers,
+        )
+        #
+        durations = {}
+        failed = {}
+        #
+        for project_id, duration, exception in run_parallel(
+                lambda project_id: _create_tenant_tables(
+                    engine, tenant_metadata, schemas[project_id],
+                ),
+                todo, workers,
+        ):
+            if exception is not None:
+                failed[project_id] = str(exception)
+                log.error("Project %s failed: %s", project_id, exception)
+            else:
+                durations[project_id] = duration
+                log.info("Applied project metadata: %s (%.2fs)", project_id, duration)
+    finally:
+        engine.dispose()
+    #
+    # Summary
+    #
+    log.info(
+        "Summary: %s applied, %s failed, %s skipped",
+        len(durations), len(failed), len(schemas) - len(todo),
+    )
+    #
+    if durations:
+        slowest = sorted(durations.items(), key=lambda item: item[1], reverse=True)[:10]
+        log.info(
+            "Timing: total %.2fs, avg %.2fs, slowest: %s",
+            sum(durations.values()), sum(durations.values()) / len(durations),
+            ", ".join(f"{project_id} ({duration:.2f}s)" for project_id, duration in slowest),
+        )
+    #
+    for project_id, error in sorted(failed.items()):
+        log.info("- Failed project %s: %s", project_id, error)
+
+
 def create_tables(*args, **kwargs):
-    """Apply DB schema migrations for shared tables and all successful projects. No params."""
+    """Apply DB schema migrations for shared tables and all successful projects. Param: optional 'workers=N' and/or 'force'."""
     #
     with make_logger() as log:
         log.info("Starting")
@@ -98,11 +215,7 @@ def create_tables(*args, **kwargs):
                 filter_={"create_success": True},
             )
             #
-            for project in project_list:
-                log.info("Applying project metadata: %s", project)
-                with db.get_session(project["id"]) as tenant_db:
-                    tenant_metadata.create_all(bind=tenant_db.connection())
-                    tenant_db.commit()
+            _sync_tenant_schemas(log, tenant_metadata, project_list, kwargs.get("param", ""))
         except:  # pylint: disable=W0702
             log.exception("Got exception, stopping")
         #
@@ -111,7 +224,7 @@ def create_tables(*args, **kwargs):
 
 
 def create_tables_for_failed(*args, **kwargs):
-    """Apply DB schema migrations only for projects with create_success=False. No params."""
+    """Apply DB schema migrations only for projects with create_success=False. Param: optional 'workers=N' and/or 'force'."""
     #
     with make_logger() as log:
         log.info("Starting")
@@ -128,11 +241,7 @@ def create_tables_for_failed(*args, **kwargs):
                 filter_={"create_success": False},
             )
             #
-            for project in project_list:
-                log.info("Applying failed project metadata: %s", project)
-                with db.get_session(project["id"]) as tenant_db:
-                    tenant_metadata.create_all(bind=tenant_db.connection())
-                    tenant_db.commit()
+            _sync_tenant_schemas(log, tenant_metadata, project_list, kwargs.get("param", ""))
         except:  # pylint: disable=W0702
             log.exception("Got exception, stopping")
         #
@@ -140,8 +249,144 @@ def create_tables_for_failed(*args, **kwargs):
         log.info("Exiting (duration = %s)", end_ts - start_ts)
 
 
+_PG_TYPE_ALIASES = {
+    "character varying": "varchar",
+    "character": "char",
+    "timestamp without time zone": "timestamp",
+    "timestamp with time zone": "timestamp",
+    "time without time zone": "time",
+    "double precision": "float",
+    "real": "float",
+    "int": "integer",
+    "int4": "integer",
+    "int8": "bigint",
+    "bool": "boolean",
+    "decimal": "numeric",
+}
+
+
+def _normalize_pg_type(type_name):
+    """ Reduce a type name to a comparable family (no length, aliases folded) """
+    base = type_name.lower().split("(", 1)[0].strip()
+    if base.endswith("[]") or base == "array":
+        return "array"
+    return _PG_TYPE_ALIASES.get(base, base)
+
+
+def _expected_tenant_columns():
+    """ Model view of tenant tables: table -> column -> (type family, nullable) """
+    from tools import db  # pylint: disable=C0415,E0401
+    from tools import config as c  # pylint: disable=C0415,E0401
+    from sqlalchemy.dialects import postgresql  # pylint: disable=C0415,E0401
+    #
+    dialect = postgresql.dialect()
+    result = {}
+    #
+    for table in db.Base.metadata.tables.values():
+        if table.schema != c.POSTGRES_TENANT_SCHEMA:
+            continue
+        #
+        columns = result.setdefault(table.name, {})
+        for column in table.columns:
+            try:
+                type_name = column.type.compile(dialect=dialect)
+            except Exception:  # pylint: disable=W0703
+                type_name = str(column.type)
+            #
+            columns[column.name] = (_normalize_pg_type(type_name), bool(column.nullable))
+    #
+    return result
+
+
+def _fleet_schema_drift(log, project_list):  # pylint: disable=R0914
+    """
+        Compare every project schema against tenant models using one
+        information_schema query, and group schemas that share the same diff
+
+        Returns groups (lists of projects) that have a non-empty diff
+    """
+    import sqlalchemy  # pylint: disable=C0415,E0401
+    from tools import project_constants as pc  # pylint: disable=E0401,C0415
+    #
+    schema_projects = {
+        pc["PROJECT_SCHEMA_TEMPLATE"].format(project["id"]): project
+        for project in project_list
+    }
+    #
+    log.info("Reflecting %s project schemas", len(schema_projects))
+    #
+    actual = {schema: {} for schema in schema_projects}
+    #
+    with context.db.engine.connect() as connection:
+        rows = connection.execute(
+            sqlalchemy.text(
+                "SELECT table_schema, table_name, column_name, data_type, udt_name, is_nullable "
+                "FROM information_schema.columns WHERE table_schema = ANY(:schemas)"
+            ),
+            {"schemas": list(schema_projects)},
+        ).fetchall()
+    #
+    for table_schema, table_name, column_name, data_type, udt_name, is_nullable in rows:
+        type_name = udt_name if data_type == "USER-DEFINED" else data_type
+        actual[table_schema].setdefault(table_name, {})[column_name] = (
+            _normalize_pg_type(type_name), is_nullable == "YES",
+        )
+    #
+    expected = _expected_tenant_columns()
+    groups = {}  # diff -> [schema, ...]
+    #
+    for schema, tables in actual.items():
+        diff = []
+        #
+        for table_name in sorted(set(expected) - set(tables)):
+            diff.append(f"missing table {table_name}")
+        for table_name in sorted(set(tables) - set(expected)):
+            diff.append(f"extra table {table_name}")
+        #
+        for table_name in sorted(set(expected) & set(tables)):
+            model_columns = expected[table_name]
+            db_columns = tables[table_name]
+            #
+            for column_name in sorted(set(model_columns) - set(db_columns)):
+                diff.append(f"missing column {table_name}.{column_name}")
+            for column_name in sorted(set(db_columns) - set(model_columns)):
+                diff.append(f"extra column {table_name}.{column_name}")
+            #
+            for column_name in sorted(set(model_columns) & set(db_columns)):
+                model_type, model_nullable = model_columns[column_name]
+                db_type, db_nullable = db_columns[column_name]
+                #
+                if model_type != db_type:
+                    diff.append(f"type {table_name}.{column_name}: {db_type} -> {model_type}")
+                if model_nullable != db_nullable:
+                    diff.append(
+                        f"nullable {table_name}.{column_name}: {db_nullable} -> {model_nullable}"
+                    )
+        #
+        groups.setdefault(tuple(diff), []).append(schema)
+    #
+    in_sync = groups.pop((), [])
+    log.info(
+        "Fleet drift: %s schemas match models, %s schemas drift in %s distinct ways",
+        len(in_sync), sum(len(item) for item in groups.values()), len(groups),
+    )
+    #
+    result = []
+    #
+    for diff, schemas in sorted(groups.items(), key=lambda item: len(item[1]), reverse=True):
+        schemas.sort()
+        log.info(
+            "- Drift group: %s schemas (e.g. %s)\n%s",
+            len(schemas), ", ".join(schemas[:10]),
+            "\n".join(f"  - {line}" for line in diff),
+        )
+        result.append([schema_projects[schema] for schema in schemas])
+    #
+    return result
+
+
 def propose_migrations(*args, **kwargs):  # pylint: disable=R0914
-    """Compare current DB schema against models and output SQL migration statements. No params."""
+    """Compare current DB schema against models and output SQL migration statements. Param: optional 'fleet' to check every project schema."""
     #
     with make_logger() as log:
         log.info("Starting")
@@ -228,9 +473,17 @@ def propose_migrations(*args, **kwargs):  # pylint: disable=R0914
                 filter_={"create_success": True},
             )
             #
-            if project_list:
-                project = project_list[0]
+            if "fleet" in kwargs.get("param", ""):
                 #
+                # Bulk drift check for all schemas, then Alembic once per distinct diff
+                #
+                target_projects = [
+                    group[0] for group in _fleet_schema_drift(log, project_list)
+                ]
+            else:
+                target_projects = project_list[:1]
+            #
+            for project in target_projects:
                 log.info("Processing project: %s", project)
                 with db.get_session(project["id"]) as tenant_db:
                     from tools import project_constants as pc  # pylint: disable=E0401,C0415
@@ -300,3 +553,126 @@ def propose_migrations(*args, **kwargs):  # pylint: disable=R0914
         #
         end_ts = time.time()
         log.info("Exiting (duration = %s)", end_ts - start_ts)
+
+
+def _migrate_project_schema(engine, cmds, handled_exceptions, project_id):
+    """ Run all cmds for one project in a single transaction, return (ok, log lines) """
+    from tools import project_constants as pc  # pylint: disable=E0401,C0415
+    #
+    pid = pc["PROJECT_SCHEMA_TEMPLATE"].format(project_id)
+    lines = [f"Processing project {project_id}: {pid}"]
+    #
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cur:
+            for cmd in cmds:
+                exec_cmd = cmd.format(pid=pid)
+                #
+                # Savepoint keeps handled failures from aborting the project transaction
+                cur.execute("SAVEPOINT admin_migration_db")
+                try:
+                    cur.execute(exec_cmd)
+                    cur.execute("RELEASE SAVEPOINT admin_migration_db")
+                    #
+                    lines.append(f"\t{exec_cmd}")
+                except handled_exceptions as exc:
+                    cur.execute("ROLLBACK TO SAVEPOINT admin_migration_db")
+                    #
+                    lines.append(f"\t{exec_cmd}\t\t-FAIL(handled)-{str(exc).strip()}")
+        #
+        connection.commit()
+        return True, lines
+    except Exception as exc:  # pylint: disable=W0703
+        connection.rollback()
+        #
+        lines.append(f"\t-FAIL(unhandled, project rolled back)-{str(exc).strip()}")
+        return False, lines
+    finally:
+        connection.close()
+
+
+def migration_db(*args, **kwargs):  # pylint: disable=R0914
+    """Run SQL lines against every project schema in parallel, one transaction per project. Param: SQL lines ({pid} = schema)."""
+    #
+    with make_logger() as log:
+        log.info("Starting")
+        start_ts = time.time()
+        #
+        try:
+            import psycopg2  # pylint: disable=C0415,E0401
+            import sqlalchemy  # pylint: disable=C0415,E0401
+            from tools import constants as c  # pylint: disable=C0415,E0401
+            #
+            sqls = kwargs.get("sqls", kwargs.get("param", "")).strip()
+            exceptions = kwargs.get("exceptions", "").strip()
+            workers = int(kwargs.get("workers", None) or 4)
+            resume = bool(kwargs.get("resume", False))
+            #
+            cmds = [cmd for cmd in sqls.splitlines() if cmd.strip()]
+            if not cmds:
+                raise ValueError("No SQLs set")
+            #
+            if not exceptions:
+                handled_exceptions = (psycopg2.errors.InvalidSchemaName,)
+            else:
+                handled_exceptions = tuple(
+                    getattr(psycopg2.errors, item.strip())
+                    for item in exceptions.split(",")
+                )
+            #
+            run_key = kwargs.get("checkpoint", None) or \
+                "migration_db:" + hashlib.sha256(sqls.encode()).hexdigest()[:32]
+            #
+            engine = make_pooled_engine(workers)
+            try:
+                with engine.connect() as connection:
+                    project_ids = {
+                        row[0] for row in connection.execute(
+                            sqlalchemy.text(f'select id from {c.POSTGRES_SCHEMA}."project";')
+                        ).fetchall()
+                    }
+                #
+                if resume:
+                    completed = load_checkpoint(run_key)
+                else:
+                    clear_checkpoint(run_key)
+                    completed = set()
+                #
+                todo = sorted(project_ids - completed)
+                log.info(
+                    "Checkpoint %s: %s projects, %s already done, %s to process, %s workers",
+                    run_key, len(project_ids), len(project_ids & completed), len(todo), workers,
+                )
+                #
+                done_count = 0
+                failed = []
+                #
+                for project_id, result, exception in run_parallel(
+                        functools.partial(_migrate_project_schema, engine, cmds, handled_exceptions),
+                        todo, workers,
+                ):
+                    done_count += 1
+                    #
+                    if exception is not None:
+                        failed.append(project_id)
+                        log.error("Project %s failed: %s", project_id, exception)
+                    else:
+                        success, lines = result
+                        log.info("\n".join(lines))
+                        #
+                        if success:
+                            save_checkpoint(run_key, [project_id])
+                        else:
+                            failed.append(project_id)
+                    #
+                    log.info("Progress: %s/%s (failed: %s)", done_count, len(todo), len(failed))
+            finally:
+                engine.dispose()
+            #
+            if failed:
+                log.warning("Failed projects (re-run with resume to retry): %s", sorted(failed))
+        except:  # pylint: disable=W0702
+            log.exception("Got exception, stopping")
+        #
+        end_ts = time.time()
+        log.info("Exiting (duration = %s)", end_ts - start_ts)
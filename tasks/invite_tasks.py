@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+""" Task """
+
+import time
+
+from tools import context  # pylint: disable=E0401
+
+from .logs import make_logger
+from ..utils.db_workers import run_parallel
+
+
+def _parse_invite_param(param):
+    """ Parse 'project_id=N roles=a,b chunk_size=N workers=N' and 'dry_run' flag from task param """
+    result = {}
+    #
+    for item in (param or "").split():
+        if item == "dry_run":
+            result["dry_run"] = True
+        elif "=" in item:
+            key, value = item.split("=", 1)
+            result[key] = value
+    #
+    return result
+
+
+def _chunks(items, size):
+    for idx in range(0, len(items), size):
+        yield items[idx:idx + size]
+
+
+def invite_bulk_users(*args, **kwargs):  # pylint: disable=R0914,R0915
+    """Give all users roles in a project. Param: 'project_id=N roles=a,b [chunk_size=N] [workers=N] [dry_run]'."""
+    #
+    with make_logger() as log:
+        log.info("Starting")
+        start_ts = time.time()
+        #
+        try:
+            from tools import auth  # pylint: disable=E0401,C0415
+            #
+            admin_descriptor = context.module_manager.descriptors["admin"]
+            config = admin_descriptor.config
+            module = admin_descriptor.module
+            #
+            params = _parse_invite_param(kwargs.get("param", ""))
+            params.update({
+                key: kwargs[key]
+                for key in ["project_id", "roles", "chunk_size", "workers", "dry_run"]
+                if key in kwargs
+            })
+            #
+            if "project_id" not in params or not params.get("roles"):
+                log.error("project_id and roles are required")
+                return
+            #
+            project_id = int(params["project_id"])
+            roles = params["roles"]
+            if isinstance(roles, str):
+                roles = roles.split(",")
+            roles = [role.strip() for role in roles if role.strip()]
+            #
+            chunk_size = max(int(params.get("chunk_size", config.get("bulk_invite_chunk_size", 500))), 1)
+            workers = int(params.get("workers", config.get("bulk_invite_workers", 4)))
+            dry_run = bool(params.get("dry_run", False))
+            #
+            known_roles = set(module.role_map_cache.get_role_map(project_id).values())
+            unknown_roles = [role for role in roles if role not in known_roles]
+            #
+            if unknown_roles:
+                log.warning("Roles not found in project %s: %s", project_id, unknown_roles)
+            #
+            user_names = {}
+            skipped_system = 0
+            #
+            for user in auth.list_users():
+                user_name = user["name"]
+                #
+                if user_name is not None and user_name.startswith(":system:project:"):
+                    skipped_system += 1
+                    continue
+                #
+                user_names[int(user["id"])] = user_name
+            #
+            user_ids = sorted(user_names)
+            total_chunks = (len(user_ids) + chunk_size - 1) // chunk_size
+            #
+            log.info(
+                "%s %s users in project %s as %s (%s system users skipped, %s chunks of %s, %s workers)",
+                "Dry run: checking" if dry_run else "Inviting",
+                len(user_ids), project_id, roles, skipped_system, total_chunks, chunk_size, workers,
+            )
+            #
+            def process_chunk(chunk):
+                result = module.update_roles_for_users_in_projects(
+                    [project_id], chunk, roles, dry_run=dry_run, details=True,
+                )
+                return result[project_id]["users"]
+            #
+            done_chunks = 0
+            done_users = 0
+            changed = 0
+            failed = 0
+            #
+            for chunk, changed_users, exception in run_parallel(
+                    process_chunk, _chunks(user_ids, chunk_size), workers,
+            ):
+                done_chunks += 1
+                done_users += len(chunk)
+                #
+                if exception is not None:
+                    failed += len(chunk)
+                    log.warning(
+                        "Chunk %s/%s failed (users %s..%s): %s",
+                        done_chunks, total_chunks, chunk[0], chunk[-1], exception,
+                    )
+                    continue
+                #
+                for user_id, change in sorted(changed_users.items()):
+                    log.info(
+                        "User %s (%s): +%s -%s",
+                        user_id, user_names.get(user_id), change["added"], change["removed"],
+                    )
+                #
+                changed += len(changed_users)
+                #
+                log.info(
+                    "Chunk %s/%s: %s changed, %s already had roles (%s/%s users, %.1fs)",
+                    done_chunks, total_chunks, len(changed_users), len(chunk) - len(changed_users),
+                    done_users, len(user_ids), time.time() - start_ts,
+                )
+            #
+            log.info(
+                "%s: %s users changed, %s already had roles, %s failed",
+                "Dry run done (nothing written)" if dry_run else "Done",
+                changed, len(user_ids) - changed - failed, failed,
+            )
+        except:  # pylint: disable=W0702
+            log.exception("Got exception, stopping")
+        #
+        end_ts = time.time()
+        log.info("Exiting (duration = %s)", end_ts - start_ts)
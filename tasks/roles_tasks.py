@@ -0,0 +1,225 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Task """
+
+import time
+
+from tools import context  # pylint: disable=E0401
+
+from .logs import make_logger
+from ..utils.db_workers import run_parallel
+from ..utils.checkpoints import load_checkpoint, save_checkpoint, clear_checkpoint
+
+
+ROLES_MIGRATION_CHECKPOINT = "roles_migration"
+
+
+def _select_roles_snapshot(tenant_db):
+    """
+        Read tenant role data as plain tuples in three fixed queries:
+        roles (id, name), permissions (role_id, permission), user roles (user_id, role_id)
+    """
+    from ..models.users import Role, RolePermission, UserRole  # pylint: disable=C0415
+    #
+    roles = tenant_db.query(Role.id, Role.name).all()
+    permissions = tenant_db.query(RolePermission.role_id, RolePermission.permission).all()
+    user_roles = tenant_db.query(UserRole.user_id, UserRole.role_id).all()
+    #
+    return (
+        [tuple(row) for row in roles],
+        [tuple(row) for row in permissions],
+        [tuple(row) for row in user_roles],
+    )
+
+
+def _read_project_roles_snapshot(project_id):
+    """ Read tenant roles, permissions and user roles for apply_project_roles_snapshot """
+    from tools import db  # pylint: disable=E0401,C0415
+    #
+    with db.get_session(project_id) as tenant_db:
+        roles, permissions, user_roles = _select_roles_snapshot(tenant_db)
+    #
+    role_map = dict(roles)
+    role_permissions = {role_id: [] for role_id in role_map}
+    #
+    for role_id, permission in permissions:
+        if role_id in role_permissions:
+            role_permissions[role_id].append(permission)
+    #
+    return {
+        "project_id": project_id,
+        "roles": [
+            {"name": role_name, "permissions": role_permissions[role_id]}
+            for role_id, role_name in roles
+        ],
+        "assignments": [
+            {"user_id": user_id, "role": role_map[role_id]}
+            for user_id, role_id in user_roles
+            if role_id in role_map
+        ],
+    }
+
+
+def _throttled(items, max_per_second):
+    """ Yield items no faster than max_per_second (0 = unlimited) """
+    if not max_per_second:
+        yield from items
+        return
+    #
+    interval = 1.0 / float(max_per_second)
+    next_ts = time.time()
+    #
+    for item in items:
+        delay = next_ts - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        #
+        next_ts = max(next_ts, time.time()) + interval
+        yield item
+
+
+def migrate_roles(*args, **kwargs):  # pylint: disable=R0912,R0914,R0915
+    """Migrate tenant roles into auth_core, resuming from checkpoint. Param: 'force' (all projects, ignores checkpoint), 'reset' (space-separated flags)."""
+    #
+    with make_logger() as log:
+        log.info("Starting")
+        start_ts = time.time()
+        #
+        try:
+            from tools import auth  # pylint: disable=E0401,C0415
+            #
+            admin_descriptor = context.module_manager.descriptors["admin"]
+            config = admin_descriptor.config
+            param = kwargs.get("param", "")
+            #
+            check_migration = kwargs.get(
+                "check", config.get("check_for_roles_migration", False)
+            ) or "check" in param
+            force_migration = kwargs.get(
+                "force", config.get("force_role_migration", False)
+            ) or "force" in param
+            reset_checkpoint = kwargs.get(
+                "reset", config.get("role_migration_reset_checkpoint", False)
+            ) or "reset" in param
+            #
+            max_workers = int(config.get("role_migration_threads", 1))
+            batch_size = int(config.get("role_migration_batch_size", 10))
+            max_per_second = float(config.get("role_migration_max_projects_per_second", 0))
+            #
+            log.info("Getting project list for roles migration check")
+            project_list = context.rpc_manager.timeout(120).project_list(
+                filter_={"create_success": True},
+            )
+            project_ids = [int(project["id"]) for project in project_list]
+            #
+            if reset_checkpoint:
+                log.info("Resetting checkpoint")
+                clear_checkpoint(ROLES_MIGRATION_CHECKPOINT)
+            #
+            completed = load_checkpoint(ROLES_MIGRATION_CHECKPOINT)
+            #
+            # Filter projects
+            #
+            if force_migration is True:
+                # Force means re-migrate: checkpoints are ignored (and refreshed)
+                projects_to_process = list(project_ids)
+            elif isinstance(force_migration, list):
+                forced = {int(p_id) for p_id in force_migration}
+                projects_to_process = [p_id for p_id in project_ids if p_id in forced]
+            elif check_migration:
+                # Projects that already have roles in auth_core are skipped: one bulk read
+                existing_roles = admin_descriptor.module.get_roles_in_projects(
+                    [p_id for p_id in project_ids if p_id not in completed]
+                )
+                projects_to_process = [
+                    p_id for p_id, roles in existing_roles.items() if not roles
+                ]
+            else:
+                projects_to_process = []
+            #
+            log.info(
+                "Migrating roles for %s projects (%s already checkpointed, %s workers, batch %s)",
+                len(projects_to_process), len(completed), max_workers, batch_size,
+            )
+            #
+            snapshot_batch = []
+            batch_no = 0
+            batch_start_ts = time.time()
+            processed = 0
+            failed = []
+            #
+            def upload_batch():
+                nonlocal snapshot_batch, batch_no, batch_start_ts
+                #
+                batch_no += 1
+                read_duration = time.time() - batch_start_ts
+                upload_start_ts = time.time()
+                #
+                uploaded_ids = [item["project_id"] for item in snapshot_batch]
+                #
+                auth.apply_project_roles_snapshot(snapshot_batch)
+                save_checkpoint(ROLES_MIGRATION_CHECKPOINT, uploaded_ids)
+                #
+                # Roles of these projects changed under the role cache: drop them here and on other pylons
+                for p_id in uploaded_ids:
+                    admin_descriptor.module.role_map_cache.invalidate(p_id)
+                context.event_manager.fire_event(
+                    "admin_project_roles_changed", {"project_ids": uploaded_ids},
+                )
+                #
+                upload_duration = time.time() - upload_start_ts
+                log.info(
+                    "Batch %s: %s snapshots, read %.2fs, upload %.2fs, %.1f projects/s",
+                    batch_no, len(snapshot_batch), read_duration, upload_duration,
+                    len(snapshot_batch) / max(read_duration + upload_duration, 0.001),
+                )
+                #
+                snapshot_batch = []
+                batch_start_ts = time.time()
+            #
+            for p_id, data, exception in run_parallel(
+                    _read_project_roles_snapshot,
+                    _throttled(projects_to_process, max_per_second),
+                    max_workers,
+            ):
+                processed += 1
+                #
+                if exception is not None:
+                    log.warning("Failed to read project data for %s: %s", p_id, exception)
+                    failed.append(p_id)
+                    continue
+                #
+                snapshot_batch.append(data)
+                #
+                if len(snapshot_batch) >= batch_size:
+                    upload_batch()
+                    log.info("Progress: %s/%s", processed, len(projects_to_process))
+            #
+            # Apply remaining
+            if snapshot_batch:
+                upload_batch()
+            #
+            if failed:
+                log.warning("Failed projects (will be retried on next run): %s", sorted(failed))
+            #
+            log.info("Roles migration finished")
+        except:  # pylint: disable=W0702
+            log.exception("Got exception, stopping")
+        #
+        end_ts = time.time()
+        log.info("Exiting (duration = %s)", end_ts - start_ts)
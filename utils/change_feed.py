@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - runtime change feed """
+
+import time
+import uuid
+import threading
+import collections
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401
+
+
+class ChangeFeed:
+    """
+        Bounded, ordered log of runtime changes
+
+        Each change gets a sequence number. Clients keep the last seen cursor
+        ("<epoch>:<seq>") and ask for changes after it. The epoch is random per
+        feed instance, so cursors from before a restart (or from another pylon)
+        never match. When the cursor is from another epoch or older than the
+        oldest kept change, the result is marked as reset: the client has to
+        reload full state.
+    """
+
+    def __init__(self, max_size=1000):
+        self.changes = collections.deque(maxlen=max_size)
+        self.seq = 0
+        self.epoch = uuid.uuid4().hex[:12]
+        self.condition = threading.Condition()
+
+    def format_cursor(self, seq):
+        """ Cursor for seq in this feed """
+        return f"{self.epoch}:{seq}"
+
+    def parse_cursor(self, cursor):
+        """ Cursor -> seq, None for no cursor or other epoch; ValueError if malformed """
+        if cursor in (None, ""):
+            return None
+        #
+        epoch, sep, seq = str(cursor).partition(":")
+        #
+        if not sep or not epoch:
+            raise ValueError(f"Malformed cursor: {cursor}")
+        #
+        seq = int(seq)
+        #
+        if seq < 0:
+            raise ValueError(f"Malformed cursor: {cursor}")
+        #
+        if epoch != self.epoch:
+            return None
+        #
+        return seq
+
+    def publish(self, kind, **data):
+        """ Add change, wake waiting readers """
+        with self.condition:
+            self.seq += 1
+            #
+            change = {
+                "seq": self.seq,
+                "cursor": self.format_cursor(self.seq),
+                "kind": kind,
+                "ts": time.time(),
+            }
+            change.update(data)
+            #
+            self.changes.append(change)
+            self.condition.notify_all()
+            #
+            return self.seq
+
+    def since(self, cursor):
+        """ (changes after cursor, new cursor, reset) """
+        seq = self.parse_cursor(cursor)
+        #
+        with self.condition:
+            return self._since(seq)
+
+    def _since(self, seq):
+        if seq is None:
+            return [], self.format_cursor(self.seq), True
+        #
+        oldest = self.changes[0]["seq"] if self.changes else self.seq + 1
+        #
+        if seq > self.seq or seq < oldest - 1:
+            return [], self.format_cursor(self.seq), True
+        #
+        return [
+            change for change in self.changes if change["seq"] > seq
+        ], self.format_cursor(self.seq), False
+
+    def wait(self, cursor, timeout):
+        """ Same as since(), but wait up to timeout seconds for changes """
+        seq = self.parse_cursor(cursor)
+        #
+        with self.condition:
+            self.condition.wait_for(
+                lambda: seq is None or self.seq != seq, timeout=timeout,
+            )
+            return self._since(seq)
+
+
+class TaskStateWatcher:
+    """ Background thread: publishes module.task_node task state changes to feed """
+
+    def __init__(self, module, feed, interval=2):
+        self.module = module
+        self.feed = feed
+        self.interval = interval
+        #
+        self.known = {}  # task_id -> status
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """ Start watcher thread """
+        self.thread = threading.Thread(
+            target=self._run, name="admin-task-state-watcher", daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        """ Stop watcher thread """
+        self.stop_event.set()
+
+    def scan(self):
+        """ Compare task states with last scan, publish differences """
+        task_node = getattr(self.module, "task_node", None)
+        #
+        if task_node is None:  # Not started yet
+            return
+        #
+        with task_node.lock:
+            current = {
+                task_id: state.get("status", None)
+                for task_id, state in task_node.global_task_state.items()
+            }
+        #
+        for task_id, status in current.items():
+            if task_id not in self.known:
+                self.feed.publish("task_added", task_id=task_id, status=status)
+            elif self.known[task_id] != status:
+                self.feed.publish("task_status", task_id=task_id, status=status)
+        #
+        for task_id in self.known:
+            if task_id not in current:
+                self.feed.publish("task_removed", task_id=task_id)
+        #
+        self.known = current
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.scan()
+            except:  # pylint: disable=W0702
+                log.exception("Task state scan failed")
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - resumable run checkpoints """
+
+from tools import db  # pylint: disable=E0401
+
+from ..models.checkpoints import RunCheckpoint
+
+
+def _ensure_table(session):
+    RunCheckpoint.__table__.create(bind=session.connection(), checkfirst=True)
+
+
+def load_checkpoint(run_key):
+    """ Get project IDs already completed for run_key """
+    with db.get_session(None) as session:
+        _ensure_table(session)
+        session.commit()
+        #
+        rows = session.query(RunCheckpoint.project_id).filter(
+            RunCheckpoint.run_key == run_key,
+        ).all()
+        #
+        return {row[0] for row in rows}
+
+
+def save_checkpoint(run_key, project_ids):
+    """ Mark project IDs as completed for run_key """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return
+    #
+    with db.get_session(None) as session:
+        _ensure_table(session)
+        #
+        existing = {
+            row[0] for row in session.query(RunCheckpoint.project_id).filter(
+                RunCheckpoint.run_key == run_key,
+                RunCheckpoint.project_id.in_(project_ids),
+            ).all()
+        }
+        #
+        session.add_all([
+            RunCheckpoint(run_key=run_key, project_id=project_id)
+            for project_id in project_ids - existing
+        ])
+        session.commit()
+
+
+def clear_checkpoint(run_key):
+    """ Forget all progress for run_key """
+    with db.get_session(None) as session:
+        _ensure_table(session)
+        #
+        session.query(RunCheckpoint).filter(
+            RunCheckpoint.run_key == run_key,
+        ).delete(synchronize_session=False)
+        session.commit()
@@ -0,0 +1,293 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - plugin config YAML """
+
+import re
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+import yaml  # pylint: disable=E0401
+
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+KEY_RE = re.compile(r"""^(?P<indent> *)(?P<key>[^\s'"#:-][^:#]*?|"[^"]*"|'[^']*')\s*:(?:\s+|$)""")
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def get_nested(d, path):
+    """ Get a value from a nested dict using dot-notation path """
+    keys = path.split(".")
+    for key in keys:
+        if isinstance(d, dict):
+            d = d.get(key)
+        else:
+            return None
+    return d
+
+
+def set_nested(d, path, value):
+    """ Set a value in a nested dict using dot-notation path """
+    keys = path.split(".")
+    for key in keys[:-1]:
+        if key not in d or not isinstance(d[key], dict):
+            d[key] = {}
+        d = d[key]
+    d[keys[-1]] = value
+
+
+def load(data):
+    """ Parse YAML (C loader when available) """
+    return yaml.load(data, Loader=Loader)  # nosec
+
+
+def dump(data):
+    """ Serialize YAML (C dumper when available) """
+    return yaml.dump(
+        data, Dumper=Dumper, default_flow_style=False, allow_unicode=True,
+    )
+
+
+class ParsedYamlCache:
+    """
+        Parsed YAML documents keyed by content hash (bounded, LRU)
+
+        get() returns a copy that callers are free to modify
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        #
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # hash -> parsed
+        #
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(data):
+        """ Cache key for YAML text """
+        return hashlib.sha1(data.encode()).hexdigest()
+
+    def get(self, data):
+        """ Parsed copy of YAML text """
+        if not data:
+            return {}
+        #
+        cache_key = self.key(data)
+        #
+        with self.lock:
+            if cache_key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(cache_key)
+                return copy.deepcopy(self.entries[cache_key])
+            #
+            self.misses += 1
+        #
+        parsed = load(data) or {}
+        self.put(data, parsed)
+        #
+        return copy.deepcopy(parsed)
+
+    def put(self, data, parsed):
+        """ Store parsed form of YAML text """
+        cache_key = self.key(data)
+        #
+        with self.lock:
+            self.entries[cache_key] = copy.deepcopy(parsed)
+            self.entries.move_to_end(cache_key)
+            #
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        """ Cache counters """
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _is_content(line):
+    stripped = line.strip()
+    return stripped and not stripped.startswith("#")
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip(" "))
+
+
+def _unquote(key):
+    if len(key) >= 2 and key[0] == key[-1] and key[0] in "'\"":
+        return key[1:-1]
+    return key
+
+
+def _find_key_line(lines, keys):
+    """ Index of line holding keys[-1] in block mapping, None if not simple """
+    start, end, parent_indent = 0, len(lines), -1
+    #
+    for depth, key in enumerate(keys):
+        child_indent = None
+        found = None
+        #
+        for idx in range(start, end):
+            line = lines[idx]
+            #
+            if not _is_content(line):
+                continue
+            #
+            if line.strip() in ("---", "..."):
+                if depth == 0:
+                    continue
+                return None
+            #
+            indent = _indent(line)
+            #
+            if indent <= parent_indent:
+                end = idx
+                break
+            #
+            if child_indent is None:
+                child_indent = indent
+            #
+            if indent != child_indent:
+                if found is not None and indent < child_indent:
+                    break
+                continue
+            #
+            match = KEY_RE.match(line)
+            if match is None:
+                return None  # sequences, flow collections, complex keys
+            #
+            if found is not None:
+                end = idx
+                break
+            #
+            if _unquote(match.group("key").strip()) == key:
+                found = idx
+        #
+        if found is None:
+            return None
+        #
+        start, parent_indent = found + 1, child_indent
+    #
+    return start - 1
+
+
+def _split_comment(value):
+    """ Split 'value  # comment' outside of quotes """
+    quote = None
+    #
+    for idx, char in enumerate(value):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#" and (idx == 0 or value[idx - 1] in " \t"):
+            return value[:idx].rstrip(), value[len(value[:idx].rstrip()):]
+    #
+    return value.rstrip(), ""
+
+
+def _replace_scalar(line, value):
+    match = KEY_RE.match(line)
+    if match is None:
+        return None
+    #
+    head = line[:match.end()]
+    tail = line[match.end():]
+    newline = tail[len(tail.rstrip("\r\n")):]
+    current, comment = _split_comment(tail.rstrip("\r\n"))
+    #
+    if not current or current[0] in "|>&*!{[":
+        return None  # nested mapping, block scalar, anchor/alias, tag, flow
+    #
+    if current[0] in "'\"" and (len(current) < 2 or current[-1] != current[0]):
+        return None  # multi-line quoted scalar
+    #
+    new_value = yaml.dump(
+        value, Dumper=Dumper, default_flow_style=True, allow_unicode=True, width=2**30,
+    )
+    if new_value.endswith("\n...\n"):
+        new_value = new_value[:-5]
+    new_value = new_value.rstrip("\n")
+    #
+    if "\n" in new_value:
+        return None
+    #
+    if not head.endswith((" ", "\t")):
+        head += " "
+    #
+    return f"{head}{new_value}{comment}{newline}"
+
+
+def patch_yaml(data, changes, parsed=None):
+    """
+        Apply [(path, value), ...] to YAML text
+
+        Scalar values of existing keys in block mappings are replaced in place,
+        keeping the rest of the document (comments, order, style) untouched.
+        Other changes fall back to load/modify/dump of the whole document.
+
+        Returns (new_text, new_parsed)
+    """
+    if parsed is None:
+        parsed = (load(data) or {}) if data else {}
+    #
+    expected = copy.deepcopy(parsed)
+    for path, value in changes:
+        set_nested(expected, path, value)
+    #
+    lines = data.splitlines(keepends=True) if data else []
+    patched = bool(lines) and isinstance(parsed, dict)
+    #
+    for path, value in changes:
+        if not patched:
+            break
+        #
+        if not isinstance(value, SCALAR_TYPES):
+            patched = False
+            break
+        #
+        idx = _find_key_line(lines, path.split("."))
+        line = _replace_scalar(lines[idx], value) if idx is not None else None
+        #
+        if line is None:
+            patched = False
+            break
+        #
+        lines[idx] = line
+    #
+    if patched:
+        new_data = "".join(lines)
+        #
+        try:
+            if load(new_data) == expected:
+                return new_data, expected
+        except yaml.YAMLError:
+            pass
+    #
+    return dump(expected), expected
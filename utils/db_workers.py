@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - parallel per-project DB work """
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from tools import context  # pylint: disable=E0401
+
+
+def make_pooled_engine(workers):
+    """ Dedicated engine whose pool matches the worker count """
+    import sqlalchemy  # pylint: disable=C0415,E0401
+    #
+    return sqlalchemy.create_engine(
+        context.db.url,
+        pool_size=max(int(workers), 1),
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+
+
+def run_parallel(func, items, workers, window=None):
+    """
+        Run func(item) on a bounded thread pool
+
+        At most window (default: 2 x workers) items are in flight at once.
+        Yields (item, result, exception) in completion order.
+    """
+    workers = max(int(workers), 1)
+    window = window or workers * 2
+    #
+    pending = {}
+    items = iter(items)
+    exhausted = False
+    #
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                #
+                pending[executor.submit(func, item)] = item
+            #
+            if not pending:
+                break
+            #
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            #
+            for future in done:
+                item = pending.pop(future)
+                exception = future.exception()
+                #
+                if exception is not None:
+                    yield item, None, exception
+                else:
+                    yield item, future.result(), None
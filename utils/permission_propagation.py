@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+""" Utils - set-based role permission propagation """
+
+from sqlalchemy import text  # pylint: disable=E0401
+
+from tools import db  # pylint: disable=E0401
+from tools import constants as c  # pylint: disable=E0401
+
+from ..rpc.roles import PROJECT_ROLE_TABLE, ROLE_TABLE, WRITE_BATCH_SIZE
+
+
+ROLE_PERMISSION_TABLE = "auth_core__role_permission"
+
+
+def plan_propagation(target, project_roles, central_permissions, remove=False):
+    """
+        Diff target {role: {permission, ...}} against all projects at once
+
+        project_roles: project_id -> {role name, ...}
+        central_permissions: role name -> {permission, ...} (mode 'default')
+
+        Permissions are resolved from central (mode 'default') roles by name,
+        there is no per-project permission storage. So the plan has two parts:
+        - per project: missing roles to create (add only)
+        - one central permission diff, which affects every project with the role
+
+        Returns {"roles_to_add": [(project_id, role)], "permissions": [(role, permission)],
+        "projects": project_id -> {"roles_added": [...]}}
+    """
+    roles_to_add = []
+    projects = {}
+    #
+    for project_id, roles in project_roles.items():
+        roles_added = [] if remove else sorted(set(target) - roles)
+        roles_to_add.extend((project_id, role) for role in roles_added)
+        projects[project_id] = {"roles_added": roles_added}
+    #
+    permissions = sorted(
+        (role, permission)
+        for role, role_permissions in target.items()
+        for permission in role_permissions
+        if (permission in central_permissions.get(role, set())) == remove
+    )
+    #
+    return {
+        "roles_to_add": roles_to_add,
+        "permissions": permissions,
+        "projects": projects,
+    }
+
+
+def _batches(rows):
+    for idx in range(0, len(rows), WRITE_BATCH_SIZE):
+        yield rows[idx:idx + WRITE_BATCH_SIZE]
+
+
+def apply_propagation(plan, remove=False, apply_permissions=False):
+    """
+        Write plan in one transaction, returns affected row counts
+
+        Central permission diff is written only with apply_permissions
+    """
+    schema = c.POSTGRES_SCHEMA
+    result = {"roles_added": 0, "permissions": 0}
+    #
+    with db.get_session(None) as session:
+        for batch in _batches(plan["roles_to_add"]):
+            result["roles_added"] += session.execute(
+                text(
+                    f'INSERT INTO {schema}.{PROJECT_ROLE_TABLE} (project_id, name) '
+                    'SELECT v.project_id, v.name '
+                    'FROM unnest(CAST(:project_ids AS integer[]), CAST(:names AS text[])) '
+                    'AS v(project_id, name) '
+                    f'WHERE NOT EXISTS (SELECT 1 FROM {schema}.{PROJECT_ROLE_TABLE} pr '
+                    'WHERE pr.project_id = v.project_id AND pr.name = v.name)'
+                ),
+                {
+                    "project_ids": [row[0] for row in batch],
+                    "names": [row[1] for row in batch],
+                },
+            ).rowcount
+        #
+        rows = 'unnest(CAST(:names AS text[]), CAST(:permissions AS text[])) AS v(name, permission)'
+        #
+        for batch in _batches(plan["permissions"] if apply_permissions else []):
+            params = {
+                "names": [row[0] for row in batch],
+                "permissions": [row[1] for row in batch],
+            }
+            #
+            if remove:
+                query = \
+                    f'DELETE FROM {schema}.{ROLE_PERMISSION_TABLE} rp ' \
+                    f'USING {schema}.{ROLE_TABLE} r, {rows} ' \
+                    "WHERE rp.role_id = r.id AND r.mode = 'default' " \
+                    'AND r.name = v.name AND rp.permission = v.permission'
+            else:
+                query = \
+                    f'INSERT INTO {schema}.{ROLE_PERMISSION_TABLE} (role_id, permission) ' \
+                    f'SELECT r.id, v.permission FROM {schema}.{ROLE_TABLE} r ' \
+                    f"JOIN {rows} ON r.name = v.name WHERE r.mode = 'default' " \
+                    f'AND NOT EXISTS (SELECT 1 FROM {schema}.{ROLE_PERMISSION_TABLE} rp ' \
+                    'WHERE rp.role_id = r.id AND rp.permission = v.permission)'
+            #
+            result["permissions"] += session.execute(text(query), params).rowcount
+        #
+        session.commit()
+    #
+    return result
@@ -0,0 +1,179 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - bulk plugin updates """
+
+import time
+import uuid
+import threading
+from collections import OrderedDict
+
+
+def merge_update_matrix(matrix):
+    """ {plugin: [pylon_id, ...]} -> {pylon_id: [plugin, ...]} (sorted) """
+    result = {}
+    #
+    for plugin, pylon_ids in matrix.items():
+        for pylon_id in pylon_ids:
+            result.setdefault(pylon_id, set()).add(plugin)
+    #
+    return {
+        pylon_id: sorted(plugins)
+        for pylon_id, plugins in sorted(result.items())
+    }
+
+
+class PluginUpdateTracker:
+    """
+        Acknowledgements of fired plugin update events from later announces
+
+        Per pylon state:
+        - pending: no announce since the event was fired
+        - acknowledged: pylon announced after the event
+        - updated: all requested plugins announced after the event with
+          local_version different from the one known when tracking started
+        - timeout: no announce within ack_timeout seconds
+    """
+
+    def __init__(self, remote_runtimes, ack_timeout=300, history_size=50):
+        self.remote_runtimes = remote_runtimes
+        self.ack_timeout = ack_timeout
+        self.history_size = history_size
+        #
+        self.lock = threading.Lock()
+        self.updates = OrderedDict()  # id -> {"created", "pylons": {pylon_id: {...}}}
+        self.waiting = {}  # (pylon_id, plugin) -> {update_id, ...}
+
+    def track(self, pylon_plugins, fired_at=None):
+        """ Start tracking of events fired for {pylon_id: [plugin, ...]} """
+        if fired_at is None:
+            fired_at = time.time()
+        #
+        update_id = str(uuid.uuid4())
+        #
+        # Read before taking own lock: listeners run with registry lock held
+        versions = {
+            pylon_id: {
+                plugin: self._local_version(pylon_id, plugin)
+                for plugin in plugins
+            }
+            for pylon_id, plugins in pylon_plugins.items()
+        }
+        #
+        with self.lock:
+            self.updates[update_id] = {
+                "created": fired_at,
+                "pylons": {
+                    pylon_id: {
+                        "plugins": list(plugins),
+                        "versions": versions[pylon_id],
+                        "fired_at": fired_at,
+                        "updated": set(),
+                    }
+                    for pylon_id, plugins in pylon_plugins.items()
+                },
+            }
+            #
+            for pylon_id, plugins in pylon_plugins.items():
+                for plugin in plugins:
+                    self.waiting.setdefault((pylon_id, plugin), set()).add(update_id)
+            #
+            while len(self.updates) > self.history_size:
+                self._forget(next(iter(self.updates)))
+        #
+        return update_id
+
+    def _local_version(self, pylon_id, plugin):
+        entry = self.remote_runtimes.get_plugin(pylon_id, plugin)
+        return entry.get("local_version", None) if entry is not None else None
+
+    def _forget(self, update_id):
+        update = self.updates.pop(update_id)
+        #
+        for pylon_id, state in update["pylons"].items():
+            for plugin in state["plugins"]:
+                update_ids = self.waiting.get((pylon_id, plugin), set())
+                update_ids.discard(update_id)
+                #
+                if not update_ids:
+                    self.waiting.pop((pylon_id, plugin), None)
+
+    def on_change(self, kind, **data):
+        """ RuntimeRegistry listener """
+        if kind in ("plugin_added", "plugin_changed"):
+            versions = {data["name"]: data.get("local_version", None)}
+        elif kind == "pylon_added":  # e.g. came back after expiry during restart
+            versions = data.get("versions", {})
+        else:
+            return
+        #
+        pylon_id = data["pylon_id"]
+        #
+        with self.lock:
+            for name, local_version in versions.items():
+                key = (pylon_id, name)
+                #
+                for update_id in list(self.waiting.get(key, set())):
+                    state = self.updates[update_id]["pylons"][pylon_id]
+                    #
+                    if state["versions"].get(name, None) == local_version:
+                        continue  # Same version: changed, but not updated
+                    #
+                    state["updated"].add(name)
+                    self.waiting[key].discard(update_id)
+                #
+                if not self.waiting.get(key, True):
+                    self.waiting.pop(key, None)
+
+    def get(self, update_id):
+        """ Update status or None """
+        now = time.time()
+        #
+        with self.lock:
+            update = self.updates.get(update_id, None)
+            #
+            if update is None:
+                return None
+            #
+            pylons = {}
+            #
+            for pylon_id, state in update["pylons"].items():
+                data = self.remote_runtimes.get(pylon_id, None)
+                last_seen = data.get("timestamp", 0) if data is not None else 0
+                #
+                if state["updated"] >= set(state["plugins"]):
+                    status = "updated"
+                elif last_seen > state["fired_at"]:
+                    status = "acknowledged"
+                elif now - state["fired_at"] > self.ack_timeout:
+                    status = "timeout"
+                else:
+                    status = "pending"
+                #
+                pylons[pylon_id] = {
+                    "status": status,
+                    "plugins": state["plugins"],
+                    "updated_plugins": sorted(state["updated"]),
+                    "versions_before": state["versions"],
+                    "last_seen": last_seen or None,
+                }
+            #
+            return {
+                "id": update_id,
+                "created": update["created"],
+                "pylons": pylons,
+            }
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - project mode redirect decisions """
+
+import time
+import threading
+from collections import OrderedDict
+
+
+MISSING = object()
+
+
+class RedirectDecisionCache:
+    """
+        Redirect decisions of before_request_hook: (user_id, session_key) -> decision
+
+        Entries expire after ttl seconds. All entries of a user are dropped
+        when project membership of that user changes.
+    """
+
+    def __init__(self, ttl=30, max_size=4096):
+        self.ttl = ttl
+        self.max_size = max_size
+        #
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # (user_id, session_key) -> (expires_at, decision)
+        #
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id, session_key):
+        """ Cached decision or MISSING """
+        key = (str(user_id), session_key)
+        #
+        with self.lock:
+            entry = self.entries.get(key, None)
+            #
+            if entry is None or entry[0] <= time.time():
+                self.entries.pop(key, None)
+                self.misses += 1
+                return MISSING
+            #
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id, session_key, decision):
+        """ Store decision """
+        key = (str(user_id), session_key)
+        #
+        with self.lock:
+            self.entries[key] = (time.time() + self.ttl, decision)
+            self.entries.move_to_end(key)
+            #
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate_users(self, user_ids):
+        """ Drop all sessions of users """
+        user_ids = {str(user_id) for user_id in user_ids}
+        #
+        with self.lock:
+            self.invalidations += 1
+            #
+            for key in [key for key in self.entries if key[0] in user_ids]:
+                self.entries.pop(key)
+
+    def invalidate(self):
+        """ Drop everything """
+        with self.lock:
+            self.invalidations += 1
+            self.entries.clear()
+
+    def stats(self):
+        """ Cache counters """
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "ttl": self.ttl,
+                "max_size": self.max_size,
+            }
@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - plugin repo versions """
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401
+
+
+class RepoVersionError(Exception):
+    """ Repo version can not be resolved """
+
+
+class LocalMetadataProvider:  # pylint: disable=R0903
+    """ Metadata provider for LocalRepoResolver """
+
+    def __init__(self, versions):
+        self.versions = versions
+
+    def get_metadata(self, target):
+        """ Same interface as bootstrap metadata providers """
+        return {"version": self.versions[target["source"]]}
+
+
+class LocalRepoResolver:
+    """
+        Stand-in for bootstrap repo_resolver: plugin name -> version mapping
+
+        Used instead of bootstrap when repo_resolver_versions is set in config
+        (e.g. for tests or air-gapped installs)
+    """
+
+    def __init__(self, versions):
+        self.versions = dict(versions)
+
+    def resolve(self, plugin):
+        """ Plugin info or None """
+        if plugin not in self.versions:
+            return None
+        #
+        return {"objects": {"metadata": plugin}}
+
+    def get_metadata_provider(self, plugin):  # pylint: disable=W0613
+        """ Metadata provider for plugin """
+        return LocalMetadataProvider(self.versions)
+
+
+def fetch_repo_version(repo_resolver, plugin):
+    """ Resolve plugin and get version from repo metadata """
+    plugin_info = repo_resolver.resolve(plugin)
+    #
+    if plugin_info is None:
+        raise RepoVersionError("Plugin is not known by repo resolver(s)")
+    #
+    metadata_provider = repo_resolver.get_metadata_provider(plugin)
+    #
+    metadata_url = plugin_info["objects"]["metadata"]
+    metadata = metadata_provider.get_metadata({"source": metadata_url})
+    #
+    return metadata.get("version", "0.0.0")
+
+
+class RepoVersionCache:  # pylint: disable=R0902
+    """
+        Repo versions of plugins, cached for ttl seconds (error_ttl for failures)
+
+        Expired entries are still served while a background thread refreshes
+        them. Misses are fetched concurrently (up to workers at a time).
+
+        get_resolver() returns repo resolver or raises RepoVersionError
+    """
+
+    def __init__(  # pylint: disable=R0913
+            self, get_resolver, ttl=600, error_ttl=60, refresh_interval=30, workers=8,
+    ):
+        self.get_resolver = get_resolver
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.refresh_interval = refresh_interval
+        self.workers = workers
+        #
+        self.lock = threading.Lock()
+        self.entries = {}  # plugin -> {"version", "error", "expires"}
+        self.stale = set()  # plugins to refresh in background
+        #
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        #
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """ Start refresher thread """
+        self.thread = threading.Thread(
+            target=self._refresher, name="admin-repo-version-refresher", daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        """ Stop refresher thread """
+        self.stop_event.set()
+
+    def _fetch(self, plugin):
+        try:
+            version = fetch_repo_version(self.get_resolver(), plugin)
+            entry = {"version": version, "error": None, "expires": time.time() + self.ttl}
+        except RepoVersionError as exc:
+            entry = {"version": None, "error": str(exc), "expires": time.time() + self.error_ttl}
+        except:  # pylint: disable=W0702
+            log.exception("Failed to get repo version: %s", plugin)
+            entry = {
+                "version": None,
+                "error": "Failed to get plugin metadata",
+                "expires": time.time() + self.error_ttl,
+            }
+        #
+        with self.lock:
+            self.entries[plugin] = entry
+            self.stale.discard(plugin)
+        #
+        return entry
+
+    def _fetch_many(self, plugins):
+        if not plugins:
+            return {}
+        #
+        if len(plugins) == 1:
+            return {plugins[0]: self._fetch(plugins[0])}
+        #
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(plugins))) as pool:
+            return dict(zip(plugins, pool.map(self._fetch, plugins)))
+
+    def get_many(self, plugins, refresh=False):
+        """ plugin -> {"version", "error"} """
+        now = time.time()
+        result = {}
+        missing = []
+        #
+        with self.lock:
+            for plugin in plugins:
+                entry = self.entries.get(plugin, None)
+                #
+                if entry is None or refresh:
+                    self.misses += 1
+                    missing.append(plugin)
+                    continue
+                #
+                self.hits += 1
+                result[plugin] = entry
+                #
+                if entry["expires"] <= now:
+                    self.stale.add(plugin)
+        #
+        result.update(self._fetch_many(missing))
+        #
+        return {
+            plugin: {"version": entry["version"], "error": entry["error"]}
+            for plugin, entry in result.items()
+        }
+
+    def get(self, plugin, refresh=False):
+        """ {"version", "error"} for one plugin """
+        return self.get_many([plugin], refresh=refresh)[plugin]
+
+    def stats(self):
+        """ Cache counters """
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "stale": len(self.stale),
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+            }
+
+    def _refresher(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            now = time.time()
+            #
+            with self.lock:
+                plugins = sorted(
+                    self.stale | {
+                        plugin for plugin, entry in self.entries.items()
+                        if entry["expires"] <= now
+                    }
+                )
+            #
+            if not plugins:
+                continue
+            #
+            try:
+                self._fetch_many(plugins)
+                #
+                with self.lock:
+                    self.refreshes += len(plugins)
+            except:  # pylint: disable=W0702
+                log.exception("Repo version refresh failed")
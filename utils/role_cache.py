@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - project role cache """
+
+import time
+import threading
+from collections import OrderedDict
+
+import flask  # pylint: disable=E0401
+
+
+class RoleMapCache:
+    """
+        Two-level cache of project roles: project_id -> [{"id": ..., "name": ...}, ...]
+
+        Level 1 lives in flask.g and is dropped with the request (app) context.
+        Level 2 is process-wide, bounded (LRU) and expires entries after ttl seconds.
+        Empty results are not cached: a project without roles yet (e.g. not migrated)
+        is read again on next access.
+
+        loader takes a list of project IDs and returns project_id -> roles
+    """
+
+    g_attr = "admin_project_roles"
+
+    def __init__(self, loader, ttl=60, max_size=1024):
+        self.loader = loader
+        self.ttl = ttl
+        self.max_size = max_size
+        #
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # project_id -> (expires_at, roles)
+        #
+        self.request_hits = 0
+        self.process_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _request_local(self):
+        if not flask.has_app_context():
+            return None
+        #
+        if not hasattr(flask.g, self.g_attr):
+            setattr(flask.g, self.g_attr, {})
+        #
+        return getattr(flask.g, self.g_attr)
+
+    def get(self, project_id):
+        """ Get roles for one project """
+        return self.get_many([project_id])[int(project_id)]
+
+    def get_many(self, project_ids):
+        """ Get roles for several projects, loading all misses with one loader call """
+        result = {}
+        missing = []
+        local = self._request_local()
+        now = time.time()
+        #
+        with self.lock:
+            for project_id in {int(item) for item in project_ids}:
+                if local is not None and project_id in local:
+                    self.request_hits += 1
+                    result[project_id] = local[project_id]
+                    continue
+                #
+                entry = self.entries.get(project_id)
+                if entry is not None and entry[0] > now:
+                    self.entries.move_to_end(project_id)
+                    self.process_hits += 1
+                    result[project_id] = entry[1]
+                    continue
+                #
+                self.misses += 1
+                missing.append(project_id)
+        #
+        if missing:
+            loaded = self.loader(missing)
+            expires_at = time.time() + self.ttl
+            #
+            with self.lock:
+                for project_id in missing:
+                    roles = loaded.get(project_id, [])
+                    result[project_id] = roles
+                    #
+                    if not roles:
+                        continue
+                    #
+                    self.entries[project_id] = (expires_at, roles)
+                    self.entries.move_to_end(project_id)
+                #
+                while len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+                    self.evictions += 1
+        #
+        if local is not None:
+            local.update({key: value for key, value in result.items() if value})
+        #
+        return result
+
+    def get_role_map(self, project_id):
+        """ Get role_id -> name map for one project """
+        return {role["id"]: role["name"] for role in self.get(project_id)}
+
+    def invalidate(self, project_id=None):
+        """ Drop one project (or everything) from both levels """
+        local = self._request_local()
+        #
+        with self.lock:
+            self.invalidations += 1
+            #
+            if project_id is None:
+                self.entries.clear()
+                if local is not None:
+                    local.clear()
+                return
+            #
+            self.entries.pop(int(project_id), None)
+            if local is not None:
+                local.pop(int(project_id), None)
+
+    def stats(self):
+        """ Hit/miss counters """
+        with self.lock:
+            return {
+                "request_hits": self.request_hits,
+                "process_hits": self.process_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self.entries),
+                "ttl": self.ttl,
+                "max_size": self.max_size,
+            }
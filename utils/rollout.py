@@ -0,0 +1,303 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - staggered fleet rollouts """
+
+import math
+import time
+import uuid
+import threading
+from collections import OrderedDict
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401
+
+
+def plan_waves(pylon_ids, batch_size=None, batch_percent=None):
+    """ Split pylon_ids into waves of batch_size (or batch_percent of all) pylons """
+    if not pylon_ids:
+        return []
+    #
+    if batch_size is None or batch_size <= 0:
+        percent = min(max(batch_percent or 100, 1), 100)
+        batch_size = math.ceil(len(pylon_ids) * percent / 100)
+    #
+    return [
+        pylon_ids[idx:idx + batch_size]
+        for idx in range(0, len(pylon_ids), batch_size)
+    ]
+
+
+class Rollout:  # pylint: disable=R0902
+    """ Rollout state: events for pylons split into waves """
+
+    def __init__(self, action, events, waves, own_event=None, settings=None):  # pylint: disable=R0913
+        self.id = str(uuid.uuid4())
+        self.action = action
+        self.events = events  # pylon_id -> event data
+        self.own_event = own_event  # fired last, without health gate
+        self.settings = settings or {}
+        #
+        self.status = "pending"
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        #
+        self.waves = [
+            {
+                "pylons": wave,
+                "status": "pending",
+                "started": None,
+                "finished": None,
+                "unhealthy": [],
+            }
+            for wave in waves
+        ]
+        self.current_wave = 0
+        #
+        self.resume_event = threading.Event()
+        self.cancel_event = threading.Event()
+
+    def to_dict(self):
+        """ Progress for API """
+        done = sum(1 for wave in self.waves if wave["status"] == "done")
+        #
+        return {
+            "id": self.id,
+            "action": self.action,
+            "status": self.status,
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+            "settings": self.settings,
+            "current_wave": self.current_wave,
+            "total_waves": len(self.waves),
+            "done_waves": done,
+            "total_pylons": len(self.events) + (1 if self.own_event else 0),
+            "waves": [dict(wave) for wave in self.waves],
+            "own_pylon": self.own_event["pylon_id"] if self.own_event else None,
+        }
+
+
+class RolloutManager:
+    """
+        Fires bootstrap_runtime_update in waves
+
+        After each wave every pylon in it must send a fresh announce (older than
+        settle_time after the wave start) with the expected plugin state before
+        wait_timeout. Otherwise the rollout pauses until resumed or cancelled.
+        Own pylon (if targeted) goes last and is not waited for.
+    """
+
+    def __init__(  # pylint: disable=R0913
+            self, module, settle_time=15, wait_timeout=300,
+            poll_interval=1.0, history_size=50,
+    ):
+        self.module = module
+        self.settle_time = settle_time
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.history_size = history_size
+        #
+        self.lock = threading.Lock()
+        self.rollouts = OrderedDict()  # id -> Rollout
+        self.stop_event = threading.Event()
+
+    def start(self, action, events, own_event=None, batch_size=None, batch_percent=None):  # pylint: disable=R0913
+        """ Create and run rollout, returns it """
+        pylon_ids = [event["pylon_id"] for event in events]
+        #
+        rollout = Rollout(
+            action,
+            {event["pylon_id"]: event for event in events},
+            plan_waves(pylon_ids, batch_size, batch_percent),
+            own_event=own_event,
+            settings={
+                "batch_size": batch_size,
+                "batch_percent": batch_percent,
+                "settle_time": self.settle_time,
+                "wait_timeout": self.wait_timeout,
+            },
+        )
+        #
+        with self.lock:
+            self.rollouts[rollout.id] = rollout
+            #
+            while len(self.rollouts) > self.history_size:
+                oldest_id = next(iter(self.rollouts))
+                if self.rollouts[oldest_id].status in ("running", "paused"):
+                    break
+                self.rollouts.pop(oldest_id)
+        #
+        threading.Thread(
+            target=self._run, args=(rollout,),
+            name=f"admin-rollout-{rollout.id[:8]}", daemon=True,
+        ).start()
+        #
+        return rollout
+
+    def stop(self):
+        """ Stop all rollout threads """
+        self.stop_event.set()
+        #
+        with self.lock:
+            for rollout in self.rollouts.values():
+                rollout.cancel_event.set()
+                rollout.resume_event.set()
+
+    def get(self, rollout_id):
+        """ Get rollout by ID """
+        with self.lock:
+            return self.rollouts.get(rollout_id, None)
+
+    def list(self):
+        """ All known rollouts, newest first """
+        with self.lock:
+            return list(reversed(self.rollouts.values()))
+
+    def resume(self, rollout_id):
+        """ Resume paused rollout """
+        rollout = self.get(rollout_id)
+        #
+        if rollout is None or rollout.status != "paused":
+            return False
+        #
+        rollout.resume_event.set()
+        return True
+
+    def cancel(self, rollout_id):
+        """ Cancel pending, running or paused rollout """
+        rollout = self.get(rollout_id)
+        #
+        if rollout is None or rollout.status not in ("pending", "running", "paused"):
+            return False
+        #
+        rollout.cancel_event.set()
+        rollout.resume_event.set()
+        return True
+
+    #
+    # Rollout thread
+    #
+
+    def _fire(self, event_data):
+        self.module.context.event_manager.fire_event(
+            "bootstrap_runtime_update",
+            event_data,
+        )
+
+    def _is_healthy(self, rollout, pylon_id, wave_started):
+        runtimes = self.module.remote_runtimes
+        data = runtimes.get(pylon_id, None)
+        #
+        if data is None or data.get("timestamp", 0) < wave_started + self.settle_time:
+            return False
+        #
+        plugins = rollout.events[pylon_id].get("plugins", [])
+        #
+        for plugin_name in plugins:
+            if plugin_name.startswith("!"):
+                if runtimes.get_plugin(pylon_id, plugin_name[1:]) is not None:
+                    return False
+            elif runtimes.get_plugin(pylon_id, plugin_name) is None:
+                return False
+        #
+        return True
+
+    def _wait_healthy(self, rollout, wave):
+        pending = set(wave["pylons"])
+        deadline = wave["started"] + self.wait_timeout
+        #
+        while pending and not rollout.cancel_event.is_set():
+            pending = {
+                pylon_id for pylon_id in pending
+                if not self._is_healthy(rollout, pylon_id, wave["started"])
+            }
+            #
+            if not pending or time.time() > deadline:
+                break
+            #
+            rollout.cancel_event.wait(self.poll_interval)
+        #
+        return sorted(pending)
+
+    def _run(self, rollout):  # pylint: disable=R0912
+        rollout.status = "running"
+        #
+        try:
+            while rollout.current_wave < len(rollout.waves):
+                if rollout.cancel_event.is_set():
+                    rollout.status = "cancelled"
+                    break
+                #
+                wave = rollout.waves[rollout.current_wave]
+                wave["status"] = "running"
+                wave["started"] = time.time()
+                wave["unhealthy"] = []
+                #
+                log.info(
+                    "Rollout %s: wave %s/%s -> %s",
+                    rollout.id, rollout.current_wave + 1, len(rollout.waves), wave["pylons"],
+                )
+                #
+                for pylon_id in wave["pylons"]:
+                    self._fire(rollout.events[pylon_id])
+                #
+                unhealthy = self._wait_healthy(rollout, wave)
+                wave["finished"] = time.time()
+                #
+                if rollout.cancel_event.is_set():
+                    wave["status"] = "cancelled"
+                    rollout.status = "cancelled"
+                    break
+                #
+                if unhealthy:
+                    wave["status"] = "failed"
+                    wave["unhealthy"] = unhealthy
+                    #
+                    # Clear before exposing "paused": resume() only works on
+                    # paused rollouts, so a set() can not be lost here
+                    rollout.resume_event.clear()
+                    #
+                    rollout.error = f"No healthy announce from: {', '.join(unhealthy)}"
+                    rollout.status = "paused"
+                    #
+                    log.warning("Rollout %s paused: %s", rollout.id, rollout.error)
+                    #
+                    if not rollout.cancel_event.is_set():
+                        rollout.resume_event.wait()
+                    #
+                    if rollout.cancel_event.is_set():
+                        rollout.status = "cancelled"
+                        break
+                    #
+                    log.info("Rollout %s resumed", rollout.id)
+                    rollout.status = "running"
+                    rollout.error = None
+                #
+                wave["status"] = "done"
+                rollout.current_wave += 1
+            #
+            if rollout.status == "running":
+                if rollout.own_event is not None:
+                    self._fire(rollout.own_event)
+                #
+                rollout.status = "completed"
+        except:  # pylint: disable=W0702
+            log.exception("Rollout %s failed", rollout.id)
+            rollout.status = "failed"
+        #
+        rollout.finished = time.time()
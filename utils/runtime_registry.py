@@ -0,0 +1,529 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - remote runtimes registry """
+
+import json
+import time
+import heapq
+import hashlib
+import threading
+from collections.abc import Mapping
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401
+
+
+PLUGIN_KEYS = ("runtime_info", "removed_plugins", "delta")
+DEFAULT_SECTION = "runtime"
+
+
+def content_hash(obj):
+    """ Stable hash of JSON-like data """
+    return hashlib.sha1(
+        json.dumps(obj, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def plugin_fields(pylon_id, plugin):
+    """ admin_schema fields of plugin: [{"section_id": ..., "key": ..., ...}, ...] """
+    schema = plugin.get("admin_schema") or {}
+    #
+    result = []
+    #
+    for order, (prop_key, prop_def) in enumerate(schema.get("properties", {}).items()):
+        result.append({
+            "section_id": prop_def.get("section", DEFAULT_SECTION),
+            "key": prop_key,
+            "pylon_id": pylon_id,
+            "plugin": plugin["name"],
+            "path": prop_def.get("path", prop_key),
+            "prop_def": prop_def,
+            "order": order,
+        })
+    #
+    return result
+
+
+def normalize_pylon_id(pylon_id):
+    """ Normalized form used for sync_targets pylon prefix matching """
+    return pylon_id.replace("-", "_").replace(" ", "_").lower()
+
+
+class RuntimeRegistry(Mapping):
+    """
+        Remote pylon runtimes: pylon_id -> announce data
+
+        Read access is the same as for a plain dict. Announce data keeps the
+        bootstrap_runtime_info layout, runtime_info is kept sorted by plugin name.
+
+        Plugin entries are stored with a content hash: repeated announces that
+        carry the same data only refresh the timestamp. Delta announces
+        ("delta": True) carry changed plugins in runtime_info and names of
+        dropped plugins in removed_plugins.
+
+        Listeners get pylon_added/pylon_removed and plugin_added/plugin_changed/
+        plugin_removed notifications (called with registry lock held).
+
+        Staleness: announce timestamps are kept in a heap, expire() drops pylons
+        that did not announce for max_age seconds (see RuntimeHousekeeper).
+
+        Indexes:
+        - (pylon_id, plugin_name) -> plugin
+        - section_id -> admin_schema fields
+        - (section_id, prop_key) -> fields with this key on all pylons
+        - sync_targets pylon prefix -> resolved pylon_id
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.version = 0  # any change
+        self.plugins_version = 0  # changes of plugin entries (runtime_info) only
+        self.views = {}  # name -> (plugins_version, data), see cached_view()
+        self.listeners = []  # callables: listener(kind, **data), see _notify()
+        #
+        self.pylons = {}  # pylon_id -> data
+        self.extra_hashes = {}  # pylon_id -> hash of non-plugin data
+        self.plugins = {}  # (pylon_id, plugin_name) -> plugin
+        self.plugin_hashes = {}  # (pylon_id, plugin_name) -> hash
+        self.plugin_fields = {}  # (pylon_id, plugin_name) -> [field, ...]
+        self.sections = {}  # section_id -> {(pylon_id, plugin_name, prop_key): field}
+        self.section_order = {}  # section_id -> sorted [field, ...] (built on demand)
+        self.field_keys = {}  # (section_id, prop_key) -> {(pylon_id, plugin_name), ...}
+        self.pylon_prefixes = {}  # pylon prefix -> pylon_id or None
+        self.expiry_heap = []  # (timestamp, pylon_id), outdated entries skipped on pop
+        #
+        self.announces = 0
+        self.unchanged_announces = 0
+        self.delta_announces = 0
+        self.expired = 0
+
+    #
+    # Mapping
+    #
+
+    def __getitem__(self, pylon_id):
+        return self.pylons[pylon_id]
+
+    def __iter__(self):
+        return iter(list(self.pylons))
+
+    def __len__(self):
+        return len(self.pylons)
+
+    def __contains__(self, pylon_id):
+        return pylon_id in self.pylons
+
+    def pop(self, pylon_id, default=None):
+        """ Same as prune(), kept for dict compatibility """
+        with self.lock:
+            data = self.pylons.get(pylon_id, default)
+            self.prune(pylon_id)
+            return data
+
+    #
+    # Indexes
+    #
+
+    def _index_plugin(self, pylon_id, plugin, plugin_hash):
+        key = (pylon_id, plugin["name"])
+        #
+        self._unindex_plugin(key)
+        #
+        self.plugins[key] = plugin
+        self.plugin_hashes[key] = plugin_hash
+        #
+        fields = plugin_fields(pylon_id, plugin)
+        self.plugin_fields[key] = fields
+        #
+        for field in fields:
+            section_id = field["section_id"]
+            #
+            self.sections.setdefault(section_id, {})[key + (field["key"],)] = field
+            self.section_order.pop(section_id, None)
+            #
+            self.field_keys.setdefault((section_id, field["key"]), set()).add(key)
+
+    def _unindex_plugin(self, key):
+        self.plugins.pop(key, None)
+        self.plugin_hashes.pop(key, None)
+        #
+        for field in self.plugin_fields.pop(key, []):
+            section_id = field["section_id"]
+            self.section_order.pop(section_id, None)
+            #
+            section_fields = self.sections.get(section_id, {})
+            section_fields.pop(key + (field["key"],), None)
+            #
+            if not section_fields:
+                self.sections.pop(section_id, None)
+            #
+            field_key = (section_id, field["key"])
+            field_plugins = self.field_keys.get(field_key, set())
+            field_plugins.discard(key)
+            #
+            if not field_plugins:
+                self.field_keys.pop(field_key, None)
+
+    def _notify(self, kind, **data):
+        for listener in self.listeners:
+            try:
+                listener(kind, **data)
+            except:  # pylint: disable=W0702
+                log.exception("Runtime registry listener failed")
+
+    #
+    # Updates
+    #
+
+    def announce(self, payload, timestamp=None):
+        """ Apply (full or delta) announce, returns True if data changed """
+        pylon_id = payload.get("pylon_id", "")
+        #
+        if not pylon_id:
+            return False
+        #
+        if timestamp is None:
+            timestamp = time.time()
+        #
+        is_delta = bool(payload.get("delta", False))
+        #
+        with self.lock:
+            self.announces += 1
+            #
+            current = self.pylons.get(pylon_id, None)
+            #
+            if is_delta:
+                self.delta_announces += 1
+                #
+                if current is None:  # Need full announce first
+                    return False
+            #
+            # Non-plugin data
+            #
+            extra = {
+                key: value for key, value in payload.items()
+                if key not in PLUGIN_KEYS
+            }
+            #
+            if is_delta:
+                for key, value in current.items():
+                    if key not in PLUGIN_KEYS and key not in ("timestamp", "version"):
+                        extra.setdefault(key, value)
+            #
+            extra_hash = content_hash(extra)
+            extra_changed = self.extra_hashes.get(pylon_id, None) != extra_hash
+            #
+            # Plugin data
+            #
+            old_plugins = {}
+            if current is not None:
+                old_plugins = {plugin["name"]: plugin for plugin in current["runtime_info"]}
+            #
+            incoming = {
+                plugin["name"]: plugin
+                for plugin in payload.get("runtime_info", [])
+                if isinstance(plugin, dict) and "name" in plugin
+            }
+            #
+            if is_delta:
+                new_names = set(old_plugins) | set(incoming)
+                new_names -= set(payload.get("removed_plugins", []))
+            else:
+                new_names = set(incoming)
+            #
+            changed = []
+            new_plugins = {}
+            #
+            for name in new_names:
+                key = (pylon_id, name)
+                #
+                if name not in incoming:
+                    new_plugins[name] = old_plugins[name]
+                    continue
+                #
+                plugin_hash = content_hash(incoming[name])
+                #
+                if name in old_plugins and self.plugin_hashes.get(key, None) == plugin_hash:
+                    new_plugins[name] = old_plugins[name]
+                    continue
+                #
+                new_plugins[name] = incoming[name]
+                self._index_plugin(pylon_id, incoming[name], plugin_hash)
+                changed.append(name)
+            #
+            removed = [name for name in old_plugins if name not in new_names]
+            for name in removed:
+                self._unindex_plugin((pylon_id, name))
+            #
+            heapq.heappush(self.expiry_heap, (timestamp, pylon_id))
+            #
+            if current is not None and not extra_changed and not changed and not removed:
+                self.unchanged_announces += 1
+                current["timestamp"] = timestamp
+                return False
+            #
+            self.version += 1
+            self.extra_hashes[pylon_id] = extra_hash
+            #
+            if changed or removed:
+                self.plugins_version += 1
+            #
+            data = extra
+            data["runtime_info"] = [
+                new_plugins[name] for name in sorted(new_plugins)
+            ]
+            data["timestamp"] = timestamp
+            data["version"] = self.version
+            #
+            if current is None:
+                self.pylon_prefixes.clear()
+            #
+            self.pylons[pylon_id] = data
+            #
+            if current is None:
+                self._notify(
+                    "pylon_added",
+                    pylon_id=pylon_id,
+                    plugins=sorted(new_plugins),
+                    versions={
+                        name: plugin.get("local_version", None)
+                        for name, plugin in new_plugins.items()
+                    },
+                )
+            else:
+                for name in changed:
+                    self._notify(
+                        "plugin_changed" if name in old_plugins else "plugin_added",
+                        pylon_id=pylon_id,
+                        name=name,
+                        local_version=new_plugins[name].get("local_version", None),
+                    )
+                #
+                for name in removed:
+                    self._notify("plugin_removed", pylon_id=pylon_id, name=name)
+            #
+            return True
+
+    def update_plugin(self, pylon_id, plugin_name, **fields):
+        """ Update fields of known plugin entry (e.g. after config change) """
+        with self.lock:
+            key = (pylon_id, plugin_name)
+            data = self.pylons.get(pylon_id, None)
+            #
+            if data is None or key not in self.plugins:
+                return False
+            #
+            plugin = self.plugins[key].copy()
+            plugin.update(fields)
+            #
+            self._index_plugin(pylon_id, plugin, content_hash(plugin))
+            self.version += 1
+            self.plugins_version += 1
+            #
+            data = data.copy()
+            data["runtime_info"] = [
+                plugin if item["name"] == plugin_name else item
+                for item in data["runtime_info"]
+            ]
+            data["version"] = self.version
+            #
+            self.pylons[pylon_id] = data
+            return True
+
+    def prune(self, pylon_id):
+        """ Remove pylon and its plugins """
+        with self.lock:
+            data = self.pylons.pop(pylon_id, None)
+            #
+            if data is None:
+                return False
+            #
+            self.extra_hashes.pop(pylon_id, None)
+            self.pylon_prefixes.clear()
+            #
+            for plugin in data["runtime_info"]:
+                self._unindex_plugin((pylon_id, plugin["name"]))
+            #
+            self.version += 1
+            #
+            if data["runtime_info"]:
+                self.plugins_version += 1
+            #
+            self._notify("pylon_removed", pylon_id=pylon_id)
+            return True
+
+    #
+    # Queries
+    #
+
+    def snapshot(self):
+        """ Consistent [(pylon_id, data), ...] sorted by pylon_id """
+        with self.lock:
+            return sorted(self.pylons.items())
+
+    def get_plugin(self, pylon_id, plugin_name, default=None):
+        """ Get plugin entry by (pylon_id, plugin_name) """
+        return self.plugins.get((pylon_id, plugin_name), default)
+
+    def section_fields(self, section_id):
+        """ admin_schema fields in section, ordered by pylon, plugin and schema """
+        with self.lock:
+            if section_id not in self.section_order:
+                self.section_order[section_id] = sorted(
+                    self.sections.get(section_id, {}).values(),
+                    key=lambda item: (item["pylon_id"], item["plugin"], item["order"]),
+                )
+            #
+            return list(self.section_order[section_id])
+
+    def key_fields(self, section_id, prop_key):
+        """ Fields with prop_key in section across all pylons """
+        with self.lock:
+            return [
+                self.sections[section_id][key + (prop_key,)]
+                for key in sorted(self.field_keys.get((section_id, prop_key), set()))
+            ]
+
+    def section_ids(self):
+        """ Known section IDs """
+        with self.lock:
+            return list(self.sections)
+
+    def resolve_pylon_prefix(self, pylon_prefix):
+        """ Find first pylon_id that contains the given (normalized) prefix """
+        with self.lock:
+            if pylon_prefix not in self.pylon_prefixes:
+                normalized_prefix = normalize_pylon_id(pylon_prefix)
+                #
+                self.pylon_prefixes[pylon_prefix] = next(
+                    (
+                        pylon_id for pylon_id in self.pylons
+                        if normalized_prefix in normalize_pylon_id(pylon_id)
+                    ),
+                    None,
+                )
+            #
+            return self.pylon_prefixes[pylon_prefix]
+
+    def plugins_digest(self):
+        """ Hash of all plugin entries: same plugins on any pylon/process -> same digest """
+        with self.lock:
+            return content_hash(sorted(
+                [pylon_id, plugin_name, plugin_hash]
+                for (pylon_id, plugin_name), plugin_hash in self.plugin_hashes.items()
+            ))
+
+    def cached_view(self, name, builder):
+        """ builder(registry) result, rebuilt only when plugin entries change """
+        with self.lock:
+            entry = self.views.get(name, None)
+            #
+            if entry is None or entry[0] != self.plugins_version:
+                entry = (self.plugins_version, builder(self))
+                self.views[name] = entry
+            #
+            return entry
+
+    def expire(self, max_age, now=None):
+        """ Prune pylons without announces for max_age seconds: [(pylon_id, last_seen)] """
+        if now is None:
+            now = time.time()
+        #
+        result = []
+        #
+        with self.lock:
+            while self.expiry_heap and now - self.expiry_heap[0][0] > max_age:
+                timestamp, pylon_id = heapq.heappop(self.expiry_heap)
+                data = self.pylons.get(pylon_id, None)
+                #
+                if data is None or data["timestamp"] != timestamp:
+                    continue  # Pruned or announced again later
+                #
+                self.prune(pylon_id)
+                self.expired += 1
+                result.append((pylon_id, timestamp))
+        #
+        return result
+
+    def next_expiry(self, max_age):
+        """ Earliest time expire() may have something to do, None if empty """
+        with self.lock:
+            if not self.expiry_heap:
+                return None
+            #
+            return self.expiry_heap[0][0] + max_age
+
+    def stats(self):
+        """ Registry counters """
+        with self.lock:
+            return {
+                "version": self.version,
+                "plugins_version": self.plugins_version,
+                "pylons": len(self.pylons),
+                "plugins": len(self.plugins),
+                "sections": len(self.sections),
+                "fields": sum(len(fields) for fields in self.plugin_fields.values()),
+                "announces": self.announces,
+                "unchanged_announces": self.unchanged_announces,
+                "delta_announces": self.delta_announces,
+                "expired": self.expired,
+            }
+
+
+class RuntimeHousekeeper:
+    """ Background thread: expires stale pylons from RuntimeRegistry """
+
+    def __init__(self, registry, on_expired=None, timeout=60, interval=5):
+        self.registry = registry
+        self.on_expired = on_expired
+        self.timeout = timeout
+        self.interval = interval
+        #
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """ Start housekeeping thread """
+        self.thread = threading.Thread(
+            target=self._run, name="admin-runtime-housekeeper", daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        """ Stop housekeeping thread """
+        self.stop_event.set()
+
+    def _delay(self):
+        next_expiry = self.registry.next_expiry(self.timeout)
+        #
+        if next_expiry is None:
+            return self.interval
+        #
+        return min(self.interval, max(next_expiry - time.time(), 0.1))
+
+    def _run(self):
+        while not self.stop_event.wait(self._delay()):
+            for pylon_id, last_seen in self.registry.expire(self.timeout):
+                log.info("Remote runtime expired: %s", pylon_id)
+                #
+                if self.on_expired is None:
+                    continue
+                #
+                try:
+                    self.on_expired(pylon_id, last_seen)
+                except:  # pylint: disable=W0702
+                    log.exception("Expired runtime callback failed: %s", pylon_id)
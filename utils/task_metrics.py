@@ -0,0 +1,202 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2026 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+""" Utils - admin task instrumentation """
+
+import queue
+import threading
+import collections
+
+from pylon.core.tools import log  # pylint: disable=E0611,E0401
+
+
+class AdminTaskRecorder:
+    """
+        Lock-free admin task instrumentation
+
+        Task threads only put_nowait() finished-task records on a SimpleQueue.
+        A single exporter thread owns all state: per-task ring buffers, counters
+        and (optionally) OpenTelemetry span export, so task threads never wait on
+        tracing or on readers. Readers take snapshots of the ring buffers.
+    """
+
+    def __init__(self, ring_size=100, param_max_length=256, tracing=False):
+        self.ring_size = ring_size
+        self.param_max_length = param_max_length
+        self.tracing = tracing
+        #
+        self.records = queue.SimpleQueue()
+        self.history = {}  # task_name -> deque of records
+        self.counters = collections.Counter()  # (task_name, status) -> runs
+        self.duration_sums = collections.Counter()  # task_name -> seconds
+        self.exported_spans = 0
+        self.export_errors = 0
+        #
+        self.tracer = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """ Start exporter thread """
+        self.thread = threading.Thread(
+            target=self._exporter, name="admin-task-recorder", daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        """ Stop exporter thread """
+        self.stop_event.set()
+        self.records.put_nowait(None)
+
+    def record(  # pylint: disable=R0913
+            self, task_name, task_id, user_id, params, status, start_ts, end_ts, error=None,
+    ):
+        """ Called from task threads: never blocks """
+        params_repr = repr(params)
+        if len(params_repr) > self.param_max_length:
+            params_repr = params_repr[:self.param_max_length] + "..."
+        #
+        self.records.put_nowait({
+            "task_name": task_name,
+            "task_id": task_id,
+            "user_id": user_id,
+            "params": params_repr,
+            "status": status,
+            "error": error,
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "duration": end_ts - start_ts,
+        })
+
+    def _exporter(self):
+        while not self.stop_event.is_set():
+            item = self.records.get()
+            if item is None:
+                continue
+            #
+            task_name = item["task_name"]
+            #
+            if task_name not in self.history:
+                self.history[task_name] = collections.deque(maxlen=self.ring_size)
+            #
+            self.history[task_name].append(item)
+            self.counters[(task_name, item["status"])] += 1
+            self.duration_sums[task_name] += item["duration"]
+            #
+            if self.tracing:
+                self._export_span(item)
+
+    def _get_tracer(self):
+        if self.tracer is None:
+            from opentelemetry import trace  # pylint: disable=C0415,E0401
+            self.tracer = trace.get_tracer("admin.tasks")
+        return self.tracer
+
+    def _export_span(self, item):
+        try:
+            from opentelemetry.trace import SpanKind, Status, StatusCode  # pylint: disable=C0415,E0401
+            #
+            attributes = {
+                "telemetry.data_type": "admin_task_execution",
+                "task.name": item["task_name"] or "unknown",
+                "task.id": item["task_id"] or "",
+                "task.duration_ms": item["duration"] * 1000,
+            }
+            if item["user_id"] is not None:
+                attributes["user.id"] = str(item["user_id"])
+            #
+            span = self._get_tracer().start_span(
+                f"Admin Task: {item['task_name']}",
+                kind=SpanKind.INTERNAL,
+                attributes=attributes,
+                start_time=int(item["start_ts"] * 1e9),
+            )
+            #
+            if item["status"] == "ok":
+                span.set_status(Status(StatusCode.OK))
+            else:
+                span.set_status(Status(StatusCode.ERROR, item["error"] or ""))
+            #
+            span.end(end_time=int(item["end_ts"] * 1e9))
+            self.exported_spans += 1
+        except:  # pylint: disable=W0702
+            self.export_errors += 1
+            if self.export_errors == 1:
+                log.exception("Admin task span export failed")
+
+    def snapshot(self, task_name=None, limit=None):
+        """ Recent runs per task name """
+        result = {}
+        #
+        for name in list(self.history):
+            if task_name is not None and name != task_name:
+                continue
+            #
+            runs = list(self.history[name])
+            if limit is not None:
+                runs = runs[-limit:]
+            #
+            durations = sorted(run["duration"] for run in runs)
+            result[name] = {
+                "runs": runs,
+                "recent_count": len(runs),
+                "recent_avg": sum(durations) / len(durations) if durations else None,
+                "recent_p95": durations[min(int(len(durations) * 0.95), len(durations) - 1)] \
+                    if durations else None,
+                "recent_max": durations[-1] if durations else None,
+            }
+        #
+        return result
+
+    def prometheus(self):
+        """ Metrics in Prometheus text exposition format """
+        lines = [
+            "# HELP admin_task_runs_total Finished admin task runs",
+            "# TYPE admin_task_runs_total counter",
+        ]
+        for (task_name, status), value in sorted(self.counters.copy().items()):
+            lines.append(f'admin_task_runs_total{{task="{task_name}",status="{status}"}} {value}')
+        #
+        lines.extend([
+            "# HELP admin_task_duration_seconds_sum Total admin task run time",
+            "# TYPE admin_task_duration_seconds_sum counter",
+        ])
+        for task_name, value in sorted(self.duration_sums.copy().items()):
+            lines.append(f'admin_task_duration_seconds_sum{{task="{task_name}"}} {value:.6f}')
+        #
+        lines.extend([
+            "# HELP admin_task_last_duration_seconds Duration of the most recent run",
+            "# TYPE admin_task_last_duration_seconds gauge",
+        ])
+        for task_name in sorted(self.history):
+            runs = list(self.history[task_name])
+            if runs:
+                lines.append(
+                    f'admin_task_last_duration_seconds{{task="{task_name}"}} {runs[-1]["duration"]:.6f}'
+                )
+        #
+        lines.extend([
+            "# HELP admin_task_spans_exported_total Spans exported by the recorder thread",
+            "# TYPE admin_task_spans_exported_total counter",
+            f"admin_task_spans_exported_total {self.exported_spans}",
+            "# HELP admin_task_recorder_backlog Records waiting for the recorder thread",
+            "# TYPE admin_task_recorder_backlog gauge",
+            f"admin_task_recorder_backlog {self.records.qsize()}",
+            "",
+        ])
+        #
+        return "\n".join(lines)